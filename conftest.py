@@ -2,6 +2,11 @@
 
 import pytest
 
+try:
+    import uvloop
+except ImportError:  # Optional; not available on Windows
+    uvloop = None
+
 
 def pytest_addoption(parser):
     """Add custom command line options."""
@@ -11,6 +16,31 @@ def pytest_addoption(parser):
         default=False,
         help="Run real LLM integration tests (expensive, requires VPN)"
     )
+    parser.addoption(
+        "--record-mode",
+        action="store",
+        default="none",
+        choices=["none", "new_episodes", "all"],
+        help="LLM cassette mode for @pytest.mark.vcr tests: replay only (none), "
+             "record missing calls (new_episodes) or re-record everything (all)"
+    )
+    parser.addoption(
+        "--uvloop",
+        action="store_true",
+        default=False,
+        help="Run async tests on the uvloop event loop (requires uvloop)"
+    )
+
+
+class LoopFactory:
+    """pytest-asyncio plugin that runs every async test on a custom loop."""
+    
+    def __init__(self, name, new_event_loop):
+        self.name = name
+        self.new_event_loop = new_event_loop
+    
+    def pytest_asyncio_loop_factories(self, config, item):
+        return {self.name: self.new_event_loop}
 
 
 def pytest_configure(config):
@@ -18,12 +48,23 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "real_llm: mark test as requiring real LLM access"
     )
+    
+    if config.getoption("--uvloop"):
+        if uvloop is None:
+            raise pytest.UsageError("--uvloop requires the uvloop package")
+        config.pluginmanager.register(
+            LoopFactory("uvloop", uvloop.new_event_loop), "loop-factory"
+        )
 
 
 def pytest_collection_modifyitems(config, items):
-    """Skip real LLM tests unless --real-llm flag is provided."""
+    """Skip real LLM tests unless --real-llm flag is provided.
+
+    Tests marked with ``vcr`` are left to the cassette fixture, which replays
+    recorded responses offline and only skips when no cassette exists.
+    """
     if not config.getoption("--real-llm"):
         skip_real = pytest.mark.skip(reason="need --real-llm option to run")
         for item in items:
-            if "real_llm" in item.keywords:
+            if "real_llm" in item.keywords and "vcr" not in item.keywords:
                 item.add_marker(skip_real)
\ No newline at end of file
@@ -9,7 +9,7 @@ import asyncio
 import logging
 import random
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Sequence, Union
 from uuid import uuid4
 
 from src.core.models import (
@@ -38,6 +38,36 @@ from src.utils.context_optimization_runtime import AgentContextMetrics
 logger = logging.getLogger(__name__)
 
 
+def build_prompt(
+    goal: str,
+    constraints: Sequence[str],
+    generation_method: str,
+    focus_area: Optional[str] = None
+) -> Dict[str, Any]:
+    """Assemble the GenerateHypothesis inputs for a goal and method.
+    
+    Pure, so the same goal sent to several models gets an identical prompt
+    and keeps the rendered prefix stable for prompt caching. Each call
+    returns new lists, which the caller owns.
+    
+    Args:
+        goal: Research goal description
+        constraints: Research goal constraints
+        generation_method: Generation strategy name passed to BAML
+        focus_area: Method-specific context for the prompt
+        
+    Returns:
+        Keyword arguments for BAMLWrapper.generate_hypothesis
+    """
+    return {
+        'goal': goal,
+        'constraints': list(constraints),
+        'existing_hypotheses': [],  # TODO: Get from context memory
+        'focus_area': focus_area,
+        'generation_method': generation_method,
+    }
+
+
 class GenerationAgent:
     """Agent responsible for generating novel scientific hypotheses.
     
@@ -87,9 +117,7 @@ class GenerationAgent:
         
         # State tracking
         self._generation_count = 0
-        self._strategy_success_rates = {
-            strategy: 0.5 for strategy in self.generation_strategies
-        }
+        self._strategy_success_rates = dict.fromkeys(self.generation_strategies, 0.5)
         
         # Web search integration (to be injected or configured)
         self.web_search = None
@@ -128,7 +156,8 @@ class GenerationAgent:
         research_goal: ResearchGoal,
         generation_method: str,
         focus_area: Optional[str] = None,
-        existing_hypotheses: Optional[List[Hypothesis]] = None
+        existing_hypotheses: Optional[List[Hypothesis]] = None,
+        model: Optional[str] = None
     ) -> Hypothesis:
         """Generate a new hypothesis using the specified method.
         
@@ -137,6 +166,7 @@ class GenerationAgent:
             generation_method: Strategy to use for generation
             focus_area: Optional specific area to focus on
             existing_hypotheses: Previous hypotheses to avoid duplication
+            model: Optional model ID to route this generation to
             
         Returns:
             Generated hypothesis
@@ -154,23 +184,23 @@ class GenerationAgent:
         if generation_method == 'literature_based':
             # Mock literature for now - would integrate with web search
             literature = await self._search_literature(research_goal)
-            return await self.generate_from_literature(research_goal, literature)
+            return await self.generate_from_literature(research_goal, literature, model=model)
         
         elif generation_method == 'debate':
             # For real LLM usage, we'll let the LLM simulate the debate internally
             # by providing instructions in the context rather than mock turns
             debate_turns = []  # Empty turns will trigger internal debate simulation
-            return await self.generate_from_debate(research_goal, debate_turns)
+            return await self.generate_from_debate(research_goal, debate_turns, model=model)
         
         elif generation_method == 'assumptions':
             # For real LLM usage, we'll let the LLM identify assumptions internally
             assumptions = []  # Empty assumptions will trigger internal generation
-            return await self.generate_from_assumptions(research_goal, assumptions)
+            return await self.generate_from_assumptions(research_goal, assumptions, model=model)
         
         elif generation_method == 'expansion':
             # For real LLM usage, we'll provide general expansion guidance
             feedback = {}  # Empty feedback will trigger expansion guidance
-            return await self.generate_from_feedback(research_goal, feedback)
+            return await self.generate_from_feedback(research_goal, feedback, model=model)
         
         else:
             raise ValueError(f"Unimplemented generation method: {generation_method}")
@@ -178,13 +208,15 @@ class GenerationAgent:
     async def generate_from_literature(
         self,
         research_goal: ResearchGoal,
-        literature: Union[List[Paper], List[Dict[str, Any]]]
+        literature: Union[List[Paper], List[Dict[str, Any]]],
+        model: Optional[str] = None
     ) -> Hypothesis:
         """Generate hypothesis based on literature exploration.
 
         Args:
             research_goal: Research goal to address
             literature: Relevant literature papers (Paper objects or dictionaries)
+            model: Optional model ID to route this generation to
 
         Returns:
             Generated hypothesis grounded in literature
@@ -234,11 +266,13 @@ class GenerationAgent:
         # Call BAML function to generate hypothesis
         try:
             baml_hypothesis = await self.baml_wrapper.generate_hypothesis(
-                goal=research_goal.description,
-                constraints=research_goal.constraints,
-                existing_hypotheses=[],  # Convert existing if needed
-                focus_area=literature_context.get('focus_area'),
-                generation_method='literature_based'
+                **build_prompt(
+                    research_goal.description,
+                    research_goal.constraints,
+                    'literature_based',
+                    literature_context.get('focus_area')
+                ),
+                model=model
             )
 
             # Convert BAML hypothesis to our model
@@ -267,11 +301,13 @@ class GenerationAgent:
                     # Fallback to full literature context
                     literature_context = self._prepare_literature_context_from_papers(literature)
                     baml_hypothesis = await self.baml_wrapper.generate_hypothesis(
-                        goal=research_goal.description,
-                        constraints=research_goal.constraints,
-                        existing_hypotheses=[],
-                        focus_area=literature_context.get('focus_area'),
-                        generation_method='literature_based'
+                        **build_prompt(
+                            research_goal.description,
+                            research_goal.constraints,
+                            'literature_based',
+                            literature_context.get('focus_area')
+                        ),
+                        model=model
                     )
                     hypothesis = self._convert_baml_hypothesis(baml_hypothesis)
                     hypothesis.supporting_evidence = self._extract_citations_from_papers(literature)
@@ -300,7 +336,8 @@ class GenerationAgent:
         self,
         research_goal: ResearchGoal,
         debate_turns: List[Dict[str, str]],
-        num_perspectives: int = 3
+        num_perspectives: int = 3,
+        model: Optional[str] = None
     ) -> Hypothesis:
         """Generate hypothesis through simulated scientific debate.
         
@@ -308,6 +345,7 @@ class GenerationAgent:
             research_goal: Research goal to address
             debate_turns: Simulated debate perspectives
             num_perspectives: Number of perspectives to consider
+            model: Optional model ID to route this generation to
             
         Returns:
             Hypothesis synthesized from debate
@@ -318,11 +356,13 @@ class GenerationAgent:
         # Call BAML function to generate hypothesis
         try:
             baml_hypothesis = await self.baml_wrapper.generate_hypothesis(
-                goal=research_goal.description,
-                constraints=research_goal.constraints,
-                existing_hypotheses=[],  # TODO: Get from context memory
-                focus_area=debate_context,
-                generation_method='debate'
+                **build_prompt(
+                    research_goal.description,
+                    research_goal.constraints,
+                    'debate',
+                    debate_context
+                ),
+                model=model
             )
             
             # Convert BAML hypothesis to our model
@@ -360,13 +400,15 @@ class GenerationAgent:
     async def generate_from_assumptions(
         self,
         research_goal: ResearchGoal,
-        assumptions: List[str]
+        assumptions: List[str],
+        model: Optional[str] = None
     ) -> Hypothesis:
         """Generate hypothesis by aggregating testable assumptions.
         
         Args:
             research_goal: Research goal
             assumptions: List of testable assumptions
+            model: Optional model ID to route this generation to
             
         Returns:
             Hypothesis built from assumptions
@@ -383,11 +425,13 @@ class GenerationAgent:
         # Call BAML function to generate hypothesis
         try:
             baml_hypothesis = await self.baml_wrapper.generate_hypothesis(
-                goal=research_goal.description,
-                constraints=research_goal.constraints,
-                existing_hypotheses=[],  # TODO: Get from context memory
-                focus_area=assumptions_context,
-                generation_method='assumptions'
+                **build_prompt(
+                    research_goal.description,
+                    research_goal.constraints,
+                    'assumptions',
+                    assumptions_context
+                ),
+                model=model
             )
             
             # Convert BAML hypothesis to our model
@@ -415,13 +459,15 @@ class GenerationAgent:
     async def generate_from_feedback(
         self,
         research_goal: ResearchGoal,
-        feedback: Dict[str, Any]
+        feedback: Dict[str, Any],
+        model: Optional[str] = None
     ) -> Hypothesis:
         """Generate hypothesis based on meta-review feedback.
         
         Args:
             research_goal: Research goal
             feedback: Feedback from meta-review agent
+            model: Optional model ID to route this generation to
             
         Returns:
             Hypothesis addressing feedback
@@ -448,11 +494,13 @@ class GenerationAgent:
         # Call BAML function to generate hypothesis
         try:
             baml_hypothesis = await self.baml_wrapper.generate_hypothesis(
-                goal=research_goal.description,
-                constraints=research_goal.constraints,
-                existing_hypotheses=[],  # TODO: Get from context memory
-                focus_area=feedback_context,
-                generation_method='expansion'  # Feedback-based is a form of expansion
+                **build_prompt(
+                    research_goal.description,
+                    research_goal.constraints,
+                    'expansion',  # Feedback-based is a form of expansion
+                    feedback_context
+                ),
+                model=model
             )
             
             # Convert BAML hypothesis to our model
@@ -660,11 +708,11 @@ class GenerationAgent:
         if hasattr(baml_hyp, 'experimental_protocol') and baml_hyp.experimental_protocol:
             exp_proto = baml_hyp.experimental_protocol
             
-            # Handle field name variations from LLM responses
-            success_metrics = getattr(exp_proto, 'success_metrics', 
-                                    getattr(exp_proto, 'expected_outcomes', []))
-            potential_challenges = getattr(exp_proto, 'potential_challenges', [])
-            safety_considerations = getattr(exp_proto, 'safety_considerations', [])
+            # BAML parses against the ExperimentalProtocol schema rendered into
+            # the prompt, so fields arrive under their schema names
+            success_metrics = exp_proto.success_metrics
+            potential_challenges = exp_proto.potential_challenges
+            safety_considerations = exp_proto.safety_considerations
             
             # Ensure we have at least one item for required lists
             if not success_metrics:
@@ -741,39 +789,18 @@ class GenerationAgent:
         # Get existing hypotheses
         existing = await self.context_memory.get('hypotheses') or []
         
-        # Convert hypothesis to serializable dict
-        hypothesis_dict = {
-            'id': str(hypothesis.id),
-            'summary': hypothesis.summary,
-            'full_description': hypothesis.full_description,
-            'category': hypothesis.category.value,
-            'assumptions': hypothesis.assumptions,
-            'novelty_claim': hypothesis.novelty_claim,
-            'supporting_evidence': hypothesis.supporting_evidence,
-            'generation_method': hypothesis.generation_method,
-            'confidence_score': hypothesis.confidence_score,
-            'experimental_protocol': {
-                'objective': hypothesis.experimental_protocol.objective,
-                'methodology': hypothesis.experimental_protocol.methodology,
-                'success_metrics': hypothesis.experimental_protocol.success_metrics,
-                'required_resources': hypothesis.experimental_protocol.required_resources,
-                'timeline': hypothesis.experimental_protocol.timeline,
-                'potential_challenges': hypothesis.experimental_protocol.potential_challenges,
-                'safety_considerations': hypothesis.experimental_protocol.safety_considerations
-            },
-            'created_at': hypothesis.created_at.isoformat(),
-            'elo_rating': hypothesis.elo_rating,
-            'review_count': hypothesis.review_count,
-            'evolution_count': hypothesis.evolution_count
-        }
+        # Serialize once in JSON mode; unset optional fields are dropped
+        hypothesis_dict = hypothesis.model_dump(mode='json', exclude_none=True)
         
         existing.append(hypothesis_dict)
         
         # Store updated list
         await self.context_memory.set('hypotheses', existing)
         
-        # Update generation statistics
-        stats = await self.context_memory.get('generation_statistics') or {}
+        # Update generation statistics; the counters live in context memory,
+        # which serves repeat reads from its cache, so agents sharing it and
+        # clear()/restore() always see the current counts
+        stats = dict(await self.context_memory.get('generation_statistics') or {})
         stats['total_generated'] = stats.get('total_generated', 0) + 1
         stats[f'{hypothesis.generation_method}_count'] = \
             stats.get(f'{hypothesis.generation_method}_count', 0) + 1
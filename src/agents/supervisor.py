@@ -89,9 +89,7 @@ class SupervisorAgent:
         self.termination_probability = 0.0
         self.resource_consumed = 0.0
         self.active_allocations: Dict[str, ResourceAllocation] = {}
-        self.agent_effectiveness: Dict[str, float] = {
-            agent: 0.5 for agent in self.agent_weights
-        }
+        self.agent_effectiveness: Dict[str, float] = dict.fromkeys(self.agent_weights, 0.5)
         
         # Performance tracking
         self._start_time = None
@@ -271,12 +269,15 @@ class SupervisorAgent:
             Dictionary of system metrics
         """
         # Get task queue statistics
-        queue_stats = await self.task_queue.get_queue_statistics()
+        queue_stats = self.task_queue.get_queue_statistics()
         
-        # Get hypothesis and review counts
-        hypotheses = await self.context_memory.get('hypotheses') or []
-        reviews = await self.context_memory.get('reviews') or []
-        tournament_data = await self.context_memory.get('tournament_results') or {}
+        # Get hypothesis and review counts in a single memory read
+        snapshot = await self.context_memory.batch_get(
+            ['hypotheses', 'reviews', 'tournament_results']
+        )
+        hypotheses = snapshot.get('hypotheses') or []
+        reviews = snapshot.get('reviews') or []
+        tournament_data = snapshot.get('tournament_results') or {}
         
         # Calculate metrics
         # Extract task counts from queue stats
@@ -1,11 +1,13 @@
 """Core data models for AI Co-Scientist."""
 
+import os
+import random
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator, field_serializer
 
 
 def utcnow() -> datetime:
@@ -13,6 +15,17 @@ def utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+# Seeded once from os.urandom (and again in forked children) so task IDs
+# don't cost a urandom syscall each, as uuid4() does
+_task_id_rng = random.Random(os.urandom(32))
+os.register_at_fork(after_in_child=lambda: _task_id_rng.seed(os.urandom(32)))
+
+
+def _fast_uuid4() -> UUID:
+    """Generate a random version 4 UUID without a syscall per call."""
+    return UUID(int=_task_id_rng.getrandbits(128), version=4)
+
+
 class TaskState(str, Enum):
     """Task execution states."""
     
@@ -37,7 +50,7 @@ class TaskType(str, Enum):
 class Task(BaseModel):
     """Task model for the queue system."""
     
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=_fast_uuid4)
     task_type: TaskType
     priority: int = Field(gt=0, description="Priority must be positive, higher = more important")
     state: TaskState = Field(default=TaskState.PENDING)
@@ -63,6 +76,20 @@ class Task(BaseModel):
             raise ValueError("Priority must be positive")
         return v
     
+    # (id, str(id)) pair; keyed on the UUID so a replaced id (assignment,
+    # model_copy update) is recomputed
+    _id_str: Optional[Tuple[UUID, str]] = PrivateAttr(default=None)
+    
+    @property
+    def id_str(self) -> str:
+        """String form of the task ID, computed once per ID for use as a queue key."""
+        task_id = self.id
+        cached = self._id_str
+        if cached is None or cached[0] is not task_id:
+            cached = (task_id, str(task_id))
+            self._id_str = cached
+        return cached[1]
+    
     def assign(self, worker_id: str) -> None:
         """Assign task to a worker.
         
@@ -223,6 +250,20 @@ class Hypothesis(BaseModel):
             raise ValueError("Assumptions list cannot be empty")
         return v
     
+    # (full_description, lowercased) pair; keyed on the source string so a
+    # replaced full_description (assignment, model_copy update) is recomputed
+    _description_lower: Optional[Tuple[str, str]] = PrivateAttr(default=None)
+    
+    @property
+    def description_lower(self) -> str:
+        """Lowercased full description, computed once per description for keyword matching."""
+        source = self.full_description
+        cached = self._description_lower
+        if cached is None or cached[0] is not source:
+            cached = (source, source.lower())
+            self._description_lower = cached
+        return cached[1]
+    
     def create_summary(self) -> HypothesisSummary:
         """Create a human-readable summary of this hypothesis."""
         return HypothesisSummary(
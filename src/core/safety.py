@@ -1,12 +1,26 @@
 """Safety framework models and utilities for AI Co-Scientist."""
 
 import asyncio
+import bisect
+import hashlib
 import json
+import logging
+import logging.handlers
+import os
+import queue
+import tarfile
+import uuid
+import weakref
+from collections import Counter, OrderedDict
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import orjson
+
+logger = logging.getLogger(__name__)
 
 
 class SafetyLevel(str, Enum):
@@ -217,9 +231,42 @@ class PatternReport:
     generated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+# Same layout as json.dump(..., indent=2), with non-string keys stringified;
+# UUIDs, datetimes and dataclasses in metadata are encoded natively
+_ORJSON_LOG_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+class _LogEntryFileHandler(logging.Handler):
+    """Writes queued safety log entries to their JSON files."""
+    
+    def __init__(self) -> None:
+        super().__init__()
+        # Entries that could not be written; read from other threads
+        self.failed_writes = 0
+    
+    def handleError(self, record: logging.LogRecord) -> None:
+        """Count and report a failed write instead of printing to stderr."""
+        self.failed_writes += 1
+        logger.error(f"Failed to write safety log entry {record.filepath}", exc_info=True)
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write one encoded entry, carried as record.data, to record.filepath."""
+        try:
+            with open(record.filepath, 'wb') as f:
+                f.write(record.data)
+        except Exception:
+            self.handleError(record)
+
+
 class SafetyLogger:
     """Lightweight safety monitoring system."""
     
+    # Bound on entries waiting for the writer thread; when full, entries are
+    # written from a worker thread instead of blocking the event loop
+    WRITE_QUEUE_SIZE = 8192
+    # Parsed log files kept for audit and report queries, least recent evicted
+    ENTRY_CACHE_SIZE = 4096
+    
     def __init__(self, config: SafetyConfig):
         """Initialize the safety logger with configuration.
         
@@ -235,6 +282,66 @@ class SafetyLogger:
         # Create log directory if enabled
         if self.enabled and not self.log_directory.exists():
             self.log_directory.mkdir(parents=True, exist_ok=True)
+        
+        # Entries are written by a background thread, started on first use
+        self._write_queue: Optional[queue.Queue] = None
+        self._writer: Optional[logging.handlers.QueueListener] = None
+        self._writer_finalizer: Optional[weakref.finalize] = None
+        self._file_handler = _LogEntryFileHandler()
+        # Set while aclose() drains the queue; entries queued then would be lost
+        self._closing = False
+        self._overflow_writes = 0
+        
+        # Log file name -> ((mtime_ns, size), parsed entry), validated
+        # against the file's current stat before reuse
+        self._entry_cache: "OrderedDict[str, Tuple[Tuple[int, int], Dict]]" = OrderedDict()
+    
+    def _start_writer(self) -> None:
+        """Start the thread that writes queued entries to disk."""
+        self._write_queue = queue.Queue(maxsize=self.WRITE_QUEUE_SIZE)
+        self._writer = logging.handlers.QueueListener(
+            self._write_queue, self._file_handler
+        )
+        self._writer.start()
+        # Entries still queued when the logger is collected or the interpreter
+        # exits get written; the finalizer holds the listener, not the logger
+        self._writer_finalizer = weakref.finalize(self, self._writer.stop)
+    
+    def _stop_writer(self) -> None:
+        """Write all queued entries and stop the writer thread."""
+        if self._writer is not None:
+            self._writer_finalizer()
+            self._writer_finalizer = None
+            self._writer = None
+            self._write_queue = None
+    
+    @property
+    def failed_writes(self) -> int:
+        """Number of log entries the writer thread could not write to disk."""
+        return self._file_handler.failed_writes
+    
+    @property
+    def overflow_writes(self) -> int:
+        """Number of log entries written directly because the write queue was full."""
+        return self._overflow_writes
+    
+    async def flush(self) -> None:
+        """Wait until every logged entry has been written to disk."""
+        if self._write_queue is not None:
+            await asyncio.to_thread(self._write_queue.join)
+    
+    async def aclose(self) -> None:
+        """Write all queued entries and stop the writer thread.
+        
+        Entries logged while closing is in progress are refused; logging
+        after aclose() returns starts a new writer.
+        """
+        if self._writer is not None and not self._closing:
+            self._closing = True
+            try:
+                await asyncio.to_thread(self._stop_writer)
+            finally:
+                self._closing = False
     
     async def log_research_goal(self, goal: str, context: Dict) -> SafetyCheck:
         """Log research goal without evaluation.
@@ -286,8 +393,11 @@ class SafetyLogger:
                 reasoning="Safety logging disabled"
             )
         
-        # Extract content for hashing
-        content = hypothesis_data.get("content", str(hypothesis_data))
+        # Extract content for hashing; only stringify the whole dict without one
+        if "content" in hypothesis_data:
+            content = hypothesis_data["content"]
+        else:
+            content = str(hypothesis_data)
         
         # Create log entry
         log_entry = await self._create_log_entry(
@@ -318,8 +428,6 @@ class SafetyLogger:
         Returns:
             LogEntry instance
         """
-        import uuid
-        
         log_id = str(uuid.uuid4())
         content_hash = await self._hash_content(content)
         
@@ -342,16 +450,23 @@ class SafetyLogger:
         Returns:
             Hex string of SHA-256 hash
         """
-        import hashlib
-        
         return hashlib.sha256(content.encode('utf-8')).hexdigest()
     
     async def _write_log_entry(self, log_entry: LogEntry) -> None:
-        """Write log entry to disk.
+        """Queue a log entry for the background writer.
+        
+        The entry reaches disk asynchronously; await flush() before
+        reading the log directory.
         
         Args:
             log_entry: LogEntry to write
+            
+        Raises:
+            RuntimeError: If aclose() is in progress
         """
+        if self._closing:
+            raise RuntimeError("Safety logger is closing; entry not logged")
+        
         # Create filename with date prefix for easy sorting
         filename = f"{log_entry.timestamp.strftime('%Y%m%d')}_{log_entry.id}.json"
         filepath = self.log_directory / filename
@@ -367,9 +482,43 @@ class SafetyLogger:
             "user_id": log_entry.user_id
         }
         
-        # Write to file
-        with open(filepath, 'w') as f:
-            json.dump(entry_dict, f, indent=2)
+        # Encode here, so later changes to the caller's metadata can't reach
+        # the file and the writer thread only ever sees immutable bytes
+        data = orjson.dumps(entry_dict, default=str, option=_ORJSON_LOG_OPTIONS)
+        
+        record = logging.makeLogRecord({"filepath": filepath, "data": data})
+        if self._writer is None:
+            self._start_writer()
+        try:
+            self._write_queue.put_nowait(record)
+        except queue.Full:
+            # The writer thread is behind; write this entry without queueing
+            # rather than block the event loop or drop an audit record
+            self._overflow_writes += 1
+            await asyncio.to_thread(self._file_handler.handle, record)
+    
+    def _load_entry(self, log_file: Path) -> Dict:
+        """Parse a log file, reusing the cached entry when it was read before.
+        
+        Args:
+            log_file: Log file to read
+            
+        Returns:
+            Log entry dictionary, shared with the cache
+        """
+        stat = log_file.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._entry_cache.get(log_file.name)
+        if cached is not None and cached[0] == signature:
+            self._entry_cache.move_to_end(log_file.name)
+            return cached[1]
+        
+        entry = orjson.loads(log_file.read_bytes())
+        self._entry_cache[log_file.name] = (signature, entry)
+        self._entry_cache.move_to_end(log_file.name)
+        if len(self._entry_cache) > self.ENTRY_CACHE_SIZE:
+            self._entry_cache.popitem(last=False)
+        return entry
     
     async def generate_pattern_report(self, period: str) -> PatternReport:
         """Generate a pattern report for the specified period.
@@ -380,16 +529,13 @@ class SafetyLogger:
         Returns:
             PatternReport with analysis
         """
-        import uuid
-        
         # Read all log files
         log_entries = await self._read_recent_logs(period)
         
         # Count events by type
-        event_counts: Dict[str, int] = {}
-        for entry in log_entries:
-            event_type = entry.get("event_type", "unknown")
-            event_counts[event_type] = event_counts.get(event_type, 0) + 1
+        event_counts: Dict[str, int] = dict(Counter(
+            entry.get("event_type", "unknown") for entry in log_entries
+        ))
         
         # Identify patterns (simplified for now)
         patterns = []
@@ -432,27 +578,53 @@ class SafetyLogger:
             start_time = now - timedelta(days=1)
         
         # Read log files
+        await self.flush()
         entries = []
-        for log_file in self.log_directory.glob("*.json"):
+        for log_file in self._log_files_between(start_time):
             try:
-                with open(log_file, 'r') as f:
-                    entry = json.load(f)
-                    # Parse timestamp
-                    entry_time = datetime.fromisoformat(entry["timestamp"])
-                    if entry_time >= start_time:
-                        entries.append(entry)
+                entry = self._load_entry(log_file)
+                # Parse timestamp
+                entry_time = datetime.fromisoformat(entry["timestamp"])
+                if entry_time >= start_time:
+                    entries.append(entry)
             except Exception:
                 # Skip corrupted files
                 continue
         
         return entries
     
+    def _log_files_between(self, start_time: datetime,
+                           end_time: Optional[datetime] = None) -> Iterator[Path]:
+        """Yield the log files that can hold entries in a time range.
+        
+        Files are skipped by their YYYYMMDD name prefix, without being opened.
+        Prefixes are UTC dates, so a day of slack on each side covers naive
+        or local-time bounds. Files without a date prefix are always yielded.
+        
+        Args:
+            start_time: Start of range
+            end_time: End of range, or None for no upper bound
+            
+        Returns:
+            Iterator over candidate log files
+        """
+        first_day = (start_time - timedelta(days=1)).strftime('%Y%m%d')
+        last_day = (end_time + timedelta(days=1)).strftime('%Y%m%d') if end_time else None
+        
+        for log_file in self.log_directory.glob("*.json"):
+            day = log_file.name[:8]
+            if len(day) == 8 and day.isdigit():
+                if day < first_day or (last_day is not None and day > last_day):
+                    continue
+            yield log_file
+    
     async def cleanup_old_logs(self) -> None:
         """Remove log files older than retention period."""
         from datetime import timedelta
         
         cutoff_time = datetime.now(timezone.utc) - timedelta(days=self.config.retention_days)
         
+        await self.flush()
         for log_file in self.log_directory.glob("*.json"):
             try:
                 # Extract date from filename (YYYYMMDD_...)
@@ -477,13 +649,13 @@ class SafetyLogger:
         Returns:
             List of LogEntry instances
         """
+        await self.flush()
         entries = []
         
-        for log_file in self.log_directory.glob("*.json"):
+        for log_file in self._log_files_between(start_time, end_time):
             try:
-                with open(log_file, 'r') as f:
-                    entry_dict = json.load(f)
-                    
+                entry_dict = self._load_entry(log_file)
+                
                 # Parse timestamp
                 entry_time = datetime.fromisoformat(entry_dict["timestamp"])
                 
@@ -547,6 +719,10 @@ class SafetyMetricsCollector:
         self._start_time = datetime.now(timezone.utc)
         self._alert_thresholds: Dict[str, float] = {}
         self._time_series_data: List[Dict] = []
+        # Timestamps of _time_series_data kept as their own column, so time
+        # range queries bisect it instead of scanning every entry
+        self._time_series_timestamps: List[datetime] = []
+        self._time_series_ordered = True
         self._lock = asyncio.Lock() if hasattr(asyncio, 'Lock') else None
         
         # Initialize metric categories
@@ -567,6 +743,8 @@ class SafetyMetricsCollector:
                 "by_severity": {}
             }
         }
+        # Running sum of safety_scores, so the average is O(1) to read
+        self._score_total = 0.0
     
     def record_safety_check(self, check_type: str, safety_check: SafetyCheck) -> None:
         """Record a safety check result.
@@ -591,9 +769,10 @@ class SafetyMetricsCollector:
         
         # Store safety score
         self.metrics["safety_checks"]["safety_scores"].append(safety_check.safety_score)
+        self._score_total += safety_check.safety_score
         
         # Add to time series
-        self._time_series_data.append({
+        self._append_time_series({
             "timestamp": datetime.now(timezone.utc),
             "type": "safety_check",
             "check_type": check_type,
@@ -622,23 +801,36 @@ class SafetyMetricsCollector:
         self.metrics["pattern_alerts"]["by_severity"][severity] += 1
         
         # Add to time series
-        self._time_series_data.append({
+        self._append_time_series({
             "timestamp": datetime.now(timezone.utc),
             "type": "pattern_alert",
             "pattern": pattern,
             "severity": severity
         })
     
+    def _append_time_series(self, entry: Dict) -> None:
+        """Append a time series entry and its timestamp.
+        
+        Args:
+            entry: Time series entry with a "timestamp" key
+        """
+        timestamp = entry["timestamp"]
+        if self._time_series_timestamps and timestamp < self._time_series_timestamps[-1]:
+            # Wall clock went backwards; range queries fall back to a scan
+            self._time_series_ordered = False
+        self._time_series_data.append(entry)
+        self._time_series_timestamps.append(timestamp)
+    
     def get_average_safety_score(self) -> float:
         """Calculate the average safety score across all checks.
         
         Returns:
             Average safety score (0.0 to 1.0)
         """
-        scores = self.metrics["safety_checks"]["safety_scores"]
-        if not scores:
+        count = self.metrics["safety_checks"]["total"]
+        if not count:
             return 1.0
-        return sum(scores) / len(scores)
+        return self._score_total / count
     
     def get_metrics_summary(self) -> Dict:
         """Get a summary of all collected metrics.
@@ -693,6 +885,8 @@ class SafetyMetricsCollector:
         """Reset all collected metrics."""
         self._initialize_metrics()
         self._time_series_data = []
+        self._time_series_timestamps = []
+        self._time_series_ordered = True
         self._start_time = datetime.now(timezone.utc)
     
     def export_metrics(self, export_path: Path) -> None:
@@ -723,10 +917,15 @@ class SafetyMetricsCollector:
         Returns:
             Metrics within the specified range
         """
-        filtered_data = [
-            entry for entry in self._time_series_data
-            if start_time <= entry["timestamp"] <= end_time
-        ]
+        if self._time_series_ordered:
+            lo = bisect.bisect_left(self._time_series_timestamps, start_time)
+            hi = bisect.bisect_right(self._time_series_timestamps, end_time, lo)
+            filtered_data = self._time_series_data[lo:hi]
+        else:
+            filtered_data = [
+                entry for entry in self._time_series_data
+                if start_time <= entry["timestamp"] <= end_time
+            ]
         
         return {
             "total_checks_in_range": len(filtered_data),
@@ -1046,12 +1245,21 @@ class LogRotationManager:
         Returns:
             Path to the archive file if created, None otherwise
         """
-        import tarfile
-        
         rotated_files = list(self.log_directory.glob("*.rotated.json"))
         if not rotated_files:
             return None
         
+        return self._archive(rotated_files)
+    
+    def _archive(self, rotated_files: List[Path]) -> Path:
+        """Pack rotated log files into a new archive and delete them.
+        
+        Args:
+            rotated_files: Rotated log files to archive
+            
+        Returns:
+            Path to the archive file
+        """
         # Create archive name with timestamp
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
         archive_path = self.log_directory / f"safety_logs_archive_{timestamp}.tar.gz"
@@ -1077,13 +1285,36 @@ class LogRotationManager:
         logger = SafetyLogger(self.config)
         await logger.cleanup_old_logs()
         
-        # Rotate large files
-        for log_file in self.log_directory.glob("*.json"):
-            if ".rotated." not in log_file.name:
-                await self.rotate_if_needed(log_file, size_limit_kb)
+        # Rotate and archive in a worker thread so the event loop keeps running
+        await asyncio.to_thread(self._rotate_and_archive, size_limit_kb)
+    
+    def _rotate_and_archive(self, size_limit_kb: float) -> Optional[Path]:
+        """Rotate oversized logs and archive every rotated log in one pass.
         
-        # Archive rotated files
-        await self.archive_rotated_logs()
+        Args:
+            size_limit_kb: Size limit for rotation in KB
+            
+        Returns:
+            Path to the archive file if created, None otherwise
+        """
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        # Snapshot the listing first; renaming while scanning could revisit files
+        with os.scandir(self.log_directory) as it:
+            entries = [entry for entry in it if entry.name.endswith(".json")]
+        
+        rotated_files = []
+        for entry in entries:
+            log_file = Path(entry.path)
+            if ".rotated." in entry.name:
+                rotated_files.append(log_file)
+            elif entry.stat().st_size / 1024 > size_limit_kb:
+                rotated_path = log_file.parent / f"{log_file.stem}_{timestamp}.rotated.json"
+                log_file.rename(rotated_path)
+                rotated_files.append(rotated_path)
+        
+        if not rotated_files:
+            return None
+        return self._archive(rotated_files)
     
     def get_file_age_days(self, file_path: Path) -> int:
         """Get the age of a file in days.
@@ -1102,7 +1333,6 @@ class LogRotationManager:
                 file_date = file_date.replace(tzinfo=timezone.utc)
             else:
                 # Fall back to file modification time
-                import os
                 mtime = os.path.getmtime(file_path)
                 file_date = datetime.fromtimestamp(mtime, tz=timezone.utc)
             
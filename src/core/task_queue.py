@@ -1,14 +1,45 @@
 """Task Queue implementation for AI Co-Scientist."""
 
 import asyncio
+import heapq
 import json
-from collections import defaultdict, deque
+import operator
+import os
+from collections import Counter, defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Optional, Any, Set, Tuple
+from functools import reduce
+from typing import Callable, Dict, List, Optional, Any, Set, Tuple
 from uuid import uuid4, UUID
 
-from src.core.models import Task, TaskState, TaskType
+import orjson
+
+from src.core.models import Task, TaskState, TaskType, utcnow
+
+
+# Agent type that handles each task type
+_TASK_TO_AGENT_TYPE = {
+    TaskType.GENERATE_HYPOTHESIS: "Generation",
+    TaskType.REFLECT_ON_HYPOTHESIS: "Reflection",
+    TaskType.RANK_HYPOTHESES: "Ranking",
+    TaskType.EVOLVE_HYPOTHESIS: "Evolution",
+    TaskType.FIND_SIMILAR_HYPOTHESES: "Proximity",
+    TaskType.META_REVIEW: "MetaReview"
+}
+
+# One bit per task type, so capability matching is a single AND against a
+# worker's capability mask instead of a list lookup per queued task
+_TYPE_BIT = {task_type: 1 << i for i, task_type in enumerate(TaskType)}
+_AGENT_TYPE_BITS = {
+    agent_type: _TYPE_BIT[task_type]
+    for task_type, agent_type in _TASK_TO_AGENT_TYPE.items()
+}
+# Task types without an agent mapping can go to any worker
+_UNMAPPED_TYPE_BITS = reduce(
+    operator.or_,
+    (bit for task_type, bit in _TYPE_BIT.items() if task_type not in _TASK_TO_AGENT_TYPE),
+    0
+)
 
 
 @dataclass
@@ -32,7 +63,7 @@ class QueueConfig:
     worker_timeout: int = 300
     heartbeat_interval: int = 30
     heartbeat_timeout: int = 60  # Worker considered dead after this many seconds
-    heartbeat_check_interval: int = 15  # How often to check for dead workers
+    heartbeat_check_interval: int = 15  # Unused; per-worker timers detect dead workers
     retry_policy: Dict[str, Any] = None
     persistence_interval: int = 60
     persistence_path: Optional[str] = None  # Path to save queue state
@@ -44,6 +75,7 @@ class QueueConfig:
     overflow_strategy: str = "displace_oldest_low_priority"  # Strategy when queue full
     priority_boost_interval: int = 60  # Boost priority every N seconds
     priority_boost_amount: float = 0.1  # Amount to boost priority by
+    time_source: Callable[[], datetime] = utcnow  # Clock for task waits and priority aging
     
     def __post_init__(self):
         """Initialize and validate configuration."""
@@ -82,6 +114,39 @@ class TaskAssignment:
     acknowledgment_required_by: float
 
 
+class _TaskStateMap(dict):
+    """Task ID to TaskState mapping that keeps a running count per state.
+    
+    Counts are updated on every write, so statistics never have to scan
+    the map. Only item assignment, ``del``, ``pop`` and ``clear`` are
+    supported as mutations.
+    """
+    
+    def __init__(self) -> None:
+        super().__init__()
+        self.counts: Dict[TaskState, int] = dict.fromkeys(TaskState, 0)
+    
+    def __setitem__(self, task_id: str, state: TaskState) -> None:
+        previous = self.get(task_id)
+        if previous is not None:
+            self.counts[previous] -= 1
+        super().__setitem__(task_id, state)
+        self.counts[state] += 1
+    
+    def __delitem__(self, task_id: str) -> None:
+        self.counts[self[task_id]] -= 1
+        super().__delitem__(task_id)
+    
+    def pop(self, task_id: str, *default: Any) -> Any:
+        if task_id in self:
+            self.counts[self[task_id]] -= 1
+        return super().pop(task_id, *default)
+    
+    def clear(self) -> None:
+        super().clear()
+        self.counts = dict.fromkeys(TaskState, 0)
+
+
 class TaskQueue:
     """Priority-based task queue for agent coordination."""
     
@@ -104,11 +169,15 @@ class TaskQueue:
         
         # Task tracking
         self._tasks: Dict[str, Task] = {}
-        self._task_states: Dict[str, TaskState] = {}
+        self._task_states = _TaskStateMap()
         self._task_retry_counts: Dict[str, int] = {}
         self._task_failure_history: Dict[str, list] = {}
         self._task_enqueue_times: Dict[str, datetime] = {}  # Track when tasks were enqueued
         self._task_boost_levels: Dict[str, float] = {}  # Track priority boosts
+        # Min-heap of (next boost due time, task_id), so aging only visits
+        # tasks that have crossed a boost interval since the last dequeue
+        self._aging_heap: List[Tuple[datetime, str]] = []
+        self._boosted_tasks: Set[str] = set()  # Live tasks with a boost above zero
         
         # Worker tracking
         self._workers: Set[str] = set()
@@ -123,9 +192,14 @@ class TaskQueue:
         # Capability matching
         self._capability_matching_enabled = False
         
-        # Heartbeat monitoring
+        # Heartbeat monitoring. While monitoring is active each worker has a
+        # timer armed for its heartbeat deadline, so timeouts fire when they
+        # are due without sweeping every worker.
         self._monitoring_task: Optional[asyncio.Task] = None
         self._monitoring_stopped = False
+        self._monitoring_wakeup = asyncio.Event()
+        self._heartbeat_timers_enabled = False
+        self._hb_timers: Dict[str, asyncio.TimerHandle] = {}
         
         # Task progress tracking
         self._task_progress: Dict[str, Dict[str, Any]] = {}
@@ -135,7 +209,10 @@ class TaskQueue:
         self._persistence_stopped = False
         self._persistence_version = "1.0.0"
         
-        # Lock for thread-safe operations
+        # Lock for multi-step operations. The hot enqueue, dequeue and
+        # completion paths never await, so they run atomically on the event
+        # loop without taking it; code holding the lock must not await
+        # either, or those paths could interleave with it.
         self._lock = asyncio.Lock()
         
         # Track initialization status
@@ -144,6 +221,7 @@ class TaskQueue:
         # Dead letter queue
         self._dead_letter_queue: deque = deque()
         self._dlq_metadata: Dict[str, Dict[str, Any]] = {}
+        self._dlq_reasons: Counter = Counter()  # Running count of DLQ entries by reason
         
         # Overflow tracking
         self._displaced_tasks: int = 0
@@ -186,6 +264,37 @@ class TaskQueue:
         
         self._initialized = True
     
+    async def purge(self) -> None:
+        """Drop every task, assignment and dead-lettered entry from the queue.
+
+        Registered workers are kept but returned to the idle state, so a
+        queue can be reused without rebuilding it or re-registering workers.
+        """
+        async with self._lock:
+            self._queues = {3: deque(), 2: deque(), 1: deque()}
+            self._tasks.clear()
+            self._task_states.clear()
+            self._task_retry_counts.clear()
+            self._task_failure_history.clear()
+            self._task_enqueue_times.clear()
+            self._task_boost_levels.clear()
+            self._aging_heap.clear()
+            self._boosted_tasks.clear()
+            self._task_progress.clear()
+            self._active_assignments.clear()
+            self._assignment_to_task.clear()
+            self._assignment_to_worker.clear()
+            self._dead_letter_queue.clear()
+            self._dlq_metadata.clear()
+            self._dlq_reasons.clear()
+            self._displaced_tasks = 0
+            self._displacement_by_priority = {"low": 0, "medium": 0, "high": 0}
+
+            self._active_workers.clear()
+            for info in self._worker_info.values():
+                info.state = "idle"
+                info.assigned_task = None
+
     def size(self) -> int:
         """Get total number of tasks in queue."""
         return sum(len(q) for q in self._queues.values())
@@ -223,49 +332,83 @@ class TaskQueue:
         if task.priority <= 0:
             raise ValueError("Priority must be positive")
         
-        async with self._lock:
-            # Map priority to queue (1=low, 2=medium, 3=high)
-            priority_queue = self._queues.get(task.priority)
-            if priority_queue is None:
-                raise ValueError(f"Invalid priority: {task.priority}")
-            
-            priority_name = {1: "low", 2: "medium", 3: "high"}.get(task.priority)
+        return self._enqueue_task(task)
+    
+    async def enqueue_many(self, tasks: List[Task]) -> List[str]:
+        """Add several tasks to the queue in one call.
+        
+        Priorities are checked for every task before anything is queued.
+        Valid tasks are then added in order with the same capacity, quota
+        and displacement rules as ``enqueue``; if one hits a capacity limit,
+        the tasks before it stay queued and the error is raised.
+        
+        Args:
+            tasks: Tasks to enqueue
             
-            # Track if we've already displaced a task
-            displaced_for_capacity = False
+        Returns:
+            Task IDs in the same order as ``tasks``
             
-            # Check if queue is at capacity
-            if self.size() >= self.config.max_queue_size:
-                # Handle overflow based on strategy
-                if self.config.overflow_strategy == "displace_oldest_low_priority" and task.priority > 1:
-                    # Try to displace a lower priority task
-                    displaced = await self._displace_low_priority_task(task.priority)
-                    if not displaced:
-                        raise RuntimeError("Queue at capacity and no tasks can be displaced")
-                    displaced_for_capacity = True
-                else:
-                    raise RuntimeError("Queue at capacity")
-            
-            # Check priority quota only if we didn't displace due to total capacity
-            # (because displacement already made room)
-            if not displaced_for_capacity and len(priority_queue) >= self.config.priority_quotas.get(priority_name, 0):
-                # For high priority tasks, try to displace lower priority
-                if task.priority > 1 and self.config.overflow_strategy == "displace_oldest_low_priority":
-                    displaced = await self._displace_low_priority_task(task.priority)
-                    if not displaced:
-                        raise RuntimeError(f"Queue at capacity for {priority_name} priority")
-                else:
+        Raises:
+            ValueError: If any task has an invalid priority (nothing is enqueued)
+            RuntimeError: If the queue reaches capacity
+        """
+        for task in tasks:
+            if task.priority <= 0:
+                raise ValueError("Priority must be positive")
+            if task.priority not in self._queues:
+                raise ValueError(f"Invalid priority: {task.priority}")
+        
+        return [self._enqueue_task(task) for task in tasks]
+    
+    def _enqueue_task(self, task: Task) -> str:
+        """Add a task to its priority queue without suspending."""
+        # Map priority to queue (1=low, 2=medium, 3=high)
+        priority_queue = self._queues.get(task.priority)
+        if priority_queue is None:
+            raise ValueError(f"Invalid priority: {task.priority}")
+        
+        priority_name = {1: "low", 2: "medium", 3: "high"}.get(task.priority)
+        
+        # Track if we've already displaced a task
+        displaced_for_capacity = False
+        
+        # Check if queue is at capacity
+        if self.size() >= self.config.max_queue_size:
+            # Handle overflow based on strategy
+            if self.config.overflow_strategy == "displace_oldest_low_priority" and task.priority > 1:
+                # Try to displace a lower priority task
+                displaced = self._displace_low_priority_task(task.priority)
+                if not displaced:
+                    raise RuntimeError("Queue at capacity and no tasks can be displaced")
+                displaced_for_capacity = True
+            else:
+                raise RuntimeError("Queue at capacity")
+        
+        # Check priority quota only if we didn't displace due to total capacity
+        # (because displacement already made room)
+        if not displaced_for_capacity and len(priority_queue) >= self.config.priority_quotas.get(priority_name, 0):
+            # For high priority tasks, try to displace lower priority
+            if task.priority > 1 and self.config.overflow_strategy == "displace_oldest_low_priority":
+                displaced = self._displace_low_priority_task(task.priority)
+                if not displaced:
                     raise RuntimeError(f"Queue at capacity for {priority_name} priority")
-            
-            # Add to queue
-            task_id = str(task.id)
-            self._tasks[task_id] = task
-            self._task_states[task_id] = TaskState.PENDING
-            self._task_enqueue_times[task_id] = datetime.now(timezone.utc)
-            self._task_boost_levels[task_id] = 0.0
-            priority_queue.append(task_id)
-            
-            return task_id
+            else:
+                raise RuntimeError(f"Queue at capacity for {priority_name} priority")
+        
+        # Add to queue
+        task_id = task.id_str
+        self._tasks[task_id] = task
+        self._task_states[task_id] = TaskState.PENDING
+        enqueue_time = self.config.time_source()
+        self._task_enqueue_times[task_id] = enqueue_time
+        self._task_boost_levels[task_id] = 0.0
+        heapq.heappush(
+            self._aging_heap,
+            (enqueue_time + timedelta(seconds=self.config.priority_boost_interval), task_id)
+        )
+        priority_queue.append(task_id)
+        
+        return task_id
     
     async def dequeue(self, worker_id: str) -> Optional[TaskAssignment]:
         """Get next task for a worker.
@@ -276,70 +419,148 @@ class TaskQueue:
         Returns:
             TaskAssignment if available, None otherwise
         """
-        async with self._lock:
-            # Register worker if new (backward compatibility)
-            if worker_id not in self._workers:
-                self._workers.add(worker_id)
-                self._worker_info[worker_id] = WorkerInfo(
-                    id=worker_id,
-                    capabilities={},
-                    state="idle"
-                )
-            
-            # Apply priority boosts for starving tasks
-            await self._apply_priority_boosts()
+        self._prepare_dequeue(worker_id)
+        boosted = self._apply_priority_boosts()
+        
+        assignments = self._assign_next_tasks(worker_id, 1, boosted)
+        return assignments[0] if assignments else None
+    
+    async def dequeue_batch(self, worker_id: str, max_items: int = 8) -> List[TaskAssignment]:
+        """Get up to ``max_items`` tasks for a worker in one call.
+        
+        Tasks are chosen in the same order successive ``dequeue`` calls
+        would return them. A ``max_concurrent`` worker capability further
+        caps the batch size.
+        
+        Args:
+            worker_id: ID of the requesting worker
+            max_items: Maximum number of tasks to assign
             
-            # Collect all pending tasks with their effective priorities
-            candidate_tasks = []
-            for priority in [3, 2, 1]:
+        Returns:
+            List of TaskAssignments, empty if no task is available
+        """
+        self._prepare_dequeue(worker_id)
+        boosted = self._apply_priority_boosts()
+        
+        max_concurrent = self._worker_info[worker_id].capabilities.get("max_concurrent")
+        if max_concurrent:
+            max_items = min(max_items, max_concurrent)
+        
+        return self._assign_next_tasks(worker_id, max_items, boosted)
+    
+    def _prepare_dequeue(self, worker_id: str) -> None:
+        """Register an unknown worker on first dequeue."""
+        # Register worker if new (backward compatibility)
+        if worker_id not in self._workers:
+            self._workers.add(worker_id)
+            self._worker_info[worker_id] = WorkerInfo(
+                id=worker_id,
+                capabilities={},
+                state="idle"
+            )
+    
+    def _assign_next_tasks(
+        self, worker_id: str, max_items: int, boosted: bool = True
+    ) -> List[TaskAssignment]:
+        """Assign the highest priority tasks to a worker without suspending."""
+        capability_mask = self._worker_capability_mask(worker_id)
+        if boosted or capability_mask != -1:
+            selected = self._select_tasks(capability_mask, max_items)
+        else:
+            # Every task is eligible and none is boosted, so the order is
+            # simply the highest non-empty priority deque, FIFO within it
+            selected = []
+            for priority in (3, 2, 1):
                 queue = self._queues[priority]
-                for task_id in queue:
+                while queue and len(selected) < max_items:
+                    task_id = queue.popleft()
                     task = self._tasks.get(task_id)
-                    if task and self._can_worker_handle_task(worker_id, task):
-                        boost = self._task_boost_levels.get(task_id, 0.0)
-                        effective_priority = task.priority + boost
-                        candidate_tasks.append((task_id, task, effective_priority))
+                    if task:
+                        selected.append((task_id, task))
+        
+        assignments = []
+        for task_id, task in selected:
+            # Update task state
+            task.assign(worker_id)
+            self._task_states[task_id] = TaskState.ASSIGNED
+            self._active_workers.add(worker_id)
             
-            # Sort by effective priority (highest first)
-            candidate_tasks.sort(key=lambda x: x[2], reverse=True)
+            # Update worker state
+            if worker_id in self._worker_info:
+                self._worker_info[worker_id].state = "active"
+                self._worker_info[worker_id].assigned_task = task_id
+                self._worker_info[worker_id].last_heartbeat = datetime.now(timezone.utc)
             
-            if candidate_tasks:
-                # Take the highest priority task
-                task_id, task, _ = candidate_tasks[0]
-                
-                # Remove from its queue
-                priority_queue = self._queues[task.priority]
-                priority_queue.remove(task_id)
-                
-                # Update task state
-                task.assign(worker_id)
-                self._task_states[task_id] = TaskState.ASSIGNED
-                self._active_workers.add(worker_id)
-                
-                # Update worker state
-                if worker_id in self._worker_info:
-                    self._worker_info[worker_id].state = "active"
-                    self._worker_info[worker_id].assigned_task = task_id
-                    self._worker_info[worker_id].last_heartbeat = datetime.now(timezone.utc)
-                
-                # Create assignment
-                now = datetime.now(timezone.utc).timestamp()
-                assignment_id = str(uuid4())
-                assignment = TaskAssignment(
-                    task=task,
-                    assignment_id=assignment_id,
-                    deadline=now + self.config.worker_timeout,
-                    acknowledgment_required_by=now + self.config.acknowledgment_timeout
-                )
-                
-                # Track assignment
-                self._active_assignments[assignment_id] = assignment
-                self._assignment_to_task[assignment_id] = task_id
-                self._assignment_to_worker[assignment_id] = worker_id
-                
-                return assignment
+            # Create assignment
+            now = datetime.now(timezone.utc).timestamp()
+            assignment_id = str(uuid4())
+            assignment = TaskAssignment(
+                task=task,
+                assignment_id=assignment_id,
+                deadline=now + self.config.worker_timeout,
+                acknowledgment_required_by=now + self.config.acknowledgment_timeout
+            )
             
-            return None
+            # Track assignment
+            self._active_assignments[assignment_id] = assignment
+            self._assignment_to_task[assignment_id] = task_id
+            self._assignment_to_worker[assignment_id] = worker_id
+            
+            assignments.append(assignment)
+        
+        return assignments
+    
+    def _select_tasks(self, capability_mask: int, max_items: int) -> List[Tuple[str, Task]]:
+        """Remove and return the next eligible tasks by effective priority.
+        
+        Args:
+            capability_mask: Task-type bits the worker can handle
+            max_items: Maximum number of tasks to select
+            
+        Returns:
+            List of (task_id, task) pairs in assignment order
+        """
+        # Boosts only ever raise priority, so within a band just the first
+        # max_items eligible unboosted tasks can win; every pending boosted
+        # task is a candidate. A band's scan stops once both are collected.
+        boosted_per_band = Counter(
+            self._tasks[task_id].priority
+            for task_id in self._boosted_tasks
+            if self._task_states.get(task_id) == TaskState.PENDING and task_id in self._tasks
+        )
+        
+        # Candidates are keyed by (-effective priority, queue order) so
+        # selection compares plain numbers and stays FIFO within a priority
+        candidate_tasks = []
+        for priority in [3, 2, 1]:
+            queue = self._queues[priority]
+            boosted_left = boosted_per_band[priority]
+            unboosted_left = max_items
+            for task_id in queue:
+                if boosted_left <= 0 and unboosted_left <= 0:
+                    break
+                task = self._tasks.get(task_id)
+                if not task:
+                    continue
+                eligible = _TYPE_BIT[task.task_type] & capability_mask
+                boost = self._task_boost_levels.get(task_id, 0.0)
+                if boost > 0:
+                    boosted_left -= 1
+                    if not eligible:
+                        continue
+                elif not eligible or unboosted_left <= 0:
+                    continue
+                else:
+                    unboosted_left -= 1
+                candidate_tasks.append(
+                    (-(task.priority + boost), len(candidate_tasks), task_id, task)
+                )
+        
+        selected = []
+        for _, _, task_id, task in heapq.nsmallest(max_items, candidate_tasks):
+            self._queues[task.priority].remove(task_id)
+            selected.append((task_id, task))
+        return selected
     
     async def peek(self) -> Optional[Task]:
         """Peek at next task without removing it.
@@ -392,6 +613,7 @@ class TaskQueue:
             if worker_id in self._active_workers:
                 self._worker_info[worker_id].state = "active"
             
+            self._arm_heartbeat_timer(worker_id)
             return True
     
     async def unregister_worker(self, worker_id: str) -> bool:
@@ -411,6 +633,9 @@ class TaskQueue:
             self._workers.discard(worker_id)
             self._active_workers.discard(worker_id)
             self._worker_info.pop(worker_id, None)
+            timer = self._hb_timers.pop(worker_id, None)
+            if timer:
+                timer.cancel()
             
             # TODO: Handle any tasks assigned to this worker
             
@@ -435,7 +660,7 @@ class TaskQueue:
         """
         return self._workers.copy()
     
-    async def get_worker_status(self, worker_id: str) -> Optional[Dict[str, Any]]:
+    def get_worker_status(self, worker_id: str) -> Optional[Dict[str, Any]]:
         """Get detailed status of a worker.
         
         Args:
@@ -444,19 +669,18 @@ class TaskQueue:
         Returns:
             Worker status dict or None if not found
         """
-        async with self._lock:
-            worker_info = self._worker_info.get(worker_id)
-            if not worker_info:
-                return None
-            
-            return {
-                "id": worker_info.id,
-                "state": worker_info.state,
-                "capabilities": worker_info.capabilities,
-                "last_heartbeat": worker_info.last_heartbeat,
-                "assigned_task": worker_info.assigned_task,
-                "registration_time": worker_info.registration_time
-            }
+        worker_info = self._worker_info.get(worker_id)
+        if not worker_info:
+            return None
+        
+        return {
+            "id": worker_info.id,
+            "state": worker_info.state,
+            "capabilities": worker_info.capabilities,
+            "last_heartbeat": worker_info.last_heartbeat,
+            "assigned_task": worker_info.assigned_task,
+            "registration_time": worker_info.registration_time
+        }
     
     async def get_workers_by_state(self, state: str) -> Set[str]:
         """Get workers in a specific state.
@@ -511,29 +735,31 @@ class TaskQueue:
         Returns:
             True if worker can handle task type
         """
+        return bool(_TYPE_BIT[task.task_type] & self._worker_capability_mask(worker_id))
+    
+    def _worker_capability_mask(self, worker_id: str) -> int:
+        """Get the bitmask of task types a worker can handle.
+        
+        Args:
+            worker_id: Worker to build the mask for
+            
+        Returns:
+            OR of the ``_TYPE_BIT`` entries the worker accepts; every bit is
+            set when capability matching is disabled
+        """
         if not self._capability_matching_enabled:
-            return True
+            return -1
         
         worker_info = self._worker_info.get(worker_id)
         if not worker_info:
-            return False
-        
-        # Map task type to required agent type
-        task_to_agent_mapping = {
-            TaskType.GENERATE_HYPOTHESIS: "Generation",
-            TaskType.REFLECT_ON_HYPOTHESIS: "Reflection",
-            TaskType.RANK_HYPOTHESES: "Ranking",
-            TaskType.EVOLVE_HYPOTHESIS: "Evolution",
-            TaskType.FIND_SIMILAR_HYPOTHESES: "Proximity",
-            TaskType.META_REVIEW: "MetaReview"
-        }
-        
-        required_agent_type = task_to_agent_mapping.get(task.task_type)
-        if not required_agent_type:
-            return True  # Unknown task type, allow any worker
+            return 0
         
         agent_types = worker_info.capabilities.get("agent_types", [])
-        return required_agent_type in agent_types
+        return reduce(
+            operator.or_,
+            (_AGENT_TYPE_BITS.get(agent_type, 0) for agent_type in agent_types),
+            _UNMAPPED_TYPE_BITS
+        )
     
     async def acknowledge_task(self, worker_id: str, assignment_id: str) -> bool:
         """Acknowledge task assignment.
@@ -572,33 +798,78 @@ class TaskQueue:
         Returns:
             True if completion successful
         """
-        async with self._lock:
-            # Verify worker has this task
-            task = self._tasks.get(task_id)
-            if not task or task.assigned_to != worker_id:
-                return False
-            
-            # Update task state and result
-            self._task_states[task_id] = TaskState.COMPLETED
-            task.state = TaskState.COMPLETED
-            task.result = result
-            task.completed_at = datetime.now(timezone.utc)
-            
-            # Clear assignment
-            for assignment_id, tid in self._assignment_to_task.items():
-                if tid == task_id:
-                    del self._active_assignments[assignment_id]
-                    del self._assignment_to_task[assignment_id]
-                    del self._assignment_to_worker[assignment_id]
-                    break
-            
-            # Update worker state
-            if worker_id in self._worker_info:
-                self._worker_info[worker_id].state = "idle"
-                self._worker_info[worker_id].assigned_task = None
-                self._active_workers.discard(worker_id)
+        return self._complete_task(worker_id, task_id, result)
+    
+    async def complete_tasks(
+        self,
+        worker_id: str,
+        results: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[bool]:
+        """Mark several tasks as completed in one call.
+        
+        Args:
+            worker_id: Worker completing the tasks
+            results: ``(task_id, result)`` pairs
             
-            return True
+        Returns:
+            Per-task completion flags in the same order as ``results``
+        """
+        return [
+            self._complete_task(worker_id, task_id, result)
+            for task_id, result in results
+        ]
+    
+    def _complete_task(self, worker_id: str, task_id: str, result: Dict[str, Any]) -> bool:
+        """Mark a task as completed without suspending."""
+        # Verify worker has this task
+        task = self._tasks.get(task_id)
+        if not task or task.assigned_to != worker_id:
+            return False
+        
+        # Update task state and result
+        self._task_states[task_id] = TaskState.COMPLETED
+        task.state = TaskState.COMPLETED
+        task.result = result
+        task.completed_at = datetime.now(timezone.utc)
+        
+        # Clear assignment
+        for assignment_id, tid in self._assignment_to_task.items():
+            if tid == task_id:
+                del self._active_assignments[assignment_id]
+                del self._assignment_to_task[assignment_id]
+                del self._assignment_to_worker[assignment_id]
+                break
+        
+        self._release_worker_task(worker_id, task_id)
+        
+        return True
+    
+    def _release_worker_task(self, worker_id: str, task_id: str) -> None:
+        """Update a worker's state after its assignment for a task ends.
+        
+        The worker goes idle once it has no other assignment outstanding;
+        otherwise ``assigned_task`` moves off the finished task onto one
+        still assigned, so it never names a task the worker is done with.
+        
+        Args:
+            worker_id: Worker the assignment belonged to
+            task_id: Task whose assignment was cleared
+        """
+        info = self._worker_info.get(worker_id)
+        if info is None:
+            return
+        
+        outstanding = [
+            self._assignment_to_task[assignment_id]
+            for assignment_id, assigned_worker in self._assignment_to_worker.items()
+            if assigned_worker == worker_id
+        ]
+        if not outstanding:
+            info.state = "idle"
+            info.assigned_task = None
+            self._active_workers.discard(worker_id)
+        elif info.assigned_task == task_id:
+            info.assigned_task = outstanding[-1]
     
     async def fail_task(self, worker_id: str, task_id: str, error: Dict[str, Any]) -> bool:
         """Mark task as failed.
@@ -634,11 +905,7 @@ class TaskQueue:
                     del self._assignment_to_worker[assignment_id]
                     break
             
-            # Update worker state
-            if worker_id in self._worker_info:
-                self._worker_info[worker_id].state = "idle"
-                self._worker_info[worker_id].assigned_task = None
-                self._active_workers.discard(worker_id)
+            self._release_worker_task(worker_id, task_id)
             
             # Handle retry logic
             retry_count = self._task_retry_counts.get(task_id, 0)
@@ -652,7 +919,10 @@ class TaskQueue:
                 self._task_states[task_id] = TaskState.PENDING
                 self._task_retry_counts[task_id] = retry_count + 1
                 
-                # Re-queue the task
+                # Re-queue the task immediately. backoff_base/backoff_max
+                # are not applied here, so retries never hold a timer; a
+                # delayed retry would belong in one deadline-ordered heap
+                # drained by a single task, not a sleep per retry.
                 priority_queue = self._queues.get(task.priority)
                 if priority_queue is not None:
                     priority_queue.append(task_id)
@@ -670,6 +940,7 @@ class TaskQueue:
                     else:
                         dlq_reason = "retry_exhaustion"
                     
+                    self._dlq_reasons[dlq_reason] += 1
                     self._dlq_metadata[task_id] = {
                         "reason": dlq_reason,
                         "error": error,
@@ -695,6 +966,7 @@ class TaskQueue:
             
             # Update heartbeat timestamp
             self._worker_info[worker_id].last_heartbeat = datetime.now(timezone.utc)
+            self._arm_heartbeat_timer(worker_id)
             
             # If worker was failed, recover it
             if self._worker_info[worker_id].state == "failed":
@@ -732,51 +1004,139 @@ class TaskQueue:
         
         async with self._lock:
             for worker_id in dead_workers:
-                # Mark worker as failed
-                self._worker_info[worker_id].state = "failed"
+                self._fail_worker(worker_id)
+    
+    def _fail_worker(self, worker_id: str) -> None:
+        """Mark a worker as failed and requeue its assigned tasks.
+        
+        Args:
+            worker_id: Worker whose heartbeat has timed out
+        """
+        # Mark worker as failed
+        self._worker_info[worker_id].state = "failed"
+        
+        # Every outstanding assignment, in assignment order; a batch dequeue
+        # leaves several per worker
+        assigned_task_ids = []
+        for assignment_id, assigned_worker in list(self._assignment_to_worker.items()):
+            if assigned_worker == worker_id:
+                assigned_task_ids.append(self._assignment_to_task[assignment_id])
+                del self._active_assignments[assignment_id]
+                del self._assignment_to_task[assignment_id]
+                del self._assignment_to_worker[assignment_id]
+        
+        # A task recorded on the worker without an assignment (e.g. older state)
+        assigned_task_id = self._worker_info[worker_id].assigned_task
+        if assigned_task_id and assigned_task_id not in assigned_task_ids:
+            assigned_task_ids.append(assigned_task_id)
+        
+        for task_id in assigned_task_ids:
+            # Only work still in hand; a finished task must not run again
+            if self._task_states.get(task_id) not in (TaskState.ASSIGNED, TaskState.EXECUTING):
+                continue
+            task = self._tasks.get(task_id)
+            if task:
+                # Reset task state
+                task.state = TaskState.PENDING
+                task.assigned_to = None
+                task.assigned_at = None
+                self._task_states[task_id] = TaskState.PENDING
                 
-                # Handle any assigned task
-                assigned_task_id = self._worker_info[worker_id].assigned_task
-                if assigned_task_id:
-                    task = self._tasks.get(assigned_task_id)
-                    if task:
-                        # Reset task state
-                        task.state = TaskState.PENDING
-                        task.assigned_to = None
-                        task.assigned_at = None
-                        self._task_states[assigned_task_id] = TaskState.PENDING
-                        
-                        # Re-queue the task
-                        priority_queue = self._queues.get(task.priority)
-                        if priority_queue is not None:
-                            priority_queue.append(assigned_task_id)
-                        
-                        # Clear assignment tracking
-                        for assignment_id, tid in list(self._assignment_to_task.items()):
-                            if tid == assigned_task_id:
-                                del self._active_assignments[assignment_id]
-                                del self._assignment_to_task[assignment_id]
-                                del self._assignment_to_worker[assignment_id]
-                                break
-                    
-                    # Clear worker task assignment
-                    self._worker_info[worker_id].assigned_task = None
-                    self._active_workers.discard(worker_id)
+                # Re-queue the task
+                priority_queue = self._queues.get(task.priority)
+                if priority_queue is not None:
+                    priority_queue.append(task_id)
+        
+        if assigned_task_ids:
+            # Clear worker task assignment
+            self._worker_info[worker_id].assigned_task = None
+            self._active_workers.discard(worker_id)
+    
+    def _arm_heartbeat_timer(self, worker_id: str) -> None:
+        """(Re)schedule the heartbeat timeout callback for a worker.
+        
+        Does nothing unless heartbeat monitoring is running.
+        
+        Args:
+            worker_id: Worker whose heartbeat deadline changed
+        """
+        if not self._heartbeat_timers_enabled:
+            return
+        
+        timer = self._hb_timers.pop(worker_id, None)
+        if timer:
+            timer.cancel()
+        
+        info = self._worker_info.get(worker_id)
+        if info is None or info.state == "failed":
+            return
+        
+        elapsed = (datetime.now(timezone.utc) - info.last_heartbeat).total_seconds()
+        delay = max(self.config.heartbeat_timeout - elapsed, 0)
+        self._hb_timers[worker_id] = asyncio.get_running_loop().call_later(
+            delay, self._on_heartbeat_timeout, worker_id
+        )
+    
+    def _on_heartbeat_timeout(self, worker_id: str) -> None:
+        """Timer callback fired when a worker's heartbeat deadline passes."""
+        self._hb_timers.pop(worker_id, None)
+        
+        info = self._worker_info.get(worker_id)
+        if info is None or info.state == "failed":
+            return
+        
+        elapsed = (datetime.now(timezone.utc) - info.last_heartbeat).total_seconds()
+        if elapsed <= self.config.heartbeat_timeout:
+            # Heartbeat was refreshed without re-arming; wait out the remainder
+            self._arm_heartbeat_timer(worker_id)
+            return
+        
+        self._fail_worker(worker_id)
+    
+    def _rearm_heartbeat_timers(self) -> None:
+        """Cancel every heartbeat timer and arm one per known worker.
+        
+        Does nothing unless heartbeat monitoring is running.
+        """
+        if not self._heartbeat_timers_enabled:
+            return
+        
+        for timer in self._hb_timers.values():
+            timer.cancel()
+        self._hb_timers.clear()
+        for worker_id in list(self._worker_info):
+            self._arm_heartbeat_timer(worker_id)
+    
+    def _cancel_heartbeat_timers(self) -> None:
+        """Disable heartbeat timers and cancel any that are pending."""
+        self._heartbeat_timers_enabled = False
+        for timer in self._hb_timers.values():
+            timer.cancel()
+        self._hb_timers.clear()
     
     async def monitor_heartbeats(self) -> None:
-        """Background task to monitor worker heartbeats."""
-        while not self._monitoring_stopped:
-            try:
-                await self.process_dead_workers()
-                await asyncio.sleep(self.config.heartbeat_check_interval)
-            except Exception as e:
-                # Log error but continue monitoring
-                print(f"Error in heartbeat monitoring: {e}")
-                await asyncio.sleep(self.config.heartbeat_check_interval)
+        """Background task to monitor worker heartbeats.
+        
+        Timeouts are detected by per-worker timers, armed when monitoring
+        starts and re-armed on every heartbeat and whenever state is loaded
+        or imported; this task only keeps them enabled until
+        ``stop_monitoring()`` is called.
+        """
+        self._heartbeat_timers_enabled = True
+        self._rearm_heartbeat_timers()
+        
+        try:
+            while not self._monitoring_stopped:
+                self._monitoring_wakeup.clear()
+                await self._monitoring_wakeup.wait()
+        finally:
+            self._cancel_heartbeat_timers()
     
     def stop_monitoring(self) -> None:
         """Stop the heartbeat monitoring task."""
         self._monitoring_stopped = True
+        self._monitoring_wakeup.set()
+        self._cancel_heartbeat_timers()
     
     async def get_heartbeat_metrics(self) -> Dict[str, Any]:
         """Get metrics about worker heartbeats.
@@ -841,11 +1201,8 @@ class TaskQueue:
                     del self._assignment_to_task[assignment_id]
                     del self._assignment_to_worker[assignment_id]
                     
-                    # Update worker state
-                    if worker_id and worker_id in self._worker_info:
-                        self._worker_info[worker_id].state = "idle"
-                        self._worker_info[worker_id].assigned_task = None
-                        self._active_workers.discard(worker_id)
+                    if worker_id:
+                        self._release_worker_task(worker_id, task_id)
     
     async def get_task_info(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a task.
@@ -873,65 +1230,57 @@ class TaskQueue:
                 "progress": self._task_progress.get(task_id, {})
             }
     
-    async def get_queue_statistics(self) -> Dict[str, Any]:
+    def get_queue_statistics(self) -> Dict[str, Any]:
         """Get overall queue statistics.
         
         Returns:
             Dictionary with queue statistics
         """
-        async with self._lock:
-            # Count tasks by priority
-            depth_by_priority = {
-                "high": len(self._queues[3]),
-                "medium": len(self._queues[2]),
-                "low": len(self._queues[1])
-            }
-            
-            # Count tasks by state
-            task_states = {
-                "pending": 0,
-                "assigned": 0,
-                "executing": 0,
-                "completed": 0,
-                "failed": 0
-            }
-            
-            for state in self._task_states.values():
-                task_states[state.value] += 1
-            
-            # Count workers by state
-            worker_stats = {
-                "total": len(self._workers),
-                "idle": len(self._workers - self._active_workers),
-                "active": len(self._active_workers),
-                "failed": sum(1 for info in self._worker_info.values() if info.state == "failed")
-            }
-            
-            # Calculate capacity information
-            current_size = self.size()
-            max_size = self.config.max_queue_size
-            capacity_percentage = (current_size / max_size * 100) if max_size > 0 else 0
-            
-            # Determine capacity status
-            if capacity_percentage >= 100:
-                capacity_status = "full"
-            elif capacity_percentage >= 95:
-                capacity_status = "critical"
-            elif capacity_percentage >= 80:
-                capacity_status = "warning"
-            else:
-                capacity_status = "normal"
-            
-            return {
-                "total_tasks": current_size,
-                "depth_by_priority": depth_by_priority,
-                "task_states": task_states,
-                "worker_stats": worker_stats,
-                "active_assignments": len(self._active_assignments),
-                "capacity_percentage": capacity_percentage,
-                "capacity_status": capacity_status,
-                "displaced_tasks": self._displaced_tasks
-            }
+        # Count tasks by priority
+        depth_by_priority = {
+            "high": len(self._queues[3]),
+            "medium": len(self._queues[2]),
+            "low": len(self._queues[1])
+        }
+        
+        # Count tasks by state
+        task_states = {
+            state.value: count for state, count in self._task_states.counts.items()
+        }
+        
+        # Count workers by state
+        worker_stats = {
+            "total": len(self._workers),
+            "idle": len(self._workers - self._active_workers),
+            "active": len(self._active_workers),
+            "failed": sum(1 for info in self._worker_info.values() if info.state == "failed")
+        }
+        
+        # Calculate capacity information
+        current_size = self.size()
+        max_size = self.config.max_queue_size
+        capacity_percentage = (current_size / max_size * 100) if max_size > 0 else 0
+        
+        # Determine capacity status
+        if capacity_percentage >= 100:
+            capacity_status = "full"
+        elif capacity_percentage >= 95:
+            capacity_status = "critical"
+        elif capacity_percentage >= 80:
+            capacity_status = "warning"
+        else:
+            capacity_status = "normal"
+        
+        return {
+            "total_tasks": current_size,
+            "depth_by_priority": depth_by_priority,
+            "task_states": task_states,
+            "worker_stats": worker_stats,
+            "active_assignments": len(self._active_assignments),
+            "capacity_percentage": capacity_percentage,
+            "capacity_status": capacity_status,
+            "displaced_tasks": self._displaced_tasks
+        }
     
     async def get_throughput_metrics(self) -> Dict[str, Any]:
         """Calculate task throughput metrics.
@@ -998,30 +1347,29 @@ class TaskQueue:
                 "sample_size": len(wait_times)
             }
     
-    async def get_retry_statistics(self) -> Dict[str, Any]:
+    def get_retry_statistics(self) -> Dict[str, Any]:
         """Get statistics on task retries.
         
         Returns:
             Dictionary with retry statistics
         """
-        async with self._lock:
-            total_retries = sum(self._task_retry_counts.values())
-            tasks_with_retries = len(self._task_retry_counts)
-            max_retry_count = max(self._task_retry_counts.values()) if self._task_retry_counts else 0
-            
-            # Count retries by task type
-            retry_by_type = defaultdict(int)
-            for task_id, retry_count in self._task_retry_counts.items():
-                task = self._tasks.get(task_id)
-                if task:
-                    retry_by_type[task.task_type.value] += retry_count
-            
-            return {
-                "total_retries": total_retries,
-                "tasks_with_retries": tasks_with_retries,
-                "max_retry_count": max_retry_count,
-                "retry_by_task_type": dict(retry_by_type)
-            }
+        total_retries = sum(self._task_retry_counts.values())
+        tasks_with_retries = len(self._task_retry_counts)
+        max_retry_count = max(self._task_retry_counts.values()) if self._task_retry_counts else 0
+        
+        # Count retries by task type
+        retry_by_type = defaultdict(int)
+        for task_id, retry_count in self._task_retry_counts.items():
+            task = self._tasks.get(task_id)
+            if task:
+                retry_by_type[task.task_type.value] += retry_count
+        
+        return {
+            "total_retries": total_retries,
+            "tasks_with_retries": tasks_with_retries,
+            "max_retry_count": max_retry_count,
+            "retry_by_task_type": dict(retry_by_type)
+        }
     
     async def get_capacity_statistics(self) -> Dict[str, Any]:
         """Get queue capacity statistics.
@@ -1071,7 +1419,7 @@ class TaskQueue:
             Dictionary with starvation information
         """
         async with self._lock:
-            now = datetime.now(timezone.utc)
+            now = self.config.time_source()
             starvation_threshold = timedelta(seconds=self.config.starvation_threshold)
             
             starved_tasks = 0
@@ -1112,10 +1460,10 @@ class TaskQueue:
             Dictionary with all available metrics
         """
         metrics = {
-            "queue_statistics": await self.get_queue_statistics(),
+            "queue_statistics": self.get_queue_statistics(),
             "throughput_metrics": await self.get_throughput_metrics(),
             "wait_time_statistics": await self.get_wait_time_statistics(),
-            "retry_statistics": await self.get_retry_statistics(),
+            "retry_statistics": self.get_retry_statistics(),
             "capacity_statistics": await self.get_capacity_statistics(),
             "starvation_statistics": await self.get_starvation_statistics(),
             "heartbeat_metrics": await self.get_heartbeat_metrics(),
@@ -1132,16 +1480,7 @@ class TaskQueue:
         """
         async with self._lock:
             metrics = {}
-            
-            # Map task types to agent types
-            task_to_agent = {
-                TaskType.GENERATE_HYPOTHESIS: "Generation",
-                TaskType.REFLECT_ON_HYPOTHESIS: "Reflection",
-                TaskType.RANK_HYPOTHESES: "Ranking",
-                TaskType.EVOLVE_HYPOTHESIS: "Evolution",
-                TaskType.FIND_SIMILAR_HYPOTHESES: "Proximity",
-                TaskType.META_REVIEW: "MetaReview"
-            }
+            task_to_agent = _TASK_TO_AGENT_TYPE
             
             # Initialize metrics for each agent type
             for agent_type in task_to_agent.values():
@@ -1200,15 +1539,19 @@ class TaskQueue:
                 "task_retry_counts": dict(self._task_retry_counts),
                 "task_failure_history": {},
                 "task_progress": dict(self._task_progress),
+                "task_enqueue_times": {},
+                "task_boost_levels": dict(self._task_boost_levels),
                 "workers": {},
                 "assignments": {},
-                "capability_matching_enabled": self._capability_matching_enabled
+                "capability_matching_enabled": self._capability_matching_enabled,
+                "dead_letter_queue": list(self._dead_letter_queue),
+                "dlq_metadata": dict(self._dlq_metadata)
             }
             
             # Serialize tasks
             for task_id, task in self._tasks.items():
                 state["tasks"][task_id] = {
-                    "id": str(task.id),
+                    "id": task.id_str,
                     "task_type": task.task_type.value,
                     "priority": task.priority,
                     "state": task.state.value,
@@ -1225,6 +1568,10 @@ class TaskQueue:
             for task_id, task_state in self._task_states.items():
                 state["task_states"][task_id] = task_state.value
             
+            # Serialize task enqueue times
+            for task_id, enqueue_time in self._task_enqueue_times.items():
+                state["task_enqueue_times"][task_id] = enqueue_time.isoformat()
+            
             # Serialize failure history with datetime conversion
             for task_id, failures in self._task_failure_history.items():
                 serialized_failures = []
@@ -1249,7 +1596,7 @@ class TaskQueue:
             # Serialize active assignments
             for assignment_id, assignment in self._active_assignments.items():
                 state["assignments"][assignment_id] = {
-                    "task_id": str(assignment.task.id),
+                    "task_id": assignment.task.id_str,
                     "assignment_id": assignment.assignment_id,
                     "deadline": assignment.deadline,
                     "acknowledgment_required_by": assignment.acknowledgment_required_by,
@@ -1257,12 +1604,12 @@ class TaskQueue:
                 }
             
             # Write to file atomically
-            import json
-            import os
             temp_path = f"{self.config.persistence_path}.tmp"
             
-            with open(temp_path, 'w') as f:
-                json.dump(state, f, indent=2)
+            # Task payloads may use non-string keys, which json.dump
+            # stringified; orjson only does so with OPT_NON_STR_KEYS
+            with open(temp_path, 'wb') as f:
+                f.write(orjson.dumps(state, option=orjson.OPT_NON_STR_KEYS))
             
             # Atomic rename
             os.replace(temp_path, self.config.persistence_path)
@@ -1278,14 +1625,13 @@ class TaskQueue:
         if not self.config.persistence_path:
             return
         
-        import os
         if not os.path.exists(self.config.persistence_path):
             # No state to load
             return
         
-        import json
-        with open(self.config.persistence_path, 'r') as f:
-            state = json.load(f)
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        with open(self.config.persistence_path, 'rb') as f:
+            state = orjson.loads(f.read())
         
         # Check version compatibility
         if state.get("version") != self._persistence_version:
@@ -1299,12 +1645,17 @@ class TaskQueue:
             self._task_retry_counts.clear()
             self._task_failure_history.clear()
             self._task_progress.clear()
+            self._task_enqueue_times.clear()
+            self._task_boost_levels.clear()
             self._workers.clear()
             self._active_workers.clear()
             self._worker_info.clear()
             self._active_assignments.clear()
             self._assignment_to_task.clear()
             self._assignment_to_worker.clear()
+            self._dead_letter_queue.clear()
+            self._dlq_metadata.clear()
+            self._dlq_reasons.clear()
             
             # Restore tasks
             for task_id, task_data in state.get("tasks", {}).items():
@@ -1333,6 +1684,18 @@ class TaskQueue:
                 if priority:
                     self._queues[priority].extend(task_ids)
             
+            # Restore enqueue times; older state files fall back to creation time
+            for task_id, enqueue_time_str in state.get("task_enqueue_times", {}).items():
+                self._task_enqueue_times[task_id] = datetime.fromisoformat(enqueue_time_str)
+            for queue in self._queues.values():
+                for task_id in queue:
+                    task = self._tasks.get(task_id)
+                    if task_id not in self._task_enqueue_times and task and task.created_at:
+                        self._task_enqueue_times[task_id] = task.created_at
+            
+            # Restore task boost levels
+            self._task_boost_levels.update(state.get("task_boost_levels", {}))
+            
             # Restore retry counts and failure history
             self._task_retry_counts.update(state.get("task_retry_counts", {}))
             
@@ -1381,6 +1744,19 @@ class TaskQueue:
             
             # Restore other settings
             self._capability_matching_enabled = state.get("capability_matching_enabled", False)
+            
+            # Restore dead letter queue and its per-reason counts
+            self._dead_letter_queue.extend(state.get("dead_letter_queue", []))
+            self._dlq_metadata.update(state.get("dlq_metadata", {}))
+            self._dlq_reasons = Counter(
+                metadata.get("reason", "unknown")
+                for metadata in self._dlq_metadata.values()
+            )
+            
+            self._rebuild_aging_index()
+            
+            # Loaded heartbeat timestamps replace the ones the timers were armed for
+            self._rearm_heartbeat_timers()
     
     async def start_persistence(self) -> None:
         """Start automatic periodic persistence."""
@@ -1417,7 +1793,7 @@ class TaskQueue:
                 import traceback
                 traceback.print_exc()
     
-    async def _displace_low_priority_task(self, incoming_priority: int) -> bool:
+    def _displace_low_priority_task(self, incoming_priority: int) -> bool:
         """Displace a lower priority task to make room.
         
         Args:
@@ -1426,7 +1802,6 @@ class TaskQueue:
         Returns:
             True if a task was displaced, False otherwise
         """
-        # Note: This method must be called within a lock
         # Try to displace from lowest priority first
         for priority in [1, 2]:  # Low to medium
             if priority >= incoming_priority:
@@ -1453,17 +1828,16 @@ class TaskQueue:
         
         return False
     
-    async def get_overflow_statistics(self) -> Dict[str, Any]:
+    def get_overflow_statistics(self) -> Dict[str, Any]:
         """Get statistics about task displacement due to overflow.
         
         Returns:
             Dictionary with overflow statistics
         """
-        async with self._lock:
-            return {
-                "total_displaced": self._displaced_tasks,
-                "displacement_by_priority": self._displacement_by_priority.copy()
-            }
+        return {
+            "total_displaced": self._displaced_tasks,
+            "displacement_by_priority": self._displacement_by_priority.copy()
+        }
     
     async def send_heartbeat(self, worker_id: str) -> None:
         """Send heartbeat for a worker.
@@ -1474,8 +1848,9 @@ class TaskQueue:
         async with self._lock:
             if worker_id in self._worker_info:
                 self._worker_info[worker_id].last_heartbeat = datetime.now(timezone.utc)
+                self._arm_heartbeat_timer(worker_id)
     
-    async def get_worker_status(self, worker_id: str) -> Dict[str, Any]:
+    def get_worker_status(self, worker_id: str) -> Dict[str, Any]:
         """Get detailed status of a worker.
         
         Args:
@@ -1484,23 +1859,22 @@ class TaskQueue:
         Returns:
             Dictionary with worker status
         """
-        async with self._lock:
-            if worker_id not in self._worker_info:
-                return {"error": "Worker not found"}
-            
-            worker = self._worker_info[worker_id]
-            now = datetime.now(timezone.utc)
-            time_since_heartbeat = (now - worker.last_heartbeat).total_seconds()
-            
-            return {
-                "id": worker_id,
-                "state": worker.state,
-                "last_heartbeat": worker.last_heartbeat.isoformat(),
-                "time_since_heartbeat": time_since_heartbeat,
-                "assigned_task": worker.assigned_task,
-                "capabilities": worker.capabilities,
-                "failure_reason": "heartbeat_timeout" if worker.state == "failed" and time_since_heartbeat > self.config.heartbeat_timeout else None
-            }
+        if worker_id not in self._worker_info:
+            return {"error": "Worker not found"}
+        
+        worker = self._worker_info[worker_id]
+        now = datetime.now(timezone.utc)
+        time_since_heartbeat = (now - worker.last_heartbeat).total_seconds()
+        
+        return {
+            "id": worker_id,
+            "state": worker.state,
+            "last_heartbeat": worker.last_heartbeat.isoformat(),
+            "time_since_heartbeat": time_since_heartbeat,
+            "assigned_task": worker.assigned_task,
+            "capabilities": worker.capabilities,
+            "failure_reason": "heartbeat_timeout" if worker.state == "failed" and time_since_heartbeat > self.config.heartbeat_timeout else None
+        }
     
     async def mark_worker_failed(self, worker_id: str, reason: str) -> None:
         """Mark a worker as failed and reassign its tasks.
@@ -1523,7 +1897,7 @@ class TaskQueue:
             reassigned_tasks = []
             for assignment_id, assignment in list(self._active_assignments.items()):
                 if assignment.task.assigned_to == worker_id:
-                    task_id = str(assignment.task.id)
+                    task_id = assignment.task.id_str
                     
                     # Reset task state
                     assignment.task.state = TaskState.PENDING
@@ -1554,22 +1928,16 @@ class TaskQueue:
             # Update worker's assigned task
             worker.assigned_task = None
     
-    async def get_dlq_statistics(self) -> Dict[str, Any]:
+    def get_dlq_statistics(self) -> Dict[str, Any]:
         """Get dead letter queue statistics.
         
         Returns:
             Dictionary with DLQ statistics
         """
-        async with self._lock:
-            by_reason = defaultdict(int)
-            for metadata in self._dlq_metadata.values():
-                reason = metadata.get("reason", "unknown")
-                by_reason[reason] += 1
-            
-            return {
-                "total_tasks": len(self._dead_letter_queue),
-                "by_reason": dict(by_reason)
-            }
+        return {
+            "total_tasks": len(self._dead_letter_queue),
+            "by_reason": dict(+self._dlq_reasons)
+        }
     
     async def get_dlq_tasks(self) -> list:
         """Get all tasks in the dead letter queue.
@@ -1611,12 +1979,14 @@ class TaskQueue:
             self._task_states[task_id] = TaskState.PENDING
             self._task_retry_counts[task_id] = 0  # Reset retry count
             
-            # Add back to appropriate queue
+            # Add back to appropriate queue, resuming aging on the next dequeue
             priority_queue = self._queues[task.priority]
             priority_queue.append(task_id)
+            heapq.heappush(self._aging_heap, (self.config.time_source(), task_id))
             
             # Clean up DLQ metadata
-            self._dlq_metadata.pop(task_id, None)
+            metadata = self._dlq_metadata.pop(task_id)
+            self._dlq_reasons[metadata.get("reason", "unknown")] -= 1
             
             return {"success": True, "task_id": task_id}
     
@@ -1648,7 +2018,7 @@ class TaskQueue:
                         assigned_at = assigned_at.replace(tzinfo=timezone.utc)
                     wait_time = (assigned_at - enqueue_time).total_seconds()
                 else:
-                    wait_time = (datetime.now(timezone.utc) - enqueue_time).total_seconds()
+                    wait_time = (self.config.time_source() - enqueue_time).total_seconds()
             
             # Calculate effective priority with boost
             boost_level = self._task_boost_levels.get(task_id, 0.0)
@@ -1684,7 +2054,7 @@ class TaskQueue:
             Dictionary with starvation statistics
         """
         async with self._lock:
-            now = datetime.now(timezone.utc)
+            now = self.config.time_source()
             starvation_threshold = timedelta(seconds=self.config.starvation_threshold)
             
             starved_tasks = 0
@@ -1736,34 +2106,67 @@ class TaskQueue:
                 "tasks_above_threshold": tasks_above_threshold
             }
     
-    async def _apply_priority_boosts(self) -> None:
+    def _apply_priority_boosts(self) -> bool:
         """Apply priority boosts to tasks that have been waiting too long.
         
-        Note: This method must be called within a lock.
+        Only tasks whose next boost interval has elapsed are visited. Tasks
+        that are assigned keep their place in the aging heap, so a requeued
+        task resumes aging at its next interval boundary; completed, failed
+        and removed tasks are dropped from it.
+        
+        Returns:
+            True if any pending task carries a priority boost
         """
-        now = datetime.now(timezone.utc)
+        now = self.config.time_source()
         boost_interval = self.config.priority_boost_interval
         boost_amount = self.config.priority_boost_amount
+        heap = self._aging_heap
         
-        for task_id, enqueue_time in self._task_enqueue_times.items():
-            if self._task_states.get(task_id) == TaskState.PENDING:
-                # Ensure both datetimes are timezone-aware for comparison
-                if enqueue_time.tzinfo is None:
-                    # Convert naive datetime to UTC
-                    enqueue_time = enqueue_time.replace(tzinfo=timezone.utc)
-                wait_time = (now - enqueue_time).total_seconds()
-                
-                # Calculate how many boost intervals have passed
-                boost_intervals_passed = int(wait_time / boost_interval)
+        while heap and heap[0][0] <= now:
+            _, task_id = heapq.heappop(heap)
+            task_state = self._task_states.get(task_id)
+            enqueue_time = self._task_enqueue_times.get(task_id)
+            if enqueue_time is None or task_state in (None, TaskState.COMPLETED, TaskState.FAILED):
+                self._boosted_tasks.discard(task_id)
+                continue
+            
+            # Ensure both datetimes are timezone-aware for comparison
+            if enqueue_time.tzinfo is None:
+                # Convert naive datetime to UTC
+                enqueue_time = enqueue_time.replace(tzinfo=timezone.utc)
+            wait_time = (now - enqueue_time).total_seconds()
+            
+            # Calculate how many boost intervals have passed
+            boost_intervals_passed = int(wait_time / boost_interval)
+            
+            if task_state == TaskState.PENDING and boost_intervals_passed > 0:
+                # Apply boost
+                current_boost = self._task_boost_levels.get(task_id, 0.0)
+                new_boost = boost_intervals_passed * boost_amount
                 
-                if boost_intervals_passed > 0:
-                    # Apply boost
-                    current_boost = self._task_boost_levels.get(task_id, 0.0)
-                    new_boost = boost_intervals_passed * boost_amount
-                    
-                    # Only update if the new boost is higher
-                    if new_boost > current_boost:
-                        self._task_boost_levels[task_id] = new_boost
+                # Only update if the new boost is higher
+                if new_boost > current_boost:
+                    self._task_boost_levels[task_id] = new_boost
+            
+            if self._task_boost_levels.get(task_id, 0.0) > 0:
+                self._boosted_tasks.add(task_id)
+            
+            next_due = enqueue_time + timedelta(seconds=(boost_intervals_passed + 1) * boost_interval)
+            heapq.heappush(heap, (next_due, task_id))
+        
+        return any(
+            self._task_states.get(task_id) == TaskState.PENDING
+            for task_id in self._boosted_tasks
+        )
+    
+    def _rebuild_aging_index(self) -> None:
+        """Rebuild the aging heap and boosted set from restored queue state."""
+        now = self.config.time_source()
+        self._aging_heap = [(now, task_id) for task_id in self._task_enqueue_times]
+        heapq.heapify(self._aging_heap)
+        self._boosted_tasks = {
+            task_id for task_id, boost in self._task_boost_levels.items() if boost > 0
+        }
     
     async def export_state(self) -> Dict[str, Any]:
         """Export current queue state as a dictionary.
@@ -1800,7 +2203,7 @@ class TaskQueue:
             # Serialize tasks
             for task_id, task in self._tasks.items():
                 state["tasks"][task_id] = {
-                    "id": str(task.id),
+                    "id": task.id_str,
                     "task_type": task.task_type.value,
                     "priority": task.priority,
                     "state": task.state.value,
@@ -1845,7 +2248,7 @@ class TaskQueue:
             # Serialize active assignments
             for assignment_id, assignment in self._active_assignments.items():
                 state["assignments"][assignment_id] = {
-                    "task_id": str(assignment.task.id),
+                    "task_id": assignment.task.id_str,
                     "assignment_id": assignment.assignment_id,
                     "deadline": assignment.deadline,
                     "acknowledgment_required_by": assignment.acknowledgment_required_by,
@@ -1898,8 +2301,8 @@ class TaskQueue:
             
             # Add statistics for compatibility
             # Count tasks by state
-            total_completed = sum(1 for s in self._task_states.values() if s == TaskState.COMPLETED)
-            total_failed = sum(1 for s in self._task_states.values() if s == TaskState.FAILED)
+            total_completed = self._task_states.counts[TaskState.COMPLETED]
+            total_failed = self._task_states.counts[TaskState.FAILED]
             total_enqueued = len(self._tasks)  # All tasks that have been added
             
             state["statistics"] = {
@@ -1945,6 +2348,7 @@ class TaskQueue:
             self._assignment_to_worker.clear()
             self._dead_letter_queue.clear()
             self._dlq_metadata.clear()
+            self._dlq_reasons.clear()
             
             # Restore queues
             queues = state.get("queues", {})
@@ -2044,9 +2448,16 @@ class TaskQueue:
             if "dead_letter_queue" in state:
                 self._dead_letter_queue.extend(state["dead_letter_queue"])
             
+            # Imported heartbeat timestamps replace the ones the timers were armed for
+            self._rearm_heartbeat_timers()
+            
             # Restore DLQ metadata
             if "dlq_metadata" in state:
                 self._dlq_metadata.update(state["dlq_metadata"])
+                self._dlq_reasons = Counter(
+                    metadata.get("reason", "unknown")
+                    for metadata in self._dlq_metadata.values()
+                )
             
             # Restore displacement stats
             if "displaced_tasks" in state:
@@ -2073,7 +2484,7 @@ class TaskQueue:
                     if task_data.get("created_at"):
                         task.created_at = datetime.fromisoformat(task_data["created_at"])
                     
-                    task_id = str(task.id)
+                    task_id = task.id_str
                     self._tasks[task_id] = task
                     self._task_states[task_id] = TaskState.PENDING
                     self._queues[task.priority].append(task_id)
@@ -2095,7 +2506,7 @@ class TaskQueue:
                     if task_data.get("started_at"):
                         task.assigned_at = datetime.fromisoformat(task_data["started_at"])
                     
-                    task_id = str(task.id)
+                    task_id = task.id_str
                     self._tasks[task_id] = task
                     self._task_states[task_id] = TaskState.ASSIGNED
                 
@@ -2116,7 +2527,7 @@ class TaskQueue:
                     if task_data.get("completed_at"):
                         task.completed_at = datetime.fromisoformat(task_data["completed_at"])
                     
-                    task_id = str(task.id)
+                    task_id = task.id_str
                     self._tasks[task_id] = task
                     self._task_states[task_id] = TaskState.COMPLETED
                 
@@ -2137,6 +2548,8 @@ class TaskQueue:
                     if task_data.get("failed_at"):
                         task.completed_at = datetime.fromisoformat(task_data["failed_at"])
                     
-                    task_id = str(task.id)
+                    task_id = task.id_str
                     self._tasks[task_id] = task
-                    self._task_states[task_id] = TaskState.FAILED
\ No newline at end of file
+                    self._task_states[task_id] = TaskState.FAILED
+            
+            self._rebuild_aging_index()
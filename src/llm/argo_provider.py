@@ -14,6 +14,10 @@ from src.llm.base import LLMProvider, LLMRequest, LLMResponse, LLMError
 from src.llm.circuit_breaker import CircuitBreaker, CircuitBreakerError, CircuitState
 
 
+# Proxy responses to POST /batch that mean batching is unsupported
+_NO_BATCH_STATUSES = (404, 405, 501)
+
+
 class ArgoConnectionError(Exception):
     """Raised when connection to Argo Gateway fails."""
     pass
@@ -293,6 +297,9 @@ class ModelSelector:
 class ArgoLLMProvider(LLMProvider):
     """LLM Provider implementation for Argo Gateway."""
     
+    # Model used when a request's parameters don't name one
+    DEFAULT_MODEL = "gpt4o"
+    
     def __init__(
         self,
         proxy_url: Optional[str] = None,
@@ -347,6 +354,9 @@ class ArgoLLMProvider(LLMProvider):
             max_wait_time=int(os.getenv("ARGO_QUEUE_MAX_WAIT", "300"))
         )
         
+        # Upper bound on in-flight requests when fanning out a batch
+        self.max_concurrency = int(os.getenv("ARGO_MAX_CONCURRENCY", "4"))
+        
         # Queue processor task
         self._queue_processor_task = None
         self._stop_queue_processor = False
@@ -437,7 +447,7 @@ class ArgoLLMProvider(LLMProvider):
         Returns:
             LLM response
         """
-        model = request.content.get("parameters", {}).get("model", "gpt4o")
+        model = self._request_model(request)
         circuit_breaker = self._circuit_breakers.get(model)
         
         if circuit_breaker and circuit_breaker.is_open():
@@ -482,6 +492,137 @@ class ArgoLLMProvider(LLMProvider):
                 circuit_breaker.record_failure()
             raise
     
+    async def generate_many(self, requests: List[LLMRequest]) -> List[LLMResponse]:
+        """Generate responses for several requests in one round trip.
+
+        All prompts are posted to the proxy's ``/batch`` endpoint together.
+        If the proxy does not support batching, the requests are issued
+        through ``generate`` instead, at most ``max_concurrency`` at a time.
+
+        Args:
+            requests: LLM requests to generate
+
+        Returns:
+            LLM responses in the same order as ``requests``
+        """
+        if not requests:
+            return []
+
+        breakers = {
+            model: self._circuit_breakers[model]
+            for model in {self._request_model(request) for request in requests}
+            if model in self._circuit_breakers
+        }
+        if any(breaker.is_open() for breaker in breakers.values()):
+            # generate() queues the requests whose model circuit is open
+            return await self._generate_bounded(requests)
+
+        payload = {
+            "requests": [
+                {
+                    "custom_id": request.request_id,
+                    "model": self._request_model(request),
+                    "prompt": request.content["prompt"],
+                }
+                for request in requests
+            ]
+        }
+
+        try:
+            response = await self._client.post("/batch", json=payload)
+            if response.status_code not in _NO_BATCH_STATUSES:
+                response.raise_for_status()
+        except httpx.HTTPError as e:
+            # The batch failed for every model it carried
+            for model, breaker in breakers.items():
+                breaker.record_failure()
+                if breaker.is_open():
+                    self.model_selector.mark_model_unavailable(model)
+            raise ArgoConnectionError(f"Batch request failed: {str(e)}") from e
+
+        if response.status_code in _NO_BATCH_STATUSES:
+            # No native batch support - fan out instead
+            return await self._generate_bounded(requests)
+
+        for breaker in breakers.values():
+            breaker.record_success()
+        results = {
+            item.get("custom_id"): item
+            for item in response.json().get("responses", [])
+        }
+        return [
+            self._batch_item_to_response(request, results.get(request.request_id))
+            for request in requests
+        ]
+
+    async def _generate_bounded(self, requests: List[LLMRequest]) -> List[LLMResponse]:
+        """Run ``generate`` for each request with bounded concurrency."""
+        results: List[Optional[LLMResponse]] = [None] * len(requests)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def _run(index: int, request: LLMRequest) -> None:
+            async with semaphore:
+                results[index] = await self.generate(request)
+        
+        try:
+            async with asyncio.TaskGroup() as group:
+                for index, request in enumerate(requests):
+                    group.create_task(_run(index, request))
+        except BaseExceptionGroup as exc_group:
+            # Callers catch the provider's own exceptions, not the group
+            error = exc_group.exceptions[0]
+            while isinstance(error, BaseExceptionGroup):
+                error = error.exceptions[0]
+            raise error from exc_group
+        
+        return results
+
+    def _request_model(self, request: LLMRequest) -> str:
+        """Return the model a request asks for, or DEFAULT_MODEL."""
+        return request.content.get("parameters", {}).get("model", self.DEFAULT_MODEL)
+
+    def _batch_item_to_response(
+        self,
+        request: LLMRequest,
+        item: Optional[Dict[str, Any]]
+    ) -> LLMResponse:
+        """Convert one entry of a batch response to an LLMResponse."""
+        if item is None:
+            return LLMResponse(
+                request_id=request.request_id,
+                status="error",
+                response=None,
+                error=LLMError(
+                    code="MISSING_RESULT",
+                    message="Batch response did not include this request",
+                    recoverable=True
+                )
+            )
+
+        if item.get("error"):
+            error = item["error"]
+            return LLMResponse(
+                request_id=request.request_id,
+                status="error",
+                response=None,
+                error=LLMError(
+                    code=error.get("code", "BATCH_ITEM_FAILED"),
+                    message=error.get("message", "Batch item failed"),
+                    recoverable=error.get("recoverable", True)
+                )
+            )
+
+        model = item.get("model", self._request_model(request))
+        return LLMResponse(
+            request_id=request.request_id,
+            status="success",
+            response={
+                "content": item.get("content", ""),
+                "metadata": {"model_used": model, "batched": True}
+            },
+            error=None
+        )
+
     async def analyze(self, request: LLMRequest) -> LLMResponse:
         """Analyze existing content based on the request.
         
@@ -764,7 +905,7 @@ class ArgoLLMProvider(LLMProvider):
             if not queued_request:
                 break
             
-            model = queued_request.request.content.get("parameters", {}).get("model", "gpt4o")
+            model = self._request_model(queued_request.request)
             circuit_breaker = self._circuit_breakers.get(model)
             
             # Check if circuit breaker has recovered
@@ -10,6 +10,7 @@ from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 import logging
 from datetime import datetime
 
+import baml_py
 from baml_client.baml_client import b
 from baml_client.baml_client.types import (
     AgentRequest,
@@ -29,6 +30,7 @@ from baml_client.baml_client.types import (
 
 from .base import LLMProvider, LLMRequest, LLMResponse
 from .capabilities import ModelCapabilities
+from src.config.model_config import ModelConfig
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +49,27 @@ class BAMLWrapper:
         """
         self.provider = provider
         self._client = b
+        self._client_registries: Dict[str, baml_py.ClientRegistry] = {}
+    
+    def _call_options(self, model: Optional[str]) -> Dict[str, Any]:
+        """Build per-call BAML options that route a call to ``model``.
+        
+        Args:
+            model: Argo model ID (e.g. "claudeopus4") or BAML client name.
+                   None keeps the function's configured client.
+            
+        Returns:
+            Keyword arguments to pass through to the BAML function
+        """
+        if not model:
+            return {}
+        
+        registry = self._client_registries.get(model)
+        if registry is None:
+            registry = baml_py.ClientRegistry()
+            registry.set_primary(ModelConfig.AVAILABLE_MODELS.get(model, model))
+            self._client_registries[model] = registry
+        return {"baml_options": {"client_registry": registry}}
         
     async def generate_hypothesis(
         self,
@@ -55,6 +78,7 @@ class BAMLWrapper:
         existing_hypotheses: List[Hypothesis],
         focus_area: Optional[str] = None,
         generation_method: str = "literature_based",
+        model: Optional[str] = None,
     ) -> Hypothesis:
         """Generate a new hypothesis using BAML.
         
@@ -64,6 +88,7 @@ class BAMLWrapper:
             existing_hypotheses: Already generated hypotheses
             focus_area: Optional specific area to focus on
             generation_method: Method to use for generation
+            model: Optional model to use instead of the configured client
             
         Returns:
             Generated hypothesis
@@ -77,6 +102,7 @@ class BAMLWrapper:
                 existing_hypotheses=existing_hypotheses,
                 focus_area=focus_area,
                 generation_method=generation_method,
+                **self._call_options(model),
             )
             
             logger.info(f"Generated hypothesis: {result.id}")
@@ -96,71 +96,72 @@ class TokenBucketRateLimiter(RateLimiter):
         self.request_bucket_size = config.burst_size or config.requests_per_minute
         self.request_tokens = float(self.request_bucket_size)
         self.request_refill_rate = config.requests_per_minute / 60.0  # per second
-        self.last_request_refill = time.time()
+        self.last_request_refill = time.monotonic()
         
         # Token rate limiting (if configured)
         if config.tokens_per_minute:
             self.token_bucket_size = config.tokens_per_minute
             self.token_tokens = float(self.token_bucket_size)
             self.token_refill_rate = config.tokens_per_minute / 60.0
-            self.last_token_refill = time.time()
+            self.last_token_refill = time.monotonic()
         
         # Concurrent request tracking
         self.concurrent_count = 0
         self.concurrent_lock = asyncio.Lock()
+    
+    # The bucket helpers below never await, so each update runs to completion
+    # on the event loop and needs no lock
+    
+    def _take_request_token(self) -> bool:
+        """Refill the request bucket and take one token if available."""
+        now = time.monotonic()
+        elapsed = now - self.last_request_refill
+        self.request_tokens = min(
+            self.request_bucket_size,
+            self.request_tokens + (elapsed * self.request_refill_rate)
+        )
+        self.last_request_refill = now
         
-        # Thread safety
-        self.request_lock = asyncio.Lock()
-        self.token_lock = asyncio.Lock()
+        if self.request_tokens >= 1:
+            self.request_tokens -= 1
+            return True
+        return False
+    
+    def _take_tokens(self, estimated_tokens: int) -> bool:
+        """Refill the LLM token bucket and take estimated_tokens if available."""
+        now = time.monotonic()
+        elapsed = now - self.last_token_refill
+        self.token_tokens = min(
+            self.token_bucket_size,
+            self.token_tokens + (elapsed * self.token_refill_rate)
+        )
+        self.last_token_refill = now
+        
+        if self.token_tokens >= estimated_tokens:
+            self.token_tokens -= estimated_tokens
+            return True
+        return False
     
     async def acquire(self, raise_on_limit: bool = False) -> bool:
         """Acquire permission to make a request."""
-        async with self.request_lock:
-            # Refill bucket
-            now = time.time()
-            elapsed = now - self.last_request_refill
-            self.request_tokens = min(
-                self.request_bucket_size,
-                self.request_tokens + (elapsed * self.request_refill_rate)
-            )
-            self.last_request_refill = now
-            
-            # Check if we can consume a token
-            if self.request_tokens >= 1:
-                self.request_tokens -= 1
-                return True
-            else:
-                if raise_on_limit:
-                    raise RateLimitExceeded("Request rate limit exceeded")
-                return False
+        if self._take_request_token():
+            return True
+        if raise_on_limit:
+            raise RateLimitExceeded("Request rate limit exceeded")
+        return False
     
     async def acquire_for_request(self, request: LLMRequest, estimated_tokens: Optional[int] = None) -> bool:
         """Acquire permission for a specific request."""
         # Check request rate limit
-        if not await self.acquire():
+        if not self._take_request_token():
             return False
         
         # Check token rate limit if configured
         if self.config.tokens_per_minute and estimated_tokens:
-            async with self.token_lock:
-                # Refill token bucket
-                now = time.time()
-                elapsed = now - self.last_token_refill
-                self.token_tokens = min(
-                    self.token_bucket_size,
-                    self.token_tokens + (elapsed * self.token_refill_rate)
-                )
-                self.last_token_refill = now
-                
-                # Check if we can consume tokens
-                if self.token_tokens >= estimated_tokens:
-                    self.token_tokens -= estimated_tokens
-                    return True
-                else:
-                    # Rollback request token
-                    async with self.request_lock:
-                        self.request_tokens += 1
-                    return False
+            if not self._take_tokens(estimated_tokens):
+                # Rollback request token
+                self.request_tokens += 1
+                return False
         
         return True
     
@@ -1,14 +1,25 @@
 """Shared fixtures for integration tests."""
 
 import asyncio
+import hashlib
+import json
 import tempfile
+import uuid
+from collections import defaultdict
+from enum import Enum
 from pathlib import Path
-from typing import Generator
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Dict, Generator, List, Optional, Tuple
 
 import pytest
 import pytest_asyncio
 
+from src.core.context_memory import ContextMemory
 from src.core.task_queue import TaskQueue, QueueConfig
+from src.llm.argo_provider import ArgoLLMProvider
+
+
+CASSETTE_DIR = Path(__file__).parent / "cassettes"
 
 
 @pytest.fixture
@@ -37,6 +48,64 @@ async def task_queue() -> TaskQueue:
             pass
 
 
+@pytest.fixture
+def task_queue_factory() -> Generator[Callable[..., TaskQueue], None, None]:
+    """Build TaskQueues with a test-specific config.
+    
+    For tests that need their own queue configuration, so they don't also
+    pay for the default ``task_queue`` fixture. Heartbeat monitoring is
+    stopped on every queue built here when the test finishes.
+    """
+    queues = []
+    
+    def factory(config: Optional[QueueConfig] = None) -> TaskQueue:
+        queue = TaskQueue(config=config)
+        queues.append(queue)
+        return queue
+    
+    yield factory
+    for queue in queues:
+        queue.stop_monitoring()
+
+
+@pytest.fixture(scope="module")
+def module_temp_dir(tmp_path_factory) -> Path:
+    """Create one temporary directory shared by every test in a module."""
+    return tmp_path_factory.mktemp("module")
+
+
+@pytest.fixture
+def memory_factory(module_temp_dir: Path) -> Callable[..., Awaitable[ContextMemory]]:
+    """Build initialized ContextMemory instances rooted in a per-test directory.
+    
+    Each test gets a fresh subdirectory of the module's temporary directory,
+    so tests stay isolated without creating and removing a temporary
+    directory apiece. Calling the factory twice with the same name reopens
+    the same storage, e.g. to simulate a restart.
+    """
+    test_dir = module_temp_dir / uuid.uuid4().hex
+    
+    async def factory(name: str = "memory", **kwargs: Any) -> ContextMemory:
+        memory = ContextMemory(storage_path=test_dir / name, **kwargs)
+        await memory.initialize()
+        return memory
+    
+    return factory
+
+
+@pytest.fixture(scope="module")
+def real_llm_provider() -> ArgoLLMProvider:
+    """One Argo provider shared by every real-LLM test in a module."""
+    return ArgoLLMProvider()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def warm_llm(request, real_llm_provider: ArgoLLMProvider) -> None:
+    """Open the gateway connection once so the first test skips the cold start."""
+    if request.config.getoption("--real-llm"):
+        await real_llm_provider.test_connectivity()
+
+
 @pytest.fixture
 def integration_test_timeout() -> int:
     """Default timeout for integration tests."""
@@ -59,4 +128,140 @@ class IntegrationTestBase:
             if await condition_func():
                 return True
             await asyncio.sleep(interval)
-        return False
\ No newline at end of file
+        return False
+
+
+def _jsonable(value: Any) -> Any:
+    """Convert BAML/Pydantic values into plain JSON-compatible data."""
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, dict):
+        return {str(k): _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    return value
+
+
+def _to_namespace(value: Any) -> Any:
+    """Rebuild attribute access on a replayed response."""
+    if isinstance(value, dict):
+        return SimpleNamespace(**{k: _to_namespace(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return [_to_namespace(v) for v in value]
+    return value
+
+
+class LLMCassette:
+    """Recorded BAML function responses for a single test.
+
+    Episodes are matched on the BAML function name plus a hash of the
+    call arguments, and replayed in recording order when the same call
+    is made more than once.
+    """
+
+    def __init__(self, path: Path, record_mode: str):
+        self.path = path
+        self.record_mode = record_mode
+        self._episodes: Dict[str, List[Any]] = {}
+        if path.exists() and record_mode != "all":
+            self._episodes = json.loads(path.read_text())
+        self._cursor: Dict[str, int] = defaultdict(int)
+        self._dirty = False
+
+    @staticmethod
+    def match_key(function_name: str, kwargs: Dict[str, Any]) -> str:
+        """Build the (function, body-hash) key for a call."""
+        body = {k: v for k, v in kwargs.items() if k != "baml_options"}
+        digest = hashlib.sha256(
+            json.dumps(_jsonable(body), sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return f"{function_name}:{digest}"
+
+    def play(self, key: str) -> Tuple[bool, Optional[Any]]:
+        """Return the next recorded response for ``key`` if there is one."""
+        episodes = self._episodes.get(key, [])
+        index = self._cursor[key]
+        if index < len(episodes):
+            self._cursor[key] += 1
+            return True, episodes[index]
+        return False, None
+
+    def record(self, key: str, response: Any) -> None:
+        """Append a live response to the cassette."""
+        self._episodes.setdefault(key, []).append(_jsonable(response))
+        self._cursor[key] += 1
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write newly recorded episodes back to disk."""
+        if self._dirty:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self._episodes, indent=2, sort_keys=True))
+
+
+class _CassetteClient:
+    """Proxy around the BAML client that serves calls from a cassette."""
+
+    def __init__(self, client: Any, cassette: LLMCassette):
+        self._client = client
+        self._cassette = cassette
+
+    def __getattr__(self, name: str) -> Any:
+        # BAML functions are CamelCase; everything else passes straight through
+        if not name[:1].isupper():
+            return getattr(self._client, name)
+
+        async def call(**kwargs: Any) -> Any:
+            key = self._cassette.match_key(name, kwargs)
+            found, response = self._cassette.play(key)
+            if found:
+                return _to_namespace(response)
+            if self._cassette.record_mode == "none":
+                raise LookupError(
+                    f"No recorded response for {name} in {self._cassette.path.name}; "
+                    f"re-record with --real-llm --record-mode=new_episodes"
+                )
+            result = await getattr(self._client, name)(**kwargs)
+            self._cassette.record(key, result)
+            return result
+
+        return call
+
+
+@pytest.fixture(autouse=True)
+def llm_cassette(request, monkeypatch) -> Generator[Optional[LLMCassette], None, None]:
+    """Replay recorded LLM responses for tests marked ``@pytest.mark.vcr``.
+
+    Without ``--real-llm`` the cassette is replayed offline and the test is
+    skipped if nothing has been recorded yet. With ``--real-llm`` the calls
+    go live, and are written to the cassette when ``--record-mode`` is
+    ``new_episodes`` (record missing calls) or ``all`` (re-record).
+    """
+    if request.node.get_closest_marker("vcr") is None:
+        yield None
+        return
+
+    real_llm = request.config.getoption("--real-llm")
+    record_mode = request.config.getoption("--record-mode")
+    path = CASSETTE_DIR / request.path.stem / f"{request.node.name}.json"
+
+    if real_llm and record_mode == "none":
+        # Live run without recording - behave exactly like an unmarked test
+        yield None
+        return
+    if not real_llm:
+        if record_mode != "none":
+            pytest.skip("recording cassettes needs --real-llm option")
+        if not path.exists():
+            pytest.skip(f"no recorded cassette {path.name}; need --real-llm option to run")
+
+    import src.llm.baml_wrapper as baml_wrapper_module
+
+    cassette = LLMCassette(path, record_mode)
+    monkeypatch.setattr(
+        baml_wrapper_module, "b", _CassetteClient(baml_wrapper_module.b, cassette)
+    )
+    yield cassette
+    cassette.save()
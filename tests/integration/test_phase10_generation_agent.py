@@ -5,9 +5,11 @@ through various generation strategies including literature exploration,
 simulated debates, and iterative refinement.
 """
 
+import asyncio
+
 import pytest
-from unittest.mock import AsyncMock, Mock
-from uuid import uuid4
+from unittest.mock import AsyncMock
+from uuid import UUID
 
 from src.agents.generation import GenerationAgent
 from src.core.models import (
@@ -37,12 +39,43 @@ async def mock_dependencies():
 
 @pytest.fixture
 async def generation_agent(mock_dependencies):
-    """Create a GenerationAgent instance with mocked dependencies."""
+    """Create a GenerationAgent instance with mocked dependencies.
+    
+    None of these tests inspect the safety log, so the agent is built
+    without a SafetyLogger rather than writing logs to the shared
+    ``.aicoscientist/safety_logs`` directory on every generation.
+    """
     task_queue, context_memory, llm_provider = mock_dependencies
     return GenerationAgent(
         task_queue=task_queue,
         context_memory=context_memory,
-        llm_provider=llm_provider
+        llm_provider=llm_provider,
+        config={'enable_safety_logging': False}
+    )
+
+
+@pytest.fixture(scope="module")
+def existing_hypothesis():
+    """Create a previously generated hypothesis, shared read-only by the module."""
+    return Hypothesis(
+        id=UUID(int=1),
+        summary="Hypothesis about protein folding",
+        category=HypothesisCategory.MECHANISTIC,
+        full_description="Detailed description...",
+        novelty_claim="Novel insight into chaperone function",
+        assumptions=["Assumption 1"],
+        experimental_protocol=ExperimentalProtocol(
+            objective="Map chaperone-client interactions",
+            methodology="Proximity labeling of chaperone complexes",
+            required_resources=["Mass spectrometer"],
+            timeline="6 months",
+            success_metrics=["Interaction map coverage"],
+            potential_challenges=["Transient interactions"],
+            safety_considerations=["Standard laboratory safety protocols"]
+        ),
+        supporting_evidence=[],
+        confidence_score=0.8,
+        generation_method="literature_based"
     )
 
 
@@ -205,43 +238,22 @@ class TestAssumptionBasedGeneration:
         assert isinstance(hypothesis, Hypothesis)
         assert hypothesis.generation_method == 'assumptions'
         assert len(hypothesis.assumptions) == len(assumptions)
-        assert 'density' in hypothesis.full_description.lower()
+        assert 'density' in hypothesis.description_lower
 
 
 class TestFeedbackBasedGeneration:
     """Test hypothesis generation based on feedback."""
     
     @pytest.mark.integration
-    async def test_feedback_based_generation(self, generation_agent, mock_dependencies):
+    async def test_feedback_based_generation(self, generation_agent, existing_hypothesis):
         """Test generating new hypotheses based on meta-review feedback."""
-        _, context_memory, _ = mock_dependencies
-        
-        # Mock existing hypotheses and feedback
-        existing_hypotheses = [
-            Hypothesis(
-                id=uuid4(),
-                summary="Hypothesis about protein folding",
-                category=HypothesisCategory.MECHANISTIC,
-                full_description="Detailed description...",
-                novelty_claim="Novel insight into chaperone function",
-                assumptions=["Assumption 1"],
-                experimental_protocol=Mock(spec=ExperimentalProtocol),
-                supporting_evidence=[],
-                confidence_score=0.8,
-                generation_method="literature_based"
-            )
-        ]
-        
+        # Feedback is passed directly; generate_from_feedback does not read
+        # it back from context memory
         meta_feedback = {
             'patterns': ['Too focused on single proteins', 'Lacking systems perspective'],
             'suggestions': ['Consider protein networks', 'Explore emergent properties']
         }
         
-        context_memory.get.side_effect = lambda key: {
-            'hypotheses': existing_hypotheses,
-            'meta_review_feedback': meta_feedback
-        }.get(key, [])
-        
         # Generate based on feedback
         hypothesis = await generation_agent.generate_from_feedback(
             research_goal=ResearchGoal(description="Understand protein misfolding diseases"),
@@ -251,8 +263,8 @@ class TestFeedbackBasedGeneration:
         # Verify feedback incorporation
         assert isinstance(hypothesis, Hypothesis)
         assert hypothesis.generation_method == 'expansion'
-        assert 'network' in hypothesis.full_description.lower() or 'system' in hypothesis.full_description.lower()
-        assert hypothesis.id != existing_hypotheses[0].id
+        assert 'network' in hypothesis.description_lower or 'system' in hypothesis.description_lower
+        assert hypothesis.id != existing_hypothesis.id
 
 
 class TestGenerationSafetyChecks:
@@ -297,8 +309,8 @@ class TestGenerationSafetyChecks:
         )
         
         # Verify constraint compliance
-        assert 'natural' in hypothesis.full_description.lower() or 'plant' in hypothesis.full_description.lower()
-        assert 'synthetic' not in hypothesis.full_description.lower()
+        assert 'natural' in hypothesis.description_lower or 'plant' in hypothesis.description_lower
+        assert 'synthetic' not in hypothesis.description_lower
         assert any('effectiveness' in metric.lower() 
                   for metric in hypothesis.experimental_protocol.success_metrics)
 
@@ -390,13 +402,13 @@ class TestGenerationCreativityMetrics:
         )
         
         # Generate multiple hypotheses
-        hypotheses = []
-        for _ in range(5):
-            hypothesis = await generation_agent.generate_hypothesis(
+        hypotheses = await asyncio.gather(*[
+            generation_agent.generate_hypothesis(
                 research_goal=research_goal,
                 generation_method='debate'
             )
-            hypotheses.append(hypothesis)
+            for _ in range(5)
+        ])
         
         # Calculate creativity metrics
         metrics = await generation_agent.calculate_creativity_metrics(hypotheses)
@@ -0,0 +1,68 @@
+"""Phase 10 Real LLM Tests - Generation Agent, co-issued generations.
+
+Runs the same research goals and assertions as
+``test_phase10_generation_real`` but dispatches every generation at once
+from a single agent, so the suite pays for one round of LLM latency
+instead of four sequential ones.
+"""
+
+import asyncio
+
+import pytest
+
+from src.agents.generation import GenerationAgent
+from src.core.task_queue import TaskQueue
+from src.core.context_memory import ContextMemory
+from tests.integration.test_phase10_generation_real import (
+    assert_constraint_adapted_hypotheses,
+    assert_creative_hypothesis,
+    assert_scientifically_valid_hypothesis,
+    constrained_goal,
+    creativity_goal,
+    hightech_goal,
+    validity_goal,
+)
+
+
+pytestmark = pytest.mark.usefixtures("warm_llm")
+
+
+@pytest.mark.real_llm
+@pytest.mark.vcr
+@pytest.mark.asyncio(loop_scope="module")
+class TestGenerationAgentBatchedRealLLM:
+    """Co-issued generation tests with real LLM models."""
+
+    async def test_generation_batch(self, real_llm_provider, tmp_path):
+        """Test creativity, validity and constraint adaptation in one dispatch."""
+        generation_agent = GenerationAgent(
+            task_queue=TaskQueue(),
+            context_memory=ContextMemory(storage_path=tmp_path / "context"),
+            llm_provider=real_llm_provider,
+            config={'enable_safety_logging': False}
+        )
+
+        creative, valid, constrained, hightech = await asyncio.gather(
+            generation_agent.generate_hypothesis(
+                research_goal=creativity_goal(),
+                generation_method='debate',
+                model='gpto3'
+            ),
+            generation_agent.generate_hypothesis(
+                research_goal=validity_goal(),
+                generation_method='literature_based',
+                model='claudeopus4'
+            ),
+            generation_agent.generate_hypothesis(
+                research_goal=constrained_goal(),
+                generation_method='assumptions'
+            ),
+            generation_agent.generate_hypothesis(
+                research_goal=hightech_goal(),
+                generation_method='assumptions'
+            ),
+        )
+
+        assert_creative_hypothesis(creative)
+        assert_scientifically_valid_hypothesis(valid)
+        assert_constraint_adapted_hypotheses(constrained, hightech)
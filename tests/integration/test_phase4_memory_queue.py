@@ -6,30 +6,54 @@ for storing and retrieving state across AI Co-Scientist workflows.
 
 import asyncio
 import json
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, List, Any
 import uuid
 
+import aiofiles
+import orjson
 import pytest
 
 from src.core.context_memory import (
-    ContextMemory, StateUpdate, AgentOutput, MetaReviewStorage,
-    StorageResult, RetrievedState, FeedbackData, RecoveryState
+    StateUpdate, AgentOutput, MetaReviewStorage,
+    StorageResult, RetrievedState, FeedbackData, RecoveryState, iter_ndjson
 )
 from src.core.models import Task, TaskState, TaskType
-from src.core.task_queue import TaskQueue, QueueConfig
+from src.core.task_queue import QueueConfig
 
 
+async def _read_record(path: Path) -> Dict[str, Any]:
+    """Read one stored JSON record without blocking the event loop."""
+    async with aiofiles.open(path, 'rb') as f:
+        return orjson.loads(await f.read())
+
+
+def _make_state(base: datetime, iter_num: int, i: int) -> StateUpdate:
+    """Build the i-th periodic state update of a performance test iteration."""
+    return StateUpdate(
+        timestamp=base + timedelta(milliseconds=iter_num * 1000 + i),
+        update_type="periodic",
+        system_statistics={
+            "iteration": iter_num + 1,
+            "update": i + 1,
+            "data": {"nested": {"values": list(range(100))}}
+        },
+        orchestration_state={
+            "phase": f"phase_{i}",
+            "metrics": {"m1": i * 1.5, "m2": i * 2.5}
+        }
+    )
+
+
+@pytest.mark.asyncio(loop_scope="class")
 class TestMemoryQueueIntegration:
     """Test context memory integration with task queue."""
     
-    @pytest.mark.asyncio
-    async def test_memory_storage_and_retrieval(self, temp_dir: Path):
+    async def test_memory_storage_and_retrieval(self, memory_factory):
         """Test basic memory storage and retrieval operations."""
         # Create memory with custom storage path
-        memory = ContextMemory(storage_path=temp_dir / "memory")
-        await memory.initialize()
+        memory = await memory_factory()
         
         # Store a state update
         state_update = StateUpdate(
@@ -63,12 +87,10 @@ class TestMemoryQueueIntegration:
         assert content["statistics"]["total_hypotheses"] == 10
         assert content["system_state"]["tournament_progress"] == 0.45
     
-    @pytest.mark.asyncio
-    async def test_context_thread_isolation(self, temp_dir: Path):
+    async def test_context_thread_isolation(self, memory_factory):
         """Test that different execution threads maintain isolated context."""
         # Create shared memory instance
-        memory = ContextMemory(storage_path=temp_dir / "shared_memory")
-        await memory.initialize()
+        memory = await memory_factory("shared_memory")
         
         # Start new iteration for thread 1
         iteration1 = await memory.start_new_iteration()
@@ -114,15 +136,15 @@ class TestMemoryQueueIntegration:
         iter2_info = await memory.get_iteration_info(iteration2)
         assert iter2_info["status"] == "active"
     
-    @pytest.mark.asyncio
-    async def test_checkpoint_creation_and_recovery(self, temp_dir: Path):
+    async def test_checkpoint_creation_and_recovery(self, memory_factory, task_queue_factory):
         """Test checkpoint creation and recovery functionality."""
         # Create memory and task queue
-        memory = ContextMemory(storage_path=temp_dir / "memory")
-        await memory.initialize()
+        memory = await memory_factory()
         
-        queue_config = QueueConfig(persistence_path=str(temp_dir / "queue_state.json"))
-        queue = TaskQueue(config=queue_config)
+        queue_config = QueueConfig(
+            persistence_path=str(memory.storage_path.parent / "queue_state.json")
+        )
+        queue = task_queue_factory(queue_config)
         
         # Start an iteration
         iteration = await memory.start_new_iteration()
@@ -174,10 +196,9 @@ class TestMemoryQueueIntegration:
         assert checkpoint_id is not None
         
         # Simulate system restart - create new instances
-        memory2 = ContextMemory(storage_path=temp_dir / "memory")
-        await memory2.initialize()
+        memory2 = await memory_factory()
         
-        queue2 = TaskQueue(config=queue_config)
+        queue2 = task_queue_factory(queue_config)
         
         # Recover from checkpoint
         recovery_state = await memory2.recover_from_checkpoint(checkpoint_id)
@@ -199,12 +220,10 @@ class TestMemoryQueueIntegration:
         assert assignment is not None
         assert assignment.task.payload["research_goal"] == "Test checkpoint"
     
-    @pytest.mark.asyncio
-    async def test_concurrent_write_conflict_resolution(self, temp_dir: Path):
+    async def test_concurrent_write_conflict_resolution(self, memory_factory):
         """Test handling of concurrent writes with conflict resolution."""
         # Create shared memory instance
-        memory = ContextMemory(storage_path=temp_dir / "memory")
-        await memory.initialize()
+        memory = await memory_factory()
         
         # Start an iteration
         await memory.start_new_iteration()
@@ -236,37 +255,32 @@ class TestMemoryQueueIntegration:
         assert len(successful_writes) == 3
         
         # Verify all writes were stored (check the iteration directory)
-        iteration_dir = memory.storage_path / "iterations" / "iteration_001"
+        iteration_dir = memory.iteration_path(1)
         state_files = list(iteration_dir.glob("system_state_*.json"))
         assert len(state_files) >= 3  # At least our 3 concurrent writes
         
         # Read and verify each file has unique content
-        writers_found = set()
-        for state_file in state_files:
-            with open(state_file, 'r') as f:
-                data = json.load(f)
-                if "writer_id" in data:
-                    writers_found.add(data["writer_id"])
+        records = await asyncio.gather(*map(_read_record, state_files))
+        writers_found = {data["writer_id"] for data in records if "writer_id" in data}
         
         # Should find all our writers
         assert "supervisor_1" in writers_found
         assert "supervisor_2" in writers_found
         assert "supervisor_3" in writers_found
     
-    @pytest.mark.asyncio
-    async def test_memory_version_history(self, temp_dir: Path):
+    async def test_memory_version_history(self, memory_factory):
         """Test version history tracking for memory updates."""
-        memory = ContextMemory(storage_path=temp_dir / "memory")
-        await memory.initialize()
+        memory = await memory_factory(state_layout="log")
         
         # Start iteration
         iteration = await memory.start_new_iteration()
         
         # Store multiple versions of state
         versions = []
+        base = datetime.now(timezone.utc)
         for i in range(5):
             state = StateUpdate(
-                timestamp=datetime.now(timezone.utc),
+                timestamp=base + timedelta(milliseconds=i),
                 update_type="periodic",
                 system_statistics={
                     "version": i + 1,
@@ -281,39 +295,33 @@ class TestMemoryQueueIntegration:
             result = await memory.store_state_update(state)
             assert result.success is True
             versions.append(result.storage_path)
-            
-            # Small delay to ensure different timestamps
-            await asyncio.sleep(0.01)
         
         # Verify we can access version history
-        iteration_dir = memory.storage_path / "iterations" / f"iteration_{iteration:03d}"
-        state_files = sorted(iteration_dir.glob("system_state_*.json"))
-        assert len(state_files) >= 5
+        await memory.flush()
+        iteration_dir = memory.iteration_path(iteration)
+        records = list(iter_ndjson(iteration_dir / "updates.ndjson"))
+        assert len(records) >= 5
         
         # Verify chronological ordering
-        timestamps = []
-        for state_file in state_files:
-            with open(state_file, 'r') as f:
-                data = json.load(f)
-                timestamps.append(datetime.fromisoformat(data["timestamp"]))
+        timestamps = [datetime.fromisoformat(data["timestamp"]) for data in records]
+        sequences = [data["sequence"] for data in records]
         
-        # Timestamps should be in ascending order
+        # Timestamps and write sequence numbers should be in ascending order
         assert timestamps == sorted(timestamps)
+        assert sequences == sorted(sequences)
         
         # Verify latest retrieval gets most recent version
         latest = await memory.retrieve_state("latest")
         assert latest.content["statistics"]["version"] == 5
         assert latest.content["statistics"]["iteration_progress"] == 1.0
+        await memory.close()
     
-    @pytest.mark.asyncio
-    async def test_storage_overflow_handling(self, temp_dir: Path):
+    async def test_storage_overflow_handling(self, memory_factory):
         """Test handling when storage approaches capacity limits."""
         # Create memory with very small storage limit
-        memory = ContextMemory(
-            storage_path=temp_dir / "memory",
+        memory = await memory_factory(
             max_storage_gb=0.0001  # 100KB limit for testing
         )
-        await memory.initialize()
         
         # Try to store large amounts of data
         large_data = {
@@ -348,11 +356,9 @@ class TestMemoryQueueIntegration:
         latest = await memory.retrieve_state("latest")
         assert latest is not None
     
-    @pytest.mark.asyncio
-    async def test_agent_memory_integration(self, temp_dir: Path):
+    async def test_agent_memory_integration(self, memory_factory):
         """Test memory integration with agent outputs (may fail)."""
-        memory = ContextMemory(storage_path=temp_dir / "memory")
-        await memory.initialize()
+        memory = await memory_factory()
         
         # Start iteration
         await memory.start_new_iteration()
@@ -384,32 +390,20 @@ class TestMemoryQueueIntegration:
             assert agent_type in memory._component_index
             assert len(memory._component_index[agent_type]) >= 1
     
-    @pytest.mark.asyncio 
-    async def test_memory_retrieval_performance(self, temp_dir: Path):
+    async def test_memory_retrieval_performance(self, memory_factory):
         """Test memory retrieval performance with large datasets (may fail)."""
-        memory = ContextMemory(storage_path=temp_dir / "memory")
-        await memory.initialize()
+        memory = await memory_factory(state_layout="log")
         
         # Create multiple iterations with lots of data
+        base = datetime.now(timezone.utc)
         for iter_num in range(5):
             await memory.start_new_iteration()
             
             # Store many state updates
-            for i in range(20):
-                state = StateUpdate(
-                    timestamp=datetime.now(timezone.utc),
-                    update_type="periodic",
-                    system_statistics={
-                        "iteration": iter_num + 1,
-                        "update": i + 1,
-                        "data": {"nested": {"values": list(range(100))}}
-                    },
-                    orchestration_state={
-                        "phase": f"phase_{i}",
-                        "metrics": {"m1": i * 1.5, "m2": i * 2.5}
-                    }
-                )
-                await memory.store_state_update(state)
+            results = await asyncio.gather(*(
+                memory.store_state_update(_make_state(base, iter_num, i)) for i in range(20)
+            ))
+            assert all(r.success for r in results)
             
             # Complete iteration
             await memory.complete_iteration(
@@ -435,16 +429,14 @@ class TestMemoryQueueIntegration:
         
         assert len(iterations) == 5
         assert list_time < 0.5  # Should list in under 500ms
+        await memory.close()
     
-    @pytest.mark.asyncio
-    async def test_periodic_archive_rotation(self, temp_dir: Path):
+    async def test_periodic_archive_rotation(self, memory_factory):
         """Test automatic archival of old data (may fail)."""
         # Create memory with short retention
-        memory = ContextMemory(
-            storage_path=temp_dir / "memory",
+        memory = await memory_factory(
             retention_days=0  # Archive immediately for testing
         )
-        await memory.initialize()
         
         # Create old iteration
         iter1 = await memory.start_new_iteration()
@@ -475,14 +467,12 @@ class TestMemoryQueueIntegration:
         assert len(archived_files) == 1
         
         # Verify active iteration is not archived
-        active_dir = memory.storage_path / "iterations" / f"iteration_{iter2:03d}"
+        active_dir = memory.iteration_path(iter2)
         assert active_dir.exists()
     
-    @pytest.mark.asyncio
-    async def test_garbage_collection(self, temp_dir: Path):
+    async def test_garbage_collection(self, memory_factory):
         """Test garbage collection of orphaned data (may fail)."""
-        memory = ContextMemory(storage_path=temp_dir / "memory")
-        await memory.initialize()
+        memory = await memory_factory()
         
         # Create some orphaned files manually
         orphan_dir = memory.storage_path / "iterations" / "orphaned_data"
@@ -504,5 +494,5 @@ class TestMemoryQueueIntegration:
         assert not orphan_dir.exists()  # Directory should be removed too
         
         # Valid iteration should remain
-        valid_dir = memory.storage_path / "iterations" / "iteration_001"
+        valid_dir = memory.iteration_path(1)
         assert valid_dir.exists()
\ No newline at end of file
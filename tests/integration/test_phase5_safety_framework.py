@@ -5,13 +5,12 @@ Focuses on logging, monitoring, and safety metrics collection.
 """
 
 import asyncio
+import itertools
 import json
 import os
-import shutil
-import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
-from uuid import uuid4
+from uuid import UUID
 
 import pytest
 
@@ -38,77 +37,123 @@ from src.core.safety import (
 from src.core.task_queue import QueueConfig, TaskQueue
 
 
+# Test records take ids and creation times from one counter rather than
+# calling uuid4() and reading the clock for each of them
+_record_counter = itertools.count(1)
+_BASE_TIME = datetime(2024, 1, 1)
+
+
+def next_created_at() -> datetime:
+    """Return a unique, increasing creation time for a test record."""
+    return _BASE_TIME + timedelta(microseconds=next(_record_counter))
+
+
+# Built once: model_copy() per call skips rebuilding the validated
+# ExperimentalProtocol and Citation that every test hypothesis shares
+_TEMPLATE_HYPOTHESIS = Hypothesis.model_construct(
+    summary="Template hypothesis",
+    category=HypothesisCategory.MECHANISTIC,
+    full_description="Full description: Template hypothesis",
+    novelty_claim="This is a novel approach",
+    assumptions=["Test assumption 1", "Test assumption 2"],
+    experimental_protocol=ExperimentalProtocol(
+        objective="Test the hypothesis",
+        methodology="Standard testing methodology",
+        required_resources=["Laboratory", "Equipment"],
+        timeline="6 months",
+        success_metrics=["Metric 1", "Metric 2"],
+        potential_challenges=["Challenge 1"],
+        safety_considerations=["Safety consideration 1"],
+    ),
+    supporting_evidence=[
+        Citation(
+            authors=["Test Author"],
+            title="Test Paper",
+            year=2023,
+            journal="Test Journal",
+        )
+    ],
+    confidence_score=0.85,
+    generation_method="test_generation",
+)
+
+
 def create_test_hypothesis(
     id_suffix: str, statement: str, rationale: str = "Test rationale"
 ) -> Hypothesis:
-    """Create a test hypothesis with minimal required fields."""
-    return Hypothesis(
-        summary=statement,
-        category=HypothesisCategory.MECHANISTIC,
-        full_description=f"Full description: {statement}",
-        novelty_claim="This is a novel approach",
-        assumptions=["Test assumption 1", "Test assumption 2"],
-        experimental_protocol=ExperimentalProtocol(
-            objective="Test the hypothesis",
-            methodology="Standard testing methodology",
-            required_resources=["Laboratory", "Equipment"],
-            timeline="6 months",
-            success_metrics=["Metric 1", "Metric 2"],
-            potential_challenges=["Challenge 1"],
-            safety_considerations=["Safety consideration 1"],
-        ),
-        supporting_evidence=[
-            Citation(
-                authors=["Test Author"],
-                title="Test Paper",
-                year=2023,
-                journal="Test Journal",
-            )
-        ],
-        confidence_score=0.85,
-        generation_method="test_generation",
+    """Create a test hypothesis with minimal required fields.
+
+    The inputs are fixed and known to be valid, so hypotheses are shallow
+    copies of ``_TEMPLATE_HYPOTHESIS`` with a counter-based id and skip field
+    validation; the Hypothesis validators themselves are covered by
+    ``tests/unit/test_hypothesis_model.py``. Nested fields are shared
+    between copies and must not be mutated.
+    """
+    return _TEMPLATE_HYPOTHESIS.model_copy(update={
+        "id": UUID(int=next(_record_counter)),
+        "summary": statement,
+        "full_description": f"Full description: {statement}",
+    })
+
+
+@pytest.fixture(scope="module")
+def shared_dir(tmp_path_factory) -> Path:
+    """Directory for the fixtures shared by every test in the module."""
+    return tmp_path_factory.mktemp("phase5")
+
+
+@pytest.fixture(scope="module")
+async def safety_logger(shared_dir):
+    """Create a safety logger shared by the module."""
+    config = SafetyConfig(
+        enabled=True,
+        log_directory=shared_dir / "safety_logs",
+        trust_level="standard",
     )
+    logger = SafetyLogger(config)
+    yield logger
+    await logger.aclose()
 
 
-class TestPhase5SafetyFramework:
-    """Test suite for Phase 5: Safety Framework integration."""
+@pytest.fixture(scope="module")
+async def task_queue():
+    """Create a task queue shared by the module."""
+    config = QueueConfig(
+        max_queue_size=10000,
+        worker_timeout=60,
+    )
+    queue = TaskQueue(config)
+    await queue.initialize()
+    yield queue
+    queue.stop_monitoring()
 
-    @pytest.fixture
-    async def temp_dir(self):
-        """Create a temporary directory for tests."""
-        temp_dir = tempfile.mkdtemp()
-        yield temp_dir
-        shutil.rmtree(temp_dir, ignore_errors=True)
 
-    @pytest.fixture
-    async def safety_logger(self, temp_dir):
-        """Create a safety logger instance."""
-        config = SafetyConfig(
-            enabled=True,
-            log_directory=Path(temp_dir) / "safety_logs",
-            trust_level="standard",
-        )
-        logger = SafetyLogger(config)
-        yield logger
-        # SafetyLogger doesn't need explicit close
+@pytest.fixture(scope="module")
+async def context_memory(shared_dir):
+    """Create a context memory shared by the module."""
+    memory = ContextMemory(storage_path=shared_dir / "memory")
+    yield memory
 
-    @pytest.fixture
-    async def task_queue(self, temp_dir):
-        """Create a task queue instance."""
-        config = QueueConfig(
-            max_queue_size=10000,
-            worker_timeout=60,
-        )
-        queue = TaskQueue(config)
-        await queue.initialize()
-        yield queue
-        # TaskQueue doesn't have shutdown method
+
+class TestPhase5SafetyFramework:
+    """Test suite for Phase 5: Safety Framework integration."""
 
     @pytest.fixture
-    async def context_memory(self, temp_dir):
-        """Create a context memory instance."""
-        memory = ContextMemory(storage_path=Path(temp_dir) / "memory")
-        yield memory
+    def temp_dir(self, tmp_path_factory):
+        """Create a temporary directory for tests.
+
+        Left in place after the test; pytest's base temp retention removes it.
+        """
+        return tmp_path_factory.mktemp("safety_test")
+
+    @pytest.fixture(autouse=True)
+    async def reset_shared_state(self, safety_logger, task_queue, context_memory):
+        """Start each test with an empty queue, key-value store and safety log."""
+        await task_queue.purge()
+        await context_memory.clear()
+        await safety_logger.flush()
+        for log_file in safety_logger.log_directory.glob("*.json"):
+            log_file.unlink()
 
     @pytest.fixture
     async def safety_middleware(self, safety_logger):
@@ -123,7 +168,7 @@ class TestPhase5SafetyFramework:
             id="rg_001",
             description="Develop new cancer treatment approaches",
             constraints=["Must be ethical", "Focus on immunotherapy"],
-            created_at=datetime.now(),
+            created_at=next_created_at(),
         )
 
         # Log the research goal
@@ -193,44 +238,42 @@ class TestPhase5SafetyFramework:
         # Integration tests focus on API interaction
 
     @pytest.mark.asyncio
-    async def test_trust_level_configuration(self, temp_dir):
+    @pytest.mark.parametrize("trust_level", ["trusted", "standard", "restricted"])
+    async def test_trust_level_configuration(self, temp_dir, trust_level):
         """Test different trust level configurations."""
-        trust_levels = ["trusted", "standard", "restricted"]
+        config = SafetyConfig(
+            enabled=True,
+            log_directory=Path(temp_dir) / f"safety_logs_{trust_level}",
+            trust_level=trust_level,
+        )
+        logger = SafetyLogger(config)
         
-        for trust_level in trust_levels:
-            config = SafetyConfig(
-                enabled=True,
-                log_directory=Path(temp_dir) / f"safety_logs_{trust_level}",
-                trust_level=trust_level,
-            )
-            logger = SafetyLogger(config)
-            
-            # Trust level should affect logging behavior
-            assert logger.config.trust_level == trust_level
-            
-            # Log a test hypothesis
-            hypothesis = create_test_hypothesis(
-                trust_level,
-                f"Test hypothesis for {trust_level}",
-                "Testing trust levels",
-            )
-            
-            hypothesis_data = {
-                "hypothesis_id": str(hypothesis.id),
-                "statement": hypothesis.summary,
-                "trust_level": trust_level,
-            }
-            safety_check = await logger.log_hypothesis(hypothesis_data)
-            
-            # All trust levels should log successfully
-            assert safety_check.decision == SafetyLevel.SAFE
-            
-            # In restricted mode, we might want stricter checks
-            if trust_level == "restricted":
-                # Verify the trust level affects the configuration
-                assert logger.config.trust_level == "restricted"
-            
-            # SafetyLogger doesn't need explicit close
+        # Trust level should affect logging behavior
+        assert logger.config.trust_level == trust_level
+        
+        # Log a test hypothesis
+        hypothesis = create_test_hypothesis(
+            trust_level,
+            f"Test hypothesis for {trust_level}",
+            "Testing trust levels",
+        )
+        
+        hypothesis_data = {
+            "hypothesis_id": str(hypothesis.id),
+            "statement": hypothesis.summary,
+            "trust_level": trust_level,
+        }
+        safety_check = await logger.log_hypothesis(hypothesis_data)
+        
+        # All trust levels should log successfully
+        assert safety_check.decision == SafetyLevel.SAFE
+        
+        # In restricted mode, we might want stricter checks
+        if trust_level == "restricted":
+            # Verify the trust level affects the configuration
+            assert logger.config.trust_level == "restricted"
+        
+        await logger.aclose()
 
     @pytest.mark.asyncio
     async def test_safety_logger_disable(self, temp_dir):
@@ -248,7 +291,7 @@ class TestPhase5SafetyFramework:
             id="rg_disabled",
             description="This should not be logged",
             constraints=[],
-            created_at=datetime.now(),
+            created_at=next_created_at(),
         )
         safety_check = await logger.log_research_goal(
             goal.description, 
@@ -259,7 +302,8 @@ class TestPhase5SafetyFramework:
         assert safety_check.decision == SafetyLevel.SAFE
         assert safety_check.reasoning == "Safety logging disabled"
 
-        # Verify no logs were created
+        # Verify nothing was queued for writing and no logs were created
+        assert logger._write_queue is None
         assert not Path(logger.config.log_directory).exists()
 
     @pytest.mark.asyncio
@@ -309,7 +353,7 @@ class TestPhase5SafetyFramework:
             id="rg_audit",
             description="Investigate novel drug delivery systems",
             constraints=["FDA approved materials only"],
-            created_at=datetime.now(),
+            created_at=next_created_at(),
         )
         context = {
             "goal_id": goal.id,
@@ -383,7 +427,7 @@ class TestPhase5SafetyFramework:
                     id=f"rg_metrics_{description[:10]}",
                     description=description,
                     constraints=[],
-                    created_at=datetime.now(),
+                    created_at=next_created_at(),
                 )
                 context = {
                     "goal_id": goal.id,
@@ -432,18 +476,20 @@ class TestPhase5SafetyFramework:
         rotation_manager = LogRotationManager(config)
         
         # Generate enough logs to trigger rotation
+        payloads = []
         for i in range(100):
             hyp = create_test_hypothesis(
                 f"rotation_{i}",
                 f"Long hypothesis statement to fill up log space quickly {' ' * 100}",
                 "Testing rotation",
             )
-            hypothesis_data = {
+            payloads.append({
                 "hypothesis_id": str(hyp.id),
                 "statement": hyp.summary,
                 "index": i,
-            }
-            await logger.log_hypothesis(hypothesis_data)
+            })
+        await asyncio.gather(*(logger.log_hypothesis(p) for p in payloads))
+        await logger.aclose()
         
         # Perform rotation - need to get log files first
         log_files = list(Path(config.log_directory).glob("*.jsonl"))
@@ -465,12 +511,10 @@ class TestPhase5SafetyFramework:
         self, safety_logger, task_queue, context_memory
     ):
         """Test performance impact of safety logging (may fail)."""
+        import gc
         import time
         
-        # Measure baseline performance without safety
-        start_time = time.time()
-        
-        for i in range(100):
+        async def baseline_step(i: int) -> None:
             task = Task(
                 task_type=TaskType.GENERATE_HYPOTHESIS,
                 priority=2,  # Medium priority
@@ -479,21 +523,13 @@ class TestPhase5SafetyFramework:
             await task_queue.enqueue(task)
             await context_memory.set(f"perf_test_key_{i}", {"data": i})
         
-        baseline_time = time.time() - start_time
-        
-        # Clear queue
-        # Note: TaskQueue doesn't have a clear method in current implementation
-        
-        # Measure with safety logging
-        start_time = time.time()
-        
-        for i in range(100):
+        async def safety_step(i: int) -> None:
             # Add safety logging
             goal = ResearchGoal(
                 id=f"rg_perf_{i}",
                 description=f"Performance test goal {i}",
                 constraints=[],
-                created_at=datetime.now(),
+                created_at=next_created_at(),
             )
             context = {
                 "goal_id": goal.id,
@@ -524,7 +560,27 @@ class TestPhase5SafetyFramework:
                 f"perf_test_safe_key_{i}", {"data": i, "hypothesis_id": str(hyp.id)}
             )
         
-        safety_time = time.time() - start_time
+        # Keep collector pauses out of both measurements
+        gc.collect()
+        gc.disable()
+        try:
+            # Measure baseline performance without safety
+            start_time = time.perf_counter()
+            async with context_memory.batch():
+                await asyncio.gather(*(baseline_step(i) for i in range(100)))
+            baseline_time = time.perf_counter() - start_time
+            
+            # Start the safety run from the same empty queue and store
+            await task_queue.purge()
+            await context_memory.clear()
+            
+            # Measure with safety logging
+            start_time = time.perf_counter()
+            async with context_memory.batch():
+                await asyncio.gather(*(safety_step(i) for i in range(100)))
+            safety_time = time.perf_counter() - start_time
+        finally:
+            gc.enable()
         
         # Safety overhead should be reasonable (less than 50% slower)
         overhead_ratio = safety_time / baseline_time
@@ -533,10 +589,11 @@ class TestPhase5SafetyFramework:
         # In production, this would be much lower with proper async I/O
         assert overhead_ratio < 10.0, f"Safety overhead too high: {overhead_ratio:.2f}x slower"
         
-        # Verify all operations completed successfully
-        # TaskQueue doesn't have get_stats in current implementation
-        # Just verify we didn't crash
-        assert True  # All operations completed without errors
+        # Verify all operations of the safety run completed successfully
+        stats = task_queue.get_queue_statistics()
+        assert stats["total_tasks"] == 100
+        assert stats["depth_by_priority"]["medium"] == 100
+        assert len(await context_memory.list_keys("perf_test_safe_key_")) == 100
 
 
 if __name__ == "__main__":
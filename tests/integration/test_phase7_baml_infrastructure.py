@@ -16,10 +16,16 @@ import os
 from src.llm.baml_wrapper import BAMLWrapper
 from baml_client.baml_client.types import (
     AgentType,
+    AssumptionDecomposition,
+    Citation,
+    ExperimentalProtocol,
+    FailurePoint,
     Hypothesis,
+    ReviewScores,
     ReviewType,
     ReviewDecision,
     SafetyLevel,
+    SimulationResults,
     HypothesisCategory,
 )
 
@@ -54,8 +60,6 @@ class TestPhase7BAMLInfrastructure:
         assert HypothesisCategory.Therapeutic.value == "Therapeutic"
         
         # Test that we can instantiate the types
-        from baml_client.baml_client.types import ExperimentalProtocol
-        
         protocol = ExperimentalProtocol(
             objective="Test objective",
             methodology="Test methodology",
@@ -214,15 +218,6 @@ class TestPhase7BAMLInfrastructure:
         
         Must Pass: Critical for full functionality
         """
-        from baml_client.baml_client.types import (
-            ExperimentalProtocol,
-            Citation,
-            ReviewScores,
-            AssumptionDecomposition,
-            FailurePoint,
-            SimulationResults,
-        )
-        
         # Create complex nested structures
         protocol = ExperimentalProtocol(
             objective="Test objective",
@@ -9,16 +9,17 @@ from src.agents.supervisor import SupervisorAgent
 from src.core.models import Task, TaskState, TaskType, utcnow
 from src.core.task_queue import TaskQueue, QueueConfig
 from src.core.context_memory import ContextMemory
-from src.llm.mock_provider import MockLLMProvider
+from src.llm.mock_provider import MockConfiguration, MockLLMProvider
 
 
-@pytest.fixture
-async def test_environment(tmp_path):
-    """Create a test environment with real components."""
-    # Initialize real components
+@pytest.fixture(scope="module")
+def shared_components(tmp_path_factory):
+    """Create the components that are expensive to build once per module."""
+    storage_root = tmp_path_factory.mktemp("phase9")
+    
     queue_config = QueueConfig(
         max_queue_size=10000,
-        persistence_path=str(tmp_path / "queue_state.json"),
+        persistence_path=str(storage_root / "queue_state.json"),
         auto_recovery=False,
         auto_start_persistence=False,
         auto_start_monitoring=False
@@ -26,23 +27,48 @@ async def test_environment(tmp_path):
     task_queue = TaskQueue(config=queue_config)
     
     context_memory = ContextMemory(
-        storage_path=tmp_path / "context_memory",
-        retention_days=7
+        storage_path=storage_root / "context_memory",
+        retention_days=7,
+        backend="memory"
     )
     
-    llm_provider = MockLLMProvider()
+    llm_provider = MockLLMProvider(configuration=MockConfiguration(default_delay=0.0))
+    
+    return {
+        'task_queue': task_queue,
+        'context_memory': context_memory,
+        'empty_memory': context_memory.snapshot(),
+        'llm_provider': llm_provider
+    }
+
+
+async def _reset_state(context_memory: ContextMemory, empty_memory: str) -> None:
+    """Return the shared context memory to the initial research state."""
+    await context_memory.restore(empty_memory)
     
     # Initialize context memory with research goal
-    await context_memory.set('research_goal', 'Develop new antimicrobial compounds')
-    await context_memory.set('system_state', {
-        'current_iteration': 1,
-        'hypothesis_count': 0
+    await context_memory.batch_set({
+        'research_goal': 'Develop new antimicrobial compounds',
+        'system_state': {
+            'current_iteration': 1,
+            'hypothesis_count': 0
+        }
     })
+
+
+@pytest.fixture
+async def test_environment(tmp_path, shared_components):
+    """Create a test environment with real components."""
+    task_queue = shared_components['task_queue']
+    await task_queue.purge()
+    
+    context_memory = shared_components['context_memory']
+    await _reset_state(context_memory, shared_components['empty_memory'])
     
     yield {
         'task_queue': task_queue,
         'context_memory': context_memory,
-        'llm_provider': llm_provider,
+        'llm_provider': shared_components['llm_provider'],
         'tmp_path': tmp_path
     }
     
@@ -95,7 +121,7 @@ class TestTaskCreation:
         assert task.payload['goal'] == 'Test goal'
         
         # Verify task is in queue
-        queue_stats = await test_environment['task_queue'].get_queue_statistics()
+        queue_stats = test_environment['task_queue'].get_queue_statistics()
         assert queue_stats['task_states']['pending'] == 1
     
     @pytest.mark.asyncio
@@ -128,7 +154,7 @@ class TestTaskCreation:
         assert len(unique_types) >= 2  # Should have at least 2 different types
         
         # Verify all tasks are in queue
-        queue_stats = await test_environment['task_queue'].get_queue_statistics()
+        queue_stats = test_environment['task_queue'].get_queue_statistics()
         assert queue_stats['task_states']['pending'] == 10
 
 
@@ -221,20 +247,22 @@ class TestProgressMonitoring:
         )
         
         # Set up some test data
-        await test_environment['context_memory'].set('hypotheses', [
-            {'id': f'hyp-{i}', 'state': 'reviewed'} for i in range(5)
-        ])
-        await test_environment['context_memory'].set('reviews', [
-            {'id': f'rev-{i}'} for i in range(3)
-        ])
+        await test_environment['context_memory'].batch_set({
+            'hypotheses': [
+                {'id': f'hyp-{i}', 'state': 'reviewed'} for i in range(5)
+            ],
+            'reviews': [{'id': f'rev-{i}'} for i in range(3)]
+        })
         
         # Create some tasks
-        for i in range(3):
-            await supervisor.create_task(
+        await asyncio.gather(*[
+            supervisor.create_task(
                 agent_type='generation',
                 priority=2,  # Medium priority
                 parameters={'test': i}
             )
+            for i in range(3)
+        ])
         
         # Calculate metrics
         metrics = await supervisor.calculate_system_metrics()
@@ -319,14 +347,14 @@ class TestRecoveryMechanisms:
         )
         
         # Create some tasks
-        tasks = []
-        for i in range(3):
-            task = await supervisor.create_task(
+        tasks = await asyncio.gather(*[
+            supervisor.create_task(
                 agent_type='generation',
                 priority=2,  # Medium priority
                 parameters={'index': i}
             )
-            tasks.append(task)
+            for i in range(3)
+        ])
         
         # Simulate task failure
         failed_task = tasks[0]
@@ -388,5 +416,5 @@ class TestSupervisorPerformance:
         assert duration < 1.0  # Should take less than 1 second
         
         # Verify all tasks created
-        queue_stats = await test_environment['task_queue'].get_queue_statistics()
+        queue_stats = test_environment['task_queue'].get_queue_statistics()
         assert queue_stats['task_states']['pending'] == 50
\ No newline at end of file
@@ -5,9 +5,10 @@ import os
 from unittest.mock import AsyncMock, MagicMock, patch, Mock
 
 import pytest
-from httpx import ConnectError, Response
+from httpx import ConnectError, HTTPStatusError, Response
 
 from src.llm.argo_provider import ArgoLLMProvider, ArgoConnectionError
+from src.llm.base import LLMRequest, LLMResponse
 
 
 @pytest.fixture
@@ -233,4 +234,220 @@ class TestArgoHealthCheck:
         
         with patch.object(argo_provider, '_client', mock_httpx_client):
             with pytest.raises(ArgoConnectionError):
-                await argo_provider.get_health_status()
\ No newline at end of file
+                await argo_provider.get_health_status()
+
+
+def _make_request(request_id: str, prompt: str, model: str = "gpt4o") -> LLMRequest:
+    """Create a generation request for batch tests."""
+    return LLMRequest(
+        request_id=request_id,
+        agent_type="generation",
+        request_type="generate",
+        content={"prompt": prompt, "context": {}, "parameters": {"model": model}}
+    )
+
+
+class TestArgoBatchGeneration:
+    """Test batched generation through the proxy."""
+    
+    @pytest.mark.asyncio
+    async def test_generate_many_single_round_trip(self, argo_provider, mock_httpx_client):
+        """Test that all requests are sent in one POST and returned in order."""
+        requests = [
+            _make_request("req-1", "First prompt"),
+            _make_request("req-2", "Second prompt", model="claudeopus4"),
+        ]
+        mock_response = Mock(spec=Response)
+        mock_response.status_code = 200
+        mock_response.raise_for_status = Mock()
+        mock_response.json.return_value = {
+            "responses": [
+                {"custom_id": "req-2", "model": "claudeopus4", "content": "Second answer"},
+                {"custom_id": "req-1", "model": "gpt4o", "content": "First answer"},
+            ]
+        }
+        mock_httpx_client.post.return_value = mock_response
+        
+        with patch.object(argo_provider, '_client', mock_httpx_client):
+            responses = await argo_provider.generate_many(requests)
+        
+        mock_httpx_client.post.assert_called_once()
+        args, kwargs = mock_httpx_client.post.call_args
+        assert args[0] == "/batch"
+        assert [item["model"] for item in kwargs["json"]["requests"]] == ["gpt4o", "claudeopus4"]
+        
+        assert [r.request_id for r in responses] == ["req-1", "req-2"]
+        assert responses[0].response["content"] == "First answer"
+        assert responses[1].response["metadata"]["model_used"] == "claudeopus4"
+    
+    @pytest.mark.asyncio
+    async def test_generate_many_item_errors(self, argo_provider, mock_httpx_client):
+        """Test that failed or missing batch items become error responses."""
+        requests = [_make_request("req-1", "First prompt"), _make_request("req-2", "Second prompt")]
+        mock_response = Mock(spec=Response)
+        mock_response.status_code = 200
+        mock_response.raise_for_status = Mock()
+        mock_response.json.return_value = {
+            "responses": [
+                {"custom_id": "req-1", "error": {"code": "RATE_LIMITED", "message": "Slow down"}},
+            ]
+        }
+        mock_httpx_client.post.return_value = mock_response
+        
+        with patch.object(argo_provider, '_client', mock_httpx_client):
+            responses = await argo_provider.generate_many(requests)
+        
+        assert responses[0].status == "error"
+        assert responses[0].error.code == "RATE_LIMITED"
+        assert responses[1].status == "error"
+        assert responses[1].error.code == "MISSING_RESULT"
+    
+    @pytest.mark.asyncio
+    async def test_generate_many_falls_back_without_batch_endpoint(self, argo_provider, mock_httpx_client):
+        """Test fan-out through generate when the proxy has no batch endpoint."""
+        requests = [_make_request("req-1", "First prompt"), _make_request("req-2", "Second prompt")]
+        mock_response = Mock(spec=Response)
+        mock_response.status_code = 404
+        mock_httpx_client.post.return_value = mock_response
+        
+        async def fake_generate(request):
+            return LLMResponse(
+                request_id=request.request_id,
+                status="success",
+                response={"content": request.content["prompt"]},
+                error=None
+            )
+        
+        with patch.object(argo_provider, '_client', mock_httpx_client), \
+             patch.object(argo_provider, 'generate', side_effect=fake_generate) as mock_generate:
+            responses = await argo_provider.generate_many(requests)
+        
+        assert mock_generate.call_count == 2
+        assert [r.response["content"] for r in responses] == ["First prompt", "Second prompt"]
+    
+    @pytest.mark.asyncio
+    async def test_generate_many_fallback_bounds_concurrency(self, argo_provider, mock_httpx_client):
+        """Test that the fan-out fallback keeps at most max_concurrency requests in flight."""
+        requests = [_make_request(f"req-{i}", f"Prompt {i}") for i in range(6)]
+        mock_response = Mock(spec=Response)
+        mock_response.status_code = 404
+        mock_httpx_client.post.return_value = mock_response
+        argo_provider.max_concurrency = 2
+        in_flight = 0
+        peak = 0
+        
+        async def fake_generate(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return LLMResponse(
+                request_id=request.request_id,
+                status="success",
+                response={"content": request.content["prompt"]},
+                error=None
+            )
+        
+        with patch.object(argo_provider, '_client', mock_httpx_client), \
+             patch.object(argo_provider, 'generate', side_effect=fake_generate):
+            responses = await argo_provider.generate_many(requests)
+        
+        assert peak == 2
+        assert [r.request_id for r in responses] == [r.request_id for r in requests]
+    
+    @pytest.mark.asyncio
+    async def test_generate_many_fallback_raises_provider_error(self, argo_provider, mock_httpx_client):
+        """Test that a failing fan-out request raises its own error, not an ExceptionGroup."""
+        requests = [_make_request("req-1", "First prompt"), _make_request("req-2", "Second prompt")]
+        mock_response = Mock(spec=Response)
+        mock_response.status_code = 404
+        mock_httpx_client.post.return_value = mock_response
+        
+        async def fake_generate(request):
+            if request.request_id == "req-2":
+                raise ArgoConnectionError("Proxy unreachable")
+            await asyncio.sleep(0)
+            return LLMResponse(
+                request_id=request.request_id,
+                status="success",
+                response={"content": request.content["prompt"]},
+                error=None
+            )
+        
+        with patch.object(argo_provider, '_client', mock_httpx_client), \
+             patch.object(argo_provider, 'generate', side_effect=fake_generate):
+            with pytest.raises(ArgoConnectionError, match="Proxy unreachable") as exc_info:
+                await argo_provider.generate_many(requests)
+        
+        assert isinstance(exc_info.value.__cause__, ExceptionGroup)
+    
+    @pytest.mark.asyncio
+    async def test_generate_many_http_error_trips_breaker(self, argo_provider, mock_httpx_client):
+        """Test that an HTTP error status is wrapped and counted against the batch's models."""
+        requests = [_make_request("req-1", "First prompt"), _make_request("req-2", "Second prompt")]
+        mock_response = Mock(spec=Response)
+        mock_response.status_code = 500
+        mock_response.raise_for_status = Mock(side_effect=HTTPStatusError(
+            "Server error", request=Mock(), response=mock_response
+        ))
+        mock_httpx_client.post.return_value = mock_response
+        
+        with patch.object(argo_provider, '_client', mock_httpx_client):
+            with pytest.raises(ArgoConnectionError, match="Batch request failed"):
+                await argo_provider.generate_many(requests)
+        
+        assert argo_provider._circuit_breakers["gpt4o"].failure_count == 1
+        assert argo_provider._circuit_breakers["claudeopus4"].failure_count == 0
+    
+    @pytest.mark.asyncio
+    async def test_generate_many_open_circuit_uses_generate(self, argo_provider, mock_httpx_client):
+        """Test that a batch for a model with an open circuit goes through generate."""
+        requests = [_make_request("req-1", "First prompt"), _make_request("req-2", "Second prompt")]
+        for _ in range(3):
+            argo_provider._circuit_breakers["gpt4o"].record_failure()
+        
+        async def fake_generate(request):
+            return LLMResponse(
+                request_id=request.request_id,
+                status="success",
+                response={"content": "queued"},
+                error=None
+            )
+        
+        with patch.object(argo_provider, '_client', mock_httpx_client), \
+             patch.object(argo_provider, 'generate', side_effect=fake_generate) as mock_generate:
+            responses = await argo_provider.generate_many(requests)
+        
+        mock_httpx_client.post.assert_not_called()
+        assert mock_generate.call_count == 2
+        assert [r.request_id for r in responses] == ["req-1", "req-2"]
+    
+    @pytest.mark.asyncio
+    async def test_generate_many_default_model(self, argo_provider, mock_httpx_client):
+        """Test that requests without a model are batched with the provider default."""
+        request = LLMRequest(
+            request_id="req-1",
+            agent_type="generation",
+            request_type="generate",
+            content={"prompt": "Prompt", "context": {}, "parameters": {}}
+        )
+        mock_response = Mock(spec=Response)
+        mock_response.status_code = 200
+        mock_response.raise_for_status = Mock()
+        mock_response.json.return_value = {"responses": [{"custom_id": "req-1", "content": "Answer"}]}
+        mock_httpx_client.post.return_value = mock_response
+        
+        with patch.object(argo_provider, '_client', mock_httpx_client):
+            responses = await argo_provider.generate_many([request])
+        
+        _, kwargs = mock_httpx_client.post.call_args
+        assert kwargs["json"]["requests"][0]["model"] == ArgoLLMProvider.DEFAULT_MODEL
+        assert responses[0].response["metadata"]["model_used"] == ArgoLLMProvider.DEFAULT_MODEL
+    
+    @pytest.mark.asyncio
+    async def test_generate_many_empty(self, argo_provider, mock_httpx_client):
+        """Test that an empty batch makes no request."""
+        with patch.object(argo_provider, '_client', mock_httpx_client):
+            assert await argo_provider.generate_many([]) == []
+        mock_httpx_client.post.assert_not_called()
@@ -83,6 +83,26 @@ class TestBAMLWrapper:
             assert result.id == "hyp_new"
             baml_wrapper._client.GenerateHypothesis.assert_called_once()
     
+    @pytest.mark.asyncio
+    async def test_generate_hypothesis_routes_to_model(self, baml_wrapper):
+        """Test that a per-call model is passed as a reusable client registry."""
+        mock_result = MagicMock(spec=Hypothesis, id="hyp_new")
+        with patch.object(baml_wrapper._client, 'GenerateHypothesis',
+                         new_callable=AsyncMock, return_value=mock_result):
+            
+            for _ in range(2):
+                await baml_wrapper.generate_hypothesis(
+                    goal="Test goal",
+                    constraints=[],
+                    existing_hypotheses=[],
+                    generation_method="literature_based",
+                    model="claudeopus4"
+                )
+            
+            first, second = baml_wrapper._client.GenerateHypothesis.call_args_list
+            registry = first.kwargs["baml_options"]["client_registry"]
+            assert second.kwargs["baml_options"]["client_registry"] is registry
+    
     @pytest.mark.asyncio
     async def test_evaluate_hypothesis(self, baml_wrapper, mock_hypothesis):
         """Test hypothesis evaluation."""
@@ -315,6 +315,27 @@ async def test_checkpoint_recovery_with_corrupted_data(context_memory, state_upd
     assert recovery_state is None
 
 
+@pytest.mark.asyncio
+async def test_checkpoint_with_datetimes_and_legacy_nan(context_memory, state_update):
+    """Test checkpoints holding datetimes, and older checkpoints written with NaN."""
+    deadline = datetime(2024, 1, 1, 12, 0, 0)
+    state_update.checkpoint_data["queue_state"] = {"deadline": deadline}
+    checkpoint_id = await context_memory.create_checkpoint(state_update)
+    assert checkpoint_id is not None
+    
+    recovery_state = await context_memory.recover_from_checkpoint(checkpoint_id)
+    assert recovery_state is not None
+    
+    # json.dump writes NaN as a bare token, which strict JSON parsers reject
+    checkpoint_file = context_memory.storage_path / "checkpoints" / checkpoint_id / "checkpoint.json"
+    data = json.loads(checkpoint_file.read_text())
+    assert data["checkpoint_data"]["queue_state"]["deadline"].startswith("2024-01-01T12:00:00")
+    data["system_statistics"]["tournament_progress"] = float("nan")
+    checkpoint_file.write_text(json.dumps(data))
+    
+    assert await context_memory.validate_checkpoint(checkpoint_id) is True
+
+
 @pytest.mark.asyncio
 async def test_checkpoint_creation_failure_handling(context_memory, state_update):
     """Test checkpoint creation with storage failure."""
@@ -320,4 +320,91 @@ async def test_namespace_isolation(context_memory):
     
     # Key-value pair should still exist
     value = await context_memory.get("test_key")
-    assert value == "test_value"
\ No newline at end of file
+    assert value == "test_value"
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_skips_disk(temp_storage_path):
+    """Test that the in-memory backend never writes key-value files."""
+    memory = ContextMemory(storage_path=temp_storage_path, backend="memory")
+    
+    await memory.set("key1", "value1")
+    await memory.batch_set({"key2": 2, "key3": [3]})
+    assert await memory.delete("key3") is True
+    
+    assert await memory.get("key1") == "value1"
+    assert await memory.exists("key2") is True
+    assert await memory.list_keys() == ["key1", "key2"]
+    assert not list((temp_storage_path / "kv_store").glob("*.json"))
+    
+    # Nothing survives into a new instance
+    reopened = ContextMemory(storage_path=temp_storage_path, backend="memory")
+    assert await reopened.get("key1") is None
+
+
+def test_unknown_backend_rejected(temp_storage_path):
+    """Test that an unknown key-value backend is rejected."""
+    with pytest.raises(ValueError, match="backend"):
+        ContextMemory(storage_path=temp_storage_path, backend="redis")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", ["disk", "memory"])
+async def test_snapshot_restore(temp_storage_path, backend):
+    """Test restoring the key-value store to an earlier snapshot."""
+    memory = ContextMemory(storage_path=temp_storage_path, backend=backend)
+    await memory.set("kept", {"count": 1})
+    snap = memory.snapshot()
+    
+    kept = await memory.get("kept")
+    kept["count"] = 2
+    await memory.set("added", "value")
+    
+    assert await memory.restore(snap) is True
+    assert await memory.get("kept") == {"count": 1}
+    assert await memory.get("added") is None
+    assert await memory.list_keys() == ["kept"]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_restore_keeps_uncached_keys(temp_storage_path):
+    """Test that restore() keeps stored keys that were never read into the cache."""
+    writer = ContextMemory(storage_path=temp_storage_path)
+    await writer.set("on_disk", {"count": 1})
+    
+    memory = ContextMemory(storage_path=temp_storage_path)
+    snap = memory.snapshot()
+    await memory.set("added", "value")
+    
+    assert await memory.restore(snap) is True
+    assert await memory.list_keys() == ["on_disk"]
+    
+    reopened = ContextMemory(storage_path=temp_storage_path)
+    assert await reopened.get("on_disk") == {"count": 1}
+
+
+@pytest.mark.asyncio
+async def test_batch_defers_writes_until_exit(context_memory, temp_storage_path):
+    """Test that batch() writes each changed key once, when the block exits."""
+    kv_dir = temp_storage_path / "kv_store"
+    await context_memory.set("existing", "old")
+    
+    async with context_memory.batch():
+        for i in range(5):
+            await context_memory.set(f"key{i}", i)
+        await context_memory.set("key0", "updated")
+        assert await context_memory.delete("existing") is True
+        
+        # Reads see the batch, disk does not yet
+        assert await context_memory.get("key0") == "updated"
+        assert await context_memory.get("existing") is None
+        assert not await context_memory.exists("existing")
+        assert await context_memory.delete("existing") is False
+        assert "existing" not in await context_memory.list_keys()
+        assert sorted(p.stem for p in kv_dir.glob("*.json")) == ["existing"]
+    
+    assert sorted(p.stem for p in kv_dir.glob("*.json")) == [f"key{i}" for i in range(5)]
+    reopened = ContextMemory(storage_path=temp_storage_path)
+    await reopened.initialize()
+    assert await reopened.get("key0") == "updated"
+    assert await reopened.get("existing") is None
@@ -1,13 +1,17 @@
 """Unit tests for ContextMemory file-based storage backend."""
 import asyncio
 import json
+import os
 import shutil
 import tempfile
 from datetime import datetime
 from pathlib import Path
 import pytest
 
-from src.core.context_memory import ContextMemory, StateUpdate, AgentOutput, MetaReviewStorage
+from src.core import context_memory
+from src.core.context_memory import (
+    ContextMemory, StateUpdate, AgentOutput, MetaReviewStorage, iter_ndjson
+)
 
 
 class TestContextMemoryStorage:
@@ -286,4 +290,406 @@ class TestContextMemoryStorage:
         
         # All should succeed
         assert all(r.success for r in results)
-        assert len(set(r.storage_path for r in results)) == 5  # All unique paths
\ No newline at end of file
+        assert len(set(r.storage_path for r in results)) == 5  # All unique paths
+
+    @pytest.mark.parametrize("use_async_io", [True, False])
+    async def test_same_timestamp_writes_get_unique_files(self, temp_storage_dir, use_async_io):
+        """Test that writers sharing a timestamp each claim their own file."""
+        memory = ContextMemory(storage_path=temp_storage_dir, use_async_io=use_async_io)
+        await memory.initialize()
+        timestamp = datetime.now()
+        updates = [
+            StateUpdate(
+                timestamp=timestamp,
+                update_type="periodic",
+                system_statistics={"total_hypotheses": i},
+                orchestration_state={"strategic_focus": f"writer-{i}"},
+                writer_id=f"writer-{i}"
+            )
+            for i in range(3)
+        ]
+        
+        results = await asyncio.gather(*(memory.store_state_update(u) for u in updates))
+        
+        assert all(r.success for r in results)
+        paths = {r.storage_path for r in results}
+        assert len(paths) == 3
+        writers = {json.loads(p.read_text())["writer_id"] for p in paths}
+        assert writers == {"writer-0", "writer-1", "writer-2"}
+    
+    async def test_log_layout_batches_updates_into_one_log(self, temp_storage_dir):
+        """Test that the log layout appends updates to a single ndjson log."""
+        memory = ContextMemory(storage_path=temp_storage_dir, state_layout="log")
+        await memory.initialize()
+        for i in range(10):
+            result = await memory.store_state_update(StateUpdate(
+                timestamp=datetime(2024, 1, 1, 12, 0, i),
+                update_type="periodic",
+                system_statistics={"step": i},
+                orchestration_state={"strategic_focus": f"step-{i}"}
+            ))
+            assert result.success
+        
+        # Buffered updates are readable before they reach disk
+        latest = await memory.retrieve_state("latest")
+        assert latest.content["statistics"]["step"] == 9
+        
+        await memory.close()
+        iteration_dir = result.storage_path.parent
+        assert not list(iteration_dir.glob("system_state_*.json"))
+        steps = [r["system_statistics"]["step"] for r in iter_ndjson(result.storage_path)]
+        assert steps == list(range(10))
+        
+        # A fresh instance rebuilds its index from the log
+        reloaded = ContextMemory(storage_path=temp_storage_dir, state_layout="log")
+        await reloaded.initialize()
+        history = await reloaded.get_version_history(limit=20)
+        assert len(history) == 10
+        latest = await reloaded.retrieve_state("latest")
+        assert latest.content["statistics"]["step"] == 9
+        await reloaded.close()
+    
+    async def test_log_layout_flushes_full_batch(self, temp_storage_dir):
+        """Test that reaching the batch size flushes without waiting."""
+        memory = ContextMemory(
+            storage_path=temp_storage_dir,
+            state_layout="log",
+            log_flush_interval_ms=60_000,
+            log_batch_size=3
+        )
+        await memory.initialize()
+        for i in range(3):
+            result = await memory.store_state_update(StateUpdate(
+                timestamp=datetime(2024, 1, 1, 12, 0, i),
+                update_type="periodic",
+                system_statistics={"step": i},
+                orchestration_state={}
+            ))
+        
+        # The flusher takes the full batch well before the 60s interval
+        for _ in range(100):
+            if not memory._update_buffer:
+                break
+            await asyncio.sleep(0)
+        assert memory._update_buffer == []
+        
+        # Wait out the in-flight append before reading the log
+        async with memory._flush_lock:
+            pass
+        assert len(list(iter_ndjson(result.storage_path))) == 3
+        await memory.close()
+
+    async def test_log_layout_keeps_batch_after_failed_flush(self, temp_storage_dir, monkeypatch):
+        """Test that a failed flush reports the error and retries the same lines."""
+        memory = ContextMemory(
+            storage_path=temp_storage_dir,
+            state_layout="log",
+            log_flush_interval_ms=60_000
+        )
+        await memory.initialize()
+        for i in range(3):
+            result = await memory.store_state_update(StateUpdate(
+                timestamp=datetime(2024, 1, 1, 12, 0, i),
+                update_type="periodic",
+                system_statistics={"step": i},
+                orchestration_state={}
+            ))
+
+        real_open = context_memory.aiofiles.open
+        def failing_open(*args, **kwargs):
+            raise OSError("disk full")
+        monkeypatch.setattr(context_memory.aiofiles, "open", failing_open)
+        with pytest.raises(OSError, match="disk full"):
+            await memory.flush()
+        assert len(memory._update_buffer) == 3
+
+        monkeypatch.setattr(context_memory.aiofiles, "open", real_open)
+        await memory.close()
+        steps = [r["system_statistics"]["step"] for r in iter_ndjson(result.storage_path)]
+        assert steps == [0, 1, 2]
+
+    async def test_iteration_statistics_survive_failed_flush(self, temp_storage_dir, monkeypatch):
+        """Test that statistics count what reached disk when the flush fails."""
+        memory = ContextMemory(
+            storage_path=temp_storage_dir,
+            state_layout="log",
+            log_flush_interval_ms=60_000
+        )
+        await memory.initialize()
+        iteration = await memory.start_new_iteration()
+        await memory.store_state_update(StateUpdate(
+            timestamp=datetime(2024, 1, 1, 12, 0, 0),
+            update_type="periodic",
+            system_statistics={},
+            orchestration_state={}
+        ))
+
+        real_open = context_memory.aiofiles.open
+        def failing_open(*args, **kwargs):
+            raise OSError("disk full")
+        monkeypatch.setattr(context_memory.aiofiles, "open", failing_open)
+        stats = await memory.get_iteration_statistics(iteration)
+        assert stats["state_updates_count"] == 0
+
+        monkeypatch.setattr(context_memory.aiofiles, "open", real_open)
+        stats = await memory.get_iteration_statistics(iteration)
+        assert stats["state_updates_count"] == 1
+        await memory.close()
+
+    async def test_log_entry_cache_is_bounded(self, temp_storage_dir, monkeypatch):
+        """Test that flushed log entries beyond the cache size are read back from disk."""
+        monkeypatch.setattr(context_memory, "STATE_LOG_CACHE_ENTRIES", 2)
+        memory = ContextMemory(
+            storage_path=temp_storage_dir,
+            state_layout="log",
+            log_flush_interval_ms=60_000
+        )
+        await memory.initialize()
+        timestamps = [datetime(2024, 1, 1, 12, 0, i) for i in range(5)]
+        for i, timestamp in enumerate(timestamps):
+            result = await memory.store_state_update(StateUpdate(
+                timestamp=timestamp,
+                update_type="periodic",
+                system_statistics={"step": i},
+                orchestration_state={}
+            ))
+
+        # Buffered entries can't be read from the log yet, so none are evicted
+        memory._trim_log_entries()
+        assert len(memory._log_entries) == 5
+
+        await memory.flush()
+        assert list(memory._log_entries) == timestamps[-2:]
+        state = memory._read_state(timestamps[0], result.storage_path)
+        assert state["system_statistics"]["step"] == 0
+        await memory.close()
+
+        reloaded = ContextMemory(storage_path=temp_storage_dir, state_layout="log")
+        await reloaded.initialize()
+        assert list(reloaded._log_entries) == timestamps[-2:]
+        history = await reloaded.get_version_history(limit=10)
+        assert len(history) == 5
+        await reloaded.close()
+
+    def test_unknown_state_layout_rejected(self, temp_storage_dir):
+        """Test that an unknown state layout is rejected."""
+        with pytest.raises(ValueError):
+            ContextMemory(storage_path=temp_storage_dir, state_layout="sqlite")
+    
+    async def test_latest_state_served_from_cache(self, initialized_memory):
+        """Test that "latest" tracks the newest timestamp without rereading files."""
+        for step, second in [(1, 10), (2, 30), (3, 20)]:
+            result = await initialized_memory.store_state_update(StateUpdate(
+                timestamp=datetime(2024, 1, 1, 12, 0, second),
+                update_type="periodic",
+                system_statistics={"step": step},
+                orchestration_state={}
+            ))
+            assert result.success
+        
+        # Removing the files proves the read no longer touches disk
+        for path in result.storage_path.parent.glob("system_state_*.json"):
+            path.unlink()
+        latest = await initialized_memory.retrieve_state("latest")
+        assert latest.content["statistics"]["step"] == 2
+    
+    async def test_storage_quota_measured_once(self, initialized_memory, monkeypatch):
+        """Test that the quota check walks the storage tree once, not per write."""
+        walks = []
+        original = initialized_memory._get_directory_size
+        monkeypatch.setattr(
+            initialized_memory, "_get_directory_size",
+            lambda path: walks.append(path) or original(path)
+        )
+        for i in range(5):
+            result = await initialized_memory.store_state_update(StateUpdate(
+                timestamp=datetime(2024, 1, 1, 12, 0, i),
+                update_type="periodic",
+                system_statistics={"step": i},
+                orchestration_state={}
+            ))
+            assert result.success
+        
+        assert len(walks) == 1
+        assert initialized_memory._used_bytes == initialized_memory._get_directory_size(
+            initialized_memory.storage_path
+        )
+
+    async def test_storage_quota_counts_every_write(self, temp_storage_dir):
+        """Test that writes other than state updates count towards the storage limit."""
+        memory = ContextMemory(storage_path=temp_storage_dir, max_storage_gb=0.0001)  # ~107KB
+        await memory.initialize()
+        update = StateUpdate(
+            timestamp=datetime(2024, 1, 1, 12, 0, 0),
+            update_type="periodic",
+            system_statistics={"step": 0},
+            orchestration_state={}
+        )
+        assert (await memory.store_state_update(update)).success
+
+        for i in range(5):
+            await memory.store_agent_output(AgentOutput(
+                agent_type="generation",
+                task_id=f"task_{i}",
+                timestamp=datetime(2024, 1, 1, 12, 0, i),
+                results={"text": "x" * 10_000}
+            ))
+            await memory.set(f"key_{i}", "y" * 10_000)
+        await memory.set("key_0", "short")
+        await memory.delete("key_1")
+        await memory.store_aggregate("scores", {"text": "z" * 10_000}, datetime(2024, 1, 1))
+        await memory.create_checkpoint(update)
+
+        assert memory._used_bytes == memory._get_directory_size(memory.storage_path)
+
+        await memory.store_agent_output(AgentOutput(
+            agent_type="generation",
+            task_id="task_large",
+            timestamp=datetime(2024, 1, 1, 12, 1, 0),
+            results={"text": "x" * 100_000}
+        ))
+        result = await memory.store_state_update(update)
+        assert not result.success
+        assert result.error == "Storage limit exceeded"
+
+    async def test_state_file_names_sort_in_write_order(self, initialized_memory):
+        """Test that file names sort chronologically, including timestamp collisions."""
+        timestamps = [datetime(2024, 1, 1, 12, 0, 0)] * 12 + [datetime(2024, 1, 1, 12, 0, 1)]
+        for i, timestamp in enumerate(timestamps):
+            result = await initialized_memory.store_state_update(StateUpdate(
+                timestamp=timestamp,
+                update_type="periodic",
+                system_statistics={"step": i},
+                orchestration_state={}
+            ))
+            assert result.success
+        
+        state_files = sorted(result.storage_path.parent.glob("system_state_*.json"))
+        steps = [json.loads(p.read_text())["system_statistics"]["step"] for p in state_files]
+        assert steps == list(range(len(timestamps)))
+    
+    async def test_state_sequence_continues_after_reload(self, temp_storage_dir):
+        """Test that stored updates carry a write sequence that survives restarts."""
+        memory = ContextMemory(storage_path=temp_storage_dir)
+        await memory.initialize()
+        timestamp = datetime(2024, 1, 1, 12, 0, 0)
+        update = StateUpdate(
+            timestamp=timestamp,
+            update_type="periodic",
+            system_statistics={},
+            orchestration_state={}
+        )
+        first = await memory.store_state_update(update)
+        second = await memory.store_state_update(update)
+        
+        reloaded = ContextMemory(storage_path=temp_storage_dir)
+        await reloaded.initialize()
+        third = await reloaded.store_state_update(update)
+        
+        sequences = [json.loads(r.storage_path.read_text())["sequence"] for r in (first, second, third)]
+        assert sequences == [1, 2, 3]
+    
+    @pytest.mark.parametrize("state_layout", ["files", "log"])
+    async def test_state_update_with_non_string_keys(self, temp_storage_dir, state_layout):
+        """Test that statistics keyed by numbers are stored with string keys."""
+        memory = ContextMemory(storage_path=temp_storage_dir, state_layout=state_layout)
+        await memory.initialize()
+        result = await memory.store_state_update(StateUpdate(
+            timestamp=datetime(2024, 1, 1, 12, 0, 0),
+            update_type="periodic",
+            system_statistics={"hypotheses_by_priority": {1: 4, 3: 2}},
+            orchestration_state={}
+        ))
+        await memory.close()
+        
+        assert result.success
+        records = (
+            list(iter_ndjson(result.storage_path)) if state_layout == "log"
+            else [json.loads(result.storage_path.read_text())]
+        )
+        assert records[0]["system_statistics"]["hypotheses_by_priority"] == {"1": 4, "3": 2}
+
+    @pytest.mark.parametrize("state_layout,use_async_io", [
+        ("files", True), ("files", False), ("log", True)
+    ])
+    async def test_latest_state_matches_what_was_written(
+        self, temp_storage_dir, state_layout, use_async_io
+    ):
+        """Test that the cached latest state is the written data, not the caller's dict."""
+        memory = ContextMemory(
+            storage_path=temp_storage_dir,
+            state_layout=state_layout,
+            use_async_io=use_async_io
+        )
+        await memory.initialize()
+        update = StateUpdate(
+            timestamp=datetime(2024, 1, 1, 12, 0, 0),
+            update_type="periodic",
+            system_statistics={"hypotheses_by_priority": {1: 4}},
+            orchestration_state={}
+        )
+        assert (await memory.store_state_update(update)).success
+
+        update.system_statistics["hypotheses_by_priority"][2] = 9
+        latest = await memory.retrieve_state("latest")
+        await memory.close()
+
+        assert latest.content["statistics"]["hypotheses_by_priority"] == {"1": 4}
+
+    async def test_directory_size_counts_nested_files(self, initialized_memory, tmp_path):
+        """Test that directory size includes files in nested subdirectories."""
+        root = tmp_path / "sized"
+        (root / "a" / "b").mkdir(parents=True)
+        (root / "top.txt").write_bytes(b"x" * 10)
+        (root / "a" / "mid.txt").write_bytes(b"x" * 20)
+        (root / "a" / "b" / "deep.txt").write_bytes(b"x" * 30)
+        
+        assert initialized_memory._get_directory_size(root) == 60
+        assert initialized_memory._get_directory_size(tmp_path / "missing") == 0
+    
+    async def test_durable_flush_syncs_once_per_batch(self, temp_storage_dir, monkeypatch):
+        """Test that a durable flush issues one fsync per log and per directory."""
+        memory = ContextMemory(
+            storage_path=temp_storage_dir, state_layout="log",
+            log_flush_interval_ms=10_000, durable_flush=True
+        )
+        await memory.initialize()
+        synced = []
+        real_fsync = os.fsync
+        monkeypatch.setattr(os, "fsync", lambda fd: (synced.append(fd), real_fsync(fd))[1])
+        for i in range(5):
+            await memory.store_state_update(StateUpdate(
+                timestamp=datetime(2024, 1, 1, 12, 0, i),
+                update_type="periodic",
+                system_statistics={"step": i},
+                orchestration_state={}
+            ))
+        assert synced == []
+        
+        await memory.close()
+        assert len(synced) == 2  # The log file, then its iteration directory
+    
+    async def test_failed_flush_reported_through_return_values(self, temp_storage_dir):
+        """Test that checkpointing and completing an iteration report a failed flush."""
+        memory = ContextMemory(
+            storage_path=temp_storage_dir, state_layout="log",
+            log_flush_interval_ms=60_000
+        )
+        await memory.initialize()
+        iteration = await memory.start_new_iteration()
+        update = StateUpdate(
+            timestamp=datetime(2024, 1, 1, 12, 0, 0),
+            update_type="periodic",
+            system_statistics={},
+            orchestration_state={}
+        )
+        result = await memory.store_state_update(update)
+        # A directory where the log should go makes every append fail
+        result.storage_path.mkdir()
+        
+        assert await memory.create_checkpoint(update) is None
+        assert await memory.complete_iteration(iteration, {}) is False
+        
+        result.storage_path.rmdir()
+        await memory.close()
+        assert len(list(iter_ndjson(result.storage_path))) == 1
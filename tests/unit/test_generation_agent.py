@@ -1,11 +1,13 @@
 """Unit tests for Generation Agent."""
 
+import json
+
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
 from datetime import datetime
 
-from src.agents.generation import GenerationAgent
+from src.agents.generation import GenerationAgent, build_prompt
 from src.core.models import (
     Hypothesis,
     HypothesisCategory,
@@ -16,6 +18,7 @@ from src.core.models import (
 from src.core.task_queue import TaskQueue
 from src.core.context_memory import ContextMemory
 from src.llm.base import LLMProvider
+from src.llm.baml_wrapper import BAMLWrapper
 
 
 @pytest.fixture
@@ -144,65 +147,54 @@ class TestGenerateHypothesis:
         generation_agent.generate_from_literature.assert_called_once()
         assert result is not None
     
-    async def test_debate_routing(self, generation_agent):
-        """Test routing to debate-based generation."""
+    @pytest.mark.parametrize("generation_method,target,empty_context", [
+        # Empty turns for LLM-internal debate simulation
+        ('debate', 'generate_from_debate', []),
+        # Empty assumptions for LLM-internal assumption identification
+        ('assumptions', 'generate_from_assumptions', []),
+        # Empty feedback for LLM-internal expansion guidance
+        ('expansion', 'generate_from_feedback', {}),
+    ])
+    async def test_direct_routing(
+        self, generation_agent, generation_method, target, empty_context
+    ):
+        """Test routing of methods that call their generator with an empty context."""
         research_goal = ResearchGoal(description="Test research goal for unit testing")
-
-        # Mock the internal methods - new routing directly calls generate_from_debate with empty turns
-        generation_agent.generate_from_debate = AsyncMock(
-            return_value=Mock(spec=Hypothesis)
-        )
-
+        
+        generator = AsyncMock(return_value=Mock(spec=Hypothesis))
+        setattr(generation_agent, target, generator)
+        
         result = await generation_agent.generate_hypothesis(
             research_goal=research_goal,
-            generation_method='debate'
-        )
-
-        # Verify routing - should call generate_from_debate with empty debate_turns
-        generation_agent.generate_from_debate.assert_called_once_with(
-            research_goal, []  # Empty turns for LLM-internal debate simulation
+            generation_method=generation_method
         )
+        
+        generator.assert_called_once_with(research_goal, empty_context, model=None)
         assert result is not None
-    
-    async def test_assumptions_routing(self, generation_agent):
-        """Test routing to assumption-based generation."""
-        research_goal = ResearchGoal(description="Test research goal for unit testing")
 
-        # Mock the internal methods - new routing directly calls generate_from_assumptions with empty list
-        generation_agent.generate_from_assumptions = AsyncMock(
-            return_value=Mock(spec=Hypothesis)
-        )
 
-        result = await generation_agent.generate_hypothesis(
-            research_goal=research_goal,
-            generation_method='assumptions'
-        )
-
-        # Verify routing - should call generate_from_assumptions with empty assumptions list
-        generation_agent.generate_from_assumptions.assert_called_once_with(
-            research_goal, []  # Empty assumptions for LLM-internal assumption identification
-        )
-        assert result is not None
+class TestBuildPrompt:
+    """Test prompt assembly."""
     
-    async def test_expansion_routing(self, generation_agent):
-        """Test routing to expansion-based generation."""
-        research_goal = ResearchGoal(description="Test research goal for unit testing")
-        
-        # Mock the internal methods - new routing directly calls generate_from_feedback with empty dict
-        generation_agent.generate_from_feedback = AsyncMock(
-            return_value=Mock(spec=Hypothesis)
-        )
-        
-        result = await generation_agent.generate_hypothesis(
-            research_goal=research_goal,
-            generation_method='expansion'
-        )
+    def test_same_goal_builds_same_prompt(self):
+        """Test that identical inputs return identical prompts."""
+        first = build_prompt("Goal", ("Constraint",), 'debate', "Focus")
+        second = build_prompt("Goal", ["Constraint"], 'debate', "Focus")
+        
+        assert first == second
+        assert first['constraints'] == ["Constraint"]
+        assert first['generation_method'] == 'debate'
+        assert build_prompt("Goal", ("Constraint",), 'assumptions', "Focus") != first
+    
+    def test_prompt_lists_belong_to_caller(self):
+        """Test that mutating one prompt leaves the next one untouched."""
+        prompt = build_prompt("Goal", (), 'expansion')
+        prompt['existing_hypotheses'].append("Other hypothesis")
+        prompt['constraints'].append("Other constraint")
         
-        # Verify routing - should call generate_from_feedback with empty feedback dict
-        generation_agent.generate_from_feedback.assert_called_once_with(
-            research_goal, {}  # Empty feedback for LLM-internal expansion guidance
-        )
-        assert result is not None
+        fresh = build_prompt("Goal", (), 'expansion')
+        assert fresh['existing_hypotheses'] == []
+        assert fresh['constraints'] == []
 
 
 class TestGenerateFromLiterature:
@@ -224,7 +216,6 @@ class TestGenerateFromLiterature:
         ]
         
         # Mock BAML wrapper
-        from src.llm.baml_wrapper import BAMLWrapper
         mock_baml_wrapper = AsyncMock(spec=BAMLWrapper)
         mock_baml_hypothesis = Mock()
         mock_baml_hypothesis.summary = "Test hypothesis"
@@ -270,7 +261,6 @@ class TestGenerateFromLiterature:
         literature = []
         
         # Mock BAML wrapper to raise exception
-        from src.llm.baml_wrapper import BAMLWrapper
         mock_baml_wrapper = AsyncMock(spec=BAMLWrapper)
         mock_baml_wrapper.generate_hypothesis = AsyncMock(side_effect=Exception("BAML error"))
         generation_agent.baml_wrapper = mock_baml_wrapper
@@ -342,7 +332,7 @@ class TestGenerateFromAssumptions:
         assert isinstance(result, Hypothesis)
         assert result.generation_method == 'assumptions'
         assert result.assumptions == assumptions
-        assert 'density' in result.full_description.lower()
+        assert 'density' in result.description_lower
         assert result.confidence_score == 0.8
         
         # Verify storage
@@ -367,8 +357,8 @@ class TestGenerateFromFeedback:
         # Verify result
         assert isinstance(result, Hypothesis)
         assert result.generation_method == 'expansion'
-        assert 'network' in result.full_description.lower()
-        assert 'network' in result.novelty_claim.lower() or 'system' in result.full_description.lower()
+        assert 'network' in result.description_lower
+        assert 'network' in result.novelty_claim.lower() or 'system' in result.description_lower
         assert result.confidence_score == 0.85
         
         # Verify storage
@@ -580,4 +570,68 @@ class TestHelperMethods:
         assert protocol.objective == "Test the hypothesis"
         assert len(protocol.required_resources) == 2
         assert len(protocol.success_metrics) == 3
-        assert len(protocol.safety_considerations) == 2
\ No newline at end of file
+        assert len(protocol.safety_considerations) == 2
+
+    async def test_store_hypothesis_is_json_serializable(self, generation_agent):
+        """Test that stored hypotheses serialize citations and drop unset fields."""
+        hypothesis = Hypothesis(
+            summary="Stored hypothesis",
+            category=HypothesisCategory.MECHANISTIC,
+            full_description="Detailed description",
+            novelty_claim="Novel because...",
+            assumptions=["Assumption 1"],
+            experimental_protocol=generation_agent._create_mock_protocol(),
+            supporting_evidence=[Citation(authors=["Smith"], title="Paper", year=2024)],
+            confidence_score=0.8,
+            generation_method="literature_based"
+        )
+        
+        await generation_agent._store_hypothesis(hypothesis)
+        
+        stored = generation_agent.context_memory.set.call_args_list[0].args[1]
+        json.dumps(stored)
+        assert stored[0]['id'] == str(hypothesis.id)
+        assert stored[0]['category'] == 'mechanistic'
+        assert stored[0]['supporting_evidence'] == [
+            {'authors': ['Smith'], 'title': 'Paper', 'year': 2024}
+        ]
+    
+    async def test_generation_statistics_shared_through_memory(self, mock_dependencies, tmp_path):
+        """Test that agents sharing a context memory count into the same statistics."""
+        task_queue, _, llm_provider = mock_dependencies
+        memory = ContextMemory(storage_path=tmp_path)
+        await memory.initialize()
+        agents = [
+            GenerationAgent(
+                task_queue=task_queue,
+                context_memory=memory,
+                llm_provider=llm_provider,
+                config={'enable_safety_logging': False}
+            )
+            for _ in range(2)
+        ]
+        hypothesis = Hypothesis(
+            summary="Counted hypothesis",
+            category=HypothesisCategory.MECHANISTIC,
+            full_description="Detailed description",
+            novelty_claim="Novel because...",
+            assumptions=["Assumption 1"],
+            experimental_protocol=agents[0]._create_mock_protocol(),
+            supporting_evidence=[],
+            confidence_score=0.8,
+            generation_method="debate"
+        )
+        
+        snapshot = memory.snapshot()
+        for agent in agents:
+            await agent._store_hypothesis(hypothesis)
+        assert await memory.get('generation_statistics') == {
+            'total_generated': 2, 'debate_count': 2
+        }
+        
+        # Counts restart from whatever the memory holds now
+        await memory.restore(snapshot)
+        await agents[0]._store_hypothesis(hypothesis)
+        assert await memory.get('generation_statistics') == {
+            'total_generated': 1, 'debate_count': 1
+        }
@@ -15,6 +15,18 @@ from src.core.models import (
 )
 
 
+# Shared read-only protocol for tests that don't exercise protocol fields
+_DEFAULT_PROTOCOL = ExperimentalProtocol(
+    objective="Test",
+    methodology="Method",
+    required_resources=["R1"],
+    timeline="1w",
+    success_metrics=["M1"],
+    potential_challenges=["C1"],
+    safety_considerations=["S1"]
+)
+
+
 class TestCitation:
     """Test the Citation model."""
     
@@ -114,23 +126,13 @@ class TestHypothesis:
     
     def test_hypothesis_creation_minimal(self):
         """Test creating a hypothesis with minimal fields."""
-        protocol = ExperimentalProtocol(
-            objective="Test hypothesis",
-            methodology="Standard protocol",
-            required_resources=["Resource 1"],
-            timeline="1 week",
-            success_metrics=["Metric 1"],
-            potential_challenges=["Challenge 1"],
-            safety_considerations=["Safety 1"]
-        )
-        
         hypothesis = Hypothesis(
             summary="A novel therapeutic approach for AML",
             category=HypothesisCategory.THERAPEUTIC,
             full_description="Detailed description of the hypothesis",
             novelty_claim="This is novel because...",
             assumptions=["Assumption 1", "Assumption 2"],
-            experimental_protocol=protocol,
+            experimental_protocol=_DEFAULT_PROTOCOL,
             supporting_evidence=[],
             confidence_score=0.8,
             generation_method="literature_exploration"
@@ -151,23 +153,13 @@ class TestHypothesis:
             year=2023
         )
         
-        protocol = ExperimentalProtocol(
-            objective="Test hypothesis",
-            methodology="Standard protocol",
-            required_resources=["Resource 1"],
-            timeline="1 week",
-            success_metrics=["Metric 1"],
-            potential_challenges=["Challenge 1"],
-            safety_considerations=["Safety 1"]
-        )
-        
         hypothesis = Hypothesis(
             summary="A novel approach",
             category=HypothesisCategory.MECHANISTIC,
             full_description="Description",
             novelty_claim="Novel because...",
             assumptions=["Assumption 1"],
-            experimental_protocol=protocol,
+            experimental_protocol=_DEFAULT_PROTOCOL,
             supporting_evidence=[citation],
             confidence_score=0.9,
             generation_method="simulated_debate"
@@ -178,16 +170,6 @@ class TestHypothesis:
     
     def test_hypothesis_confidence_validation(self):
         """Test confidence score validation."""
-        protocol = ExperimentalProtocol(
-            objective="Test",
-            methodology="Method",
-            required_resources=["R1"],
-            timeline="1w",
-            success_metrics=["M1"],
-            potential_challenges=["C1"],
-            safety_considerations=["S1"]
-        )
-        
         # Confidence must be between 0 and 1
         with pytest.raises(ValidationError):
             Hypothesis(
@@ -196,7 +178,7 @@ class TestHypothesis:
                 full_description="Description",
                 novelty_claim="Novel",
                 assumptions=["A1"],
-                experimental_protocol=protocol,
+                experimental_protocol=_DEFAULT_PROTOCOL,
                 supporting_evidence=[],
                 confidence_score=1.5,  # Too high
                 generation_method="method"
@@ -209,7 +191,7 @@ class TestHypothesis:
                 full_description="Description",
                 novelty_claim="Novel",
                 assumptions=["A1"],
-                experimental_protocol=protocol,
+                experimental_protocol=_DEFAULT_PROTOCOL,
                 supporting_evidence=[],
                 confidence_score=-0.1,  # Too low
                 generation_method="method"
@@ -217,16 +199,6 @@ class TestHypothesis:
     
     def test_hypothesis_assumptions_validation(self):
         """Test that assumptions list can't be empty."""
-        protocol = ExperimentalProtocol(
-            objective="Test",
-            methodology="Method",
-            required_resources=["R1"],
-            timeline="1w",
-            success_metrics=["M1"],
-            potential_challenges=["C1"],
-            safety_considerations=["S1"]
-        )
-        
         with pytest.raises(ValidationError):
             Hypothesis(
                 summary="Summary",
@@ -234,7 +206,7 @@ class TestHypothesis:
                 full_description="Description",
                 novelty_claim="Novel",
                 assumptions=[],  # Empty list
-                experimental_protocol=protocol,
+                experimental_protocol=_DEFAULT_PROTOCOL,
                 supporting_evidence=[],
                 confidence_score=0.8,
                 generation_method="method"
@@ -242,23 +214,13 @@ class TestHypothesis:
     
     def test_hypothesis_serialization(self):
         """Test hypothesis serialization."""
-        protocol = ExperimentalProtocol(
-            objective="Test",
-            methodology="Method",
-            required_resources=["R1"],
-            timeline="1w",
-            success_metrics=["M1"],
-            potential_challenges=["C1"],
-            safety_considerations=["S1"]
-        )
-        
         hypothesis = Hypothesis(
             summary="Summary",
             category=HypothesisCategory.THERAPEUTIC,
             full_description="Description",
             novelty_claim="Novel",
             assumptions=["A1"],
-            experimental_protocol=protocol,
+            experimental_protocol=_DEFAULT_PROTOCOL,
             supporting_evidence=[],
             confidence_score=0.8,
             generation_method="method"
@@ -274,6 +236,32 @@ class TestHypothesis:
         h2 = Hypothesis.model_validate(h_dict)
         assert str(h2.id) == str(hypothesis.id)
         assert h2.summary == hypothesis.summary
+    
+    def test_hypothesis_description_lower(self):
+        """Test the cached lowercased description."""
+        hypothesis = Hypothesis(
+            summary="Summary",
+            category=HypothesisCategory.THERAPEUTIC,
+            full_description="Quantum COHERENCE in Mitochondria",
+            novelty_claim="Novel",
+            assumptions=["A1"],
+            experimental_protocol=_DEFAULT_PROTOCOL,
+            supporting_evidence=[],
+            confidence_score=0.8,
+            generation_method="method"
+        )
+        
+        assert hypothesis.description_lower == "quantum coherence in mitochondria"
+        assert hypothesis.description_lower is hypothesis.description_lower
+        assert "description_lower" not in hypothesis.model_dump()
+        
+        # A replaced description is never served from the old cache
+        copy = hypothesis.model_copy(update={"full_description": "Plant ROOTS"})
+        assert copy.description_lower == "plant roots"
+        assert hypothesis.description_lower == "quantum coherence in mitochondria"
+        
+        hypothesis.full_description = "Synthetic BIOLOGY"
+        assert hypothesis.description_lower == "synthetic biology"
 
 
 class TestHypothesisSummary:
@@ -267,4 +267,21 @@ class TestIterationTracking:
         # Get iteration info - should include checkpoint reference
         info = await context_memory.get_iteration_info(iter_num)
         assert "checkpoints" in info
-        assert checkpoint_id in info["checkpoints"]
\ No newline at end of file
+        assert checkpoint_id in info["checkpoints"]
+
+    @pytest.mark.asyncio
+    async def test_iteration_info_sees_external_metadata_edits(self, context_memory):
+        """Test that cached iteration metadata is refreshed when the file changes."""
+        iter_num = await context_memory.start_new_iteration()
+        info = await context_memory.get_iteration_info(iter_num)
+        assert info["status"] == "active"
+        
+        # Rewrite the metadata outside ContextMemory
+        metadata_file = context_memory.storage_path / "iterations" / f"iteration_{iter_num:03d}" / "metadata.json"
+        metadata = json.loads(metadata_file.read_text())
+        metadata["status"] = "abandoned"
+        metadata_file.write_text(json.dumps(metadata))
+        
+        info = await context_memory.get_iteration_info(iter_num)
+        assert info["status"] == "abandoned"
+        assert await context_memory.get_active_iteration() is None
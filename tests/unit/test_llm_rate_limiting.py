@@ -275,7 +275,10 @@ class TestRateLimiterIntegration:
         
         # Next big request should be limited
         assert not await limiter.acquire_for_request(big_request, estimated_tokens=400)
-    
+
+        # The rejected request gives its request token back
+        assert limiter.request_tokens == pytest.approx(99, abs=0.1)
+
     @pytest.mark.asyncio
     async def test_multi_model_rate_limits(self):
         """Test different rate limits for different models."""
@@ -111,6 +111,45 @@ class TestQueuePersistence:
             task_state = queue2.get_task_state(task_ids[i])
             assert task_state == TaskState.PENDING
     
+    async def test_persist_full_queue(self, temp_dir):
+        """Test a capacity-sized queue round-trips through a saved snapshot."""
+        config = QueueConfig(persistence_path=str(temp_dir / "queue_state.json"))
+        queue1 = TaskQueue(config)
+        task_ids = await queue1.enqueue_many([
+            Task(
+                task_type=TaskType.GENERATE_HYPOTHESIS,
+                priority=(i % 3) + 1,
+                payload={"id": i, "tags": ["a", "b"]}
+            )
+            for i in range(100)
+        ])
+        await queue1.save_state()
+        
+        queue2 = TaskQueue(config)
+        await queue2.load_state()
+        
+        assert queue2.size() == 100
+        for task_id in task_ids:
+            assert queue2.get_task_state(task_id) == TaskState.PENDING
+        task_info = await queue2.get_task_info(task_ids[7])
+        assert task_info["priority"] == 2
+    
+    async def test_persist_payload_with_non_string_keys(self, temp_dir):
+        """Test that payload dicts keyed by numbers are saved with string keys."""
+        config = QueueConfig(persistence_path=str(temp_dir / "queue_state.json"))
+        queue1 = TaskQueue(config)
+        task_id = await queue1.enqueue(Task(
+            task_type=TaskType.GENERATE_HYPOTHESIS,
+            priority=2,
+            payload={"scores": {1: 0.5, 2: 0.75}}
+        ))
+        await queue1.save_state()
+        
+        queue2 = TaskQueue(config)
+        await queue2.load_state()
+        
+        assert queue2._tasks[task_id].payload["scores"] == {"1": 0.5, "2": 0.75}
+    
     async def test_persist_worker_state(self, queue_with_persistence):
         """Test that worker registration state is persisted."""
         queue = queue_with_persistence
@@ -131,10 +170,10 @@ class TestQueuePersistence:
         assert queue2.is_worker_registered("worker2")
         
         # Verify capabilities were restored
-        worker1_status = await queue2.get_worker_status("worker1")
+        worker1_status = queue2.get_worker_status("worker1")
         assert worker1_status["capabilities"]["agent_types"] == ["Generation"]
         
-        worker2_status = await queue2.get_worker_status("worker2")
+        worker2_status = queue2.get_worker_status("worker2")
         assert worker2_status["capabilities"]["agent_types"] == ["Reflection", "Evolution"]
     
     async def test_persist_task_assignments(self, queue_with_persistence):
@@ -161,7 +200,7 @@ class TestQueuePersistence:
         assert queue2.get_task_state(task_id) == TaskState.EXECUTING
         
         # Verify worker state
-        worker_status = await queue2.get_worker_status("worker1")
+        worker_status = queue2.get_worker_status("worker1")
         assert worker_status["state"] == "active"
         assert worker_status["assigned_task"] == task_id
     
@@ -356,4 +395,38 @@ class TestQueuePersistence:
         
         # Verify state integrity
         assert queue2.size() == 10
-        assert len(queue2.get_registered_workers()) == 5
\ No newline at end of file
+        assert len(queue2.get_registered_workers()) == 5    
+    async def test_load_state_rebuilds_aging_and_dlq_indexes(self, temp_dir):
+        """Test that loading replaces the aging and DLQ indexes with the saved ones."""
+        config = QueueConfig(persistence_path=str(temp_dir / "queue_state.json"))
+        queue1 = TaskQueue(config)
+        await queue1.register_worker("worker1", {"agent_types": ["Generation"]})
+        failed = Task(task_type=TaskType.GENERATE_HYPOTHESIS, priority=2, payload={})
+        failed_id = await queue1.enqueue(failed)
+        await queue1.dequeue("worker1")
+        await queue1.fail_task("worker1", failed_id, {"retryable": False})
+        pending_id = await queue1.enqueue(
+            Task(task_type=TaskType.GENERATE_HYPOTHESIS, priority=1, payload={})
+        )
+        await queue1.save_state()
+        
+        # A queue with its own history loads the saved state over it
+        queue2 = TaskQueue(config)
+        await queue2.register_worker("worker2", {"agent_types": ["Generation"]})
+        stale_id = await queue2.enqueue(
+            Task(task_type=TaskType.GENERATE_HYPOTHESIS, priority=2, payload={})
+        )
+        await queue2.dequeue("worker2")
+        await queue2.fail_task("worker2", stale_id, {"retryable": False})
+        await queue2.load_state()
+        
+        assert await queue2.get_dlq_tasks() == [failed_id]
+        assert queue2.get_dlq_statistics() == {
+            "total_tasks": 1,
+            "by_reason": {"non_retryable_error": 1}
+        }
+        assert queue2._task_enqueue_times == queue1._task_enqueue_times
+        assert pending_id in queue2._task_enqueue_times
+        assert stale_id not in queue2._task_enqueue_times
+        assert {task_id for _, task_id in queue2._aging_heap} == set(queue1._task_enqueue_times)
+        assert not queue2._boosted_tasks
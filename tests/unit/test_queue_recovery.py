@@ -90,7 +90,7 @@ class TestQueueRecovery:
         
         # Verify worker is registered and active
         assert queue2.is_worker_registered("worker1")
-        worker_status = await queue2.get_worker_status("worker1")
+        worker_status = queue2.get_worker_status("worker1")
         assert worker_status["state"] == "active"
         assert worker_status["assigned_task"] == task_id
     
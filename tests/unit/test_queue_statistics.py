@@ -36,7 +36,7 @@ class TestQueueStatistics:
     async def test_get_queue_depth(self, queue, tasks):
         """Test getting overall and per-priority queue depth."""
         # Initially empty
-        stats = await queue.get_queue_statistics()
+        stats = queue.get_queue_statistics()
         assert stats["total_tasks"] == 0
         assert stats["depth_by_priority"]["high"] == 0
         assert stats["depth_by_priority"]["medium"] == 0
@@ -47,7 +47,7 @@ class TestQueueStatistics:
             await queue.enqueue(task)
         
         # Check statistics
-        stats = await queue.get_queue_statistics()
+        stats = queue.get_queue_statistics()
         assert stats["total_tasks"] == 6
         assert stats["depth_by_priority"]["high"] == 2
         assert stats["depth_by_priority"]["medium"] == 3
@@ -61,7 +61,7 @@ class TestQueueStatistics:
         await queue.register_worker("worker3", {"agent_types": ["Evolution"]})
         
         # Get initial stats
-        stats = await queue.get_queue_statistics()
+        stats = queue.get_queue_statistics()
         assert stats["worker_stats"]["total"] == 3
         assert stats["worker_stats"]["idle"] == 3
         assert stats["worker_stats"]["active"] == 0
@@ -73,7 +73,7 @@ class TestQueueStatistics:
         assignment = await queue.dequeue("worker1")
         
         # Check updated stats
-        stats = await queue.get_queue_statistics()
+        stats = queue.get_queue_statistics()
         assert stats["worker_stats"]["idle"] == 2
         assert stats["worker_stats"]["active"] == 1
         
@@ -81,7 +81,7 @@ class TestQueueStatistics:
         queue._worker_info["worker2"].state = "failed"
         
         # Check failed worker in stats
-        stats = await queue.get_queue_statistics()
+        stats = queue.get_queue_statistics()
         assert stats["worker_stats"]["failed"] == 1
     
     async def test_task_state_statistics(self, queue, tasks):
@@ -97,7 +97,7 @@ class TestQueueStatistics:
             task_ids.append(task_id)
         
         # Get initial stats
-        stats = await queue.get_queue_statistics()
+        stats = queue.get_queue_statistics()
         assert stats["task_states"]["pending"] == 4
         assert stats["task_states"]["assigned"] == 0
         assert stats["task_states"]["executing"] == 0
@@ -111,7 +111,7 @@ class TestQueueStatistics:
         assignment2 = await queue.dequeue("worker2")
         
         # Update stats
-        stats = await queue.get_queue_statistics()
+        stats = queue.get_queue_statistics()
         assert stats["task_states"]["pending"] == 2
         assert stats["task_states"]["assigned"] == 1
         assert stats["task_states"]["executing"] == 1
@@ -123,10 +123,31 @@ class TestQueueStatistics:
         await queue.fail_task("worker2", task_ids[1], {"error": "test", "retryable": False})
         
         # Final stats check
-        stats = await queue.get_queue_statistics()
+        stats = queue.get_queue_statistics()
         assert stats["task_states"]["completed"] == 1
         assert stats["task_states"]["failed"] == 1
     
+    async def test_task_state_counts_track_removals(self):
+        """Test state counts stay in step with displaced and purged tasks."""
+        queue = TaskQueue(QueueConfig(
+            max_queue_size=2,
+            priority_quotas={"high": 1, "medium": 0, "low": 1}
+        ))
+        await queue.enqueue(Task(task_type=TaskType.GENERATE_HYPOTHESIS, priority=1, payload={}))
+        await queue.enqueue(Task(task_type=TaskType.GENERATE_HYPOTHESIS, priority=3, payload={}))
+        await queue.enqueue(Task(task_type=TaskType.GENERATE_HYPOTHESIS, priority=3, payload={}))
+        
+        stats = queue.get_queue_statistics()
+        assert stats["task_states"]["pending"] == 2
+        assert stats["task_states"] == {
+            state.value: sum(1 for s in queue._task_states.values() if s == state)
+            for state in TaskState
+        }
+        
+        await queue.purge()
+        stats = queue.get_queue_statistics()
+        assert sum(stats["task_states"].values()) == 0
+    
     async def test_throughput_calculation(self, queue):
         """Test task throughput calculation."""
         # Register worker
@@ -198,7 +219,7 @@ class TestQueueStatistics:
             await queue.fail_task("worker1", task_id, {"error": f"attempt{i}", "retryable": True})
         
         # Get retry stats
-        stats = await queue.get_retry_statistics()
+        stats = queue.get_retry_statistics()
         
         assert stats["total_retries"] == 2
         assert stats["tasks_with_retries"] == 1
@@ -90,6 +90,7 @@ class TestSafetyDirectoryStructure:
         
         # Log a research goal
         await logger.log_research_goal("Test goal", {"domain": "test"})
+        await logger.aclose()
         
         # Check that log files are created in the main directory
         log_files = list(log_dir.glob("*.json"))
@@ -195,6 +195,33 @@ class TestSafetyLogRotation:
         archive_files = list(config_with_temp_dir.log_directory.glob("*.tar.gz"))
         assert len(archive_files) > 0
     
+    @pytest.mark.asyncio
+    async def test_scheduled_rotation_archives_in_one_pass(self, config_with_temp_dir):
+        """Test that scheduled rotation archives new and existing rotated logs together."""
+        import tarfile
+        
+        manager = LogRotationManager(config_with_temp_dir)
+        log_dir = config_with_temp_dir.log_directory
+        today = datetime.now(timezone.utc).strftime('%Y%m%d')
+        
+        small_file = log_dir / f"{today}_small.json"
+        small_file.write_text(json.dumps({"data": "x"}))
+        large_file = log_dir / f"{today}_large.json"
+        large_file.write_text(json.dumps({"data": "x" * 20000}))
+        (log_dir / f"{today}_earlier.rotated.json").write_text(json.dumps({"old": True}))
+        
+        await manager.run_scheduled_rotation(size_limit_kb=10)
+        
+        assert small_file.exists()
+        assert not list(log_dir.glob("*.rotated.json"))
+        archives = list(log_dir.glob("*.tar.gz"))
+        assert len(archives) == 1
+        with tarfile.open(archives[0]) as tar:
+            names = sorted(tar.getnames())
+        assert len(names) == 2
+        assert names[0] == f"{today}_earlier.rotated.json"
+        assert names[1].startswith(f"{today}_large_")
+    
     def test_get_file_age_days(self, config_with_temp_dir):
         """Test calculation of file age in days."""
         manager = LogRotationManager(config_with_temp_dir)
@@ -7,7 +7,9 @@ from datetime import datetime, timezone, timedelta
 from pathlib import Path
 import shutil
 import tempfile
+import uuid
 from unittest.mock import patch, AsyncMock, Mock
+import orjson
 import pytest
 
 from src.core.safety import SafetyConfig, SafetyLogger, SafetyCheck, SafetyLevel
@@ -110,6 +112,7 @@ class TestSafetyLogger:
         assert result.input_hash is not None
         
         # Check that log file was created
+        await logger.flush()
         log_files = list(config.log_directory.glob("*.json"))
         assert len(log_files) > 0
     
@@ -131,6 +134,7 @@ class TestSafetyLogger:
         assert "log_id" in result.metadata
         
         # Verify log entry
+        await logger.flush()
         log_files = list(config.log_directory.glob("*.json"))
         assert len(log_files) > 0
     
@@ -177,6 +181,7 @@ class TestSafetyLogger:
         )
         
         await logger._write_log_entry(log_entry)
+        await logger.flush()
         
         # Check that file was created
         expected_filename = f"{log_entry.timestamp.strftime('%Y%m%d')}_{log_entry.id}.json"
@@ -316,6 +321,172 @@ class TestSafetyLogger:
         log_ids = [r.metadata.get("log_id") for r in results if "log_id" in r.metadata]
         assert len(log_ids) == len(set(log_ids))  # All unique
     
+    @pytest.mark.asyncio
+    async def test_entries_written_in_background(self, logger, config):
+        """Test that queued entries reach disk by aclose and the writer restarts."""
+        results = [
+            await logger.log_research_goal(f"Queued goal {i}", {"index": i})
+            for i in range(20)
+        ]
+        await logger.aclose()
+        
+        written = {
+            json.loads(path.read_text())["id"]
+            for path in config.log_directory.glob("*.json")
+        }
+        assert written == {r.metadata["log_id"] for r in results}
+        
+        # Logging after aclose starts a new writer
+        await logger.log_hypothesis({"content": "After close"})
+        await logger.aclose()
+        assert len(list(config.log_directory.glob("*.json"))) == 21
+
+    @pytest.mark.asyncio
+    async def test_failed_background_writes_are_reported(self, logger, config, caplog):
+        """Test that entries the writer thread cannot write are counted and logged."""
+        shutil.rmtree(config.log_directory)
+
+        with caplog.at_level("ERROR", logger="src.core.safety"):
+            await logger.log_research_goal("Unwritable goal", {})
+            await logger.flush()
+
+        assert logger.failed_writes == 1
+        assert "Failed to write safety log entry" in caplog.text
+        await logger.aclose()
+
+    @pytest.mark.asyncio
+    async def test_full_write_queue_does_not_block(self, logger, config, monkeypatch):
+        """Test that entries beyond a full write queue are written directly."""
+        import logging.handlers
+        import threading
+
+        release = threading.Event()
+        dequeue = logging.handlers.QueueListener.dequeue
+
+        def held_dequeue(listener, block):
+            # Keep the writer thread off the queue until every entry is logged
+            release.wait(timeout=5)
+            return dequeue(listener, block)
+
+        monkeypatch.setattr(logger, "WRITE_QUEUE_SIZE", 1)
+        monkeypatch.setattr(logging.handlers.QueueListener, "dequeue", held_dequeue)
+
+        results = [
+            await logger.log_research_goal(f"Goal {i}", {"index": i})
+            for i in range(4)
+        ]
+        assert logger.overflow_writes == 3
+        release.set()
+        await logger.aclose()
+
+        written = {
+            json.loads(path.read_text())["id"]
+            for path in config.log_directory.glob("*.json")
+        }
+        assert written == {r.metadata["log_id"] for r in results}
+
+    @pytest.mark.asyncio
+    async def test_logging_refused_while_closing(self, logger, config):
+        """Test that entries logged during aclose are refused, not lost."""
+        await logger.log_research_goal("Before close", {})
+        closing = asyncio.create_task(logger.aclose())
+        await asyncio.sleep(0)
+
+        with pytest.raises(RuntimeError, match="closing"):
+            await logger.log_research_goal("During close", {})
+
+        await closing
+        await logger.log_research_goal("After close", {})
+        await logger.aclose()
+        assert len(list(config.log_directory.glob("*.json"))) == 2
+
+    @pytest.mark.asyncio
+    async def test_unclosed_logger_is_collected(self, config):
+        """Test that a running writer does not keep its logger alive."""
+        import gc
+        import weakref
+
+        unclosed = SafetyLogger(config)
+        await unclosed.log_research_goal("Goal", {})
+        await unclosed.flush()
+        ref = weakref.ref(unclosed)
+
+        del unclosed
+        gc.collect()
+
+        assert ref() is None
+        assert len(list(config.log_directory.glob("*.json"))) == 1
+
+    @pytest.mark.asyncio
+    async def test_log_hypothesis_with_rich_metadata(self, logger):
+        """Test that UUIDs, datetimes and other objects in metadata are logged."""
+        hypothesis_id = uuid.uuid4()
+        created_at = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+        await logger.log_hypothesis({
+            "content": "Rich metadata hypothesis",
+            "hypothesis_id": hypothesis_id,
+            "created_at": created_at,
+            "source": Path("papers/ref.pdf"),
+        })
+        
+        trail = await logger.get_audit_trail(
+            datetime.now(timezone.utc) - timedelta(minutes=1),
+            datetime.now(timezone.utc) + timedelta(minutes=1)
+        )
+        assert len(trail) == 1
+        assert trail[0].metadata["hypothesis_id"] == str(hypothesis_id)
+        assert trail[0].metadata["created_at"] == created_at.isoformat()
+        assert trail[0].metadata["source"] == "papers/ref.pdf"
+    
+    @pytest.mark.asyncio
+    async def test_report_skips_log_files_outside_period(self, logger, config):
+        """Test that log files dated before the period are not opened."""
+        await logger.log_research_goal("Recent goal", {"domain": "test"})
+        await logger.flush()
+        
+        old_day = (datetime.now(timezone.utc) - timedelta(days=10)).strftime('%Y%m%d')
+        old_file = config.log_directory / f"{old_day}_old.json"
+        old_file.write_text(json.dumps({
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "event_type": "goal_submission"
+        }))
+        undated_file = config.log_directory / "imported.json"
+        undated_file.write_text(json.dumps({
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "event_type": "hypothesis_generation"
+        }))
+        
+        candidates = set(logger._log_files_between(
+            datetime.now(timezone.utc) - timedelta(days=1)
+        ))
+        assert old_file not in candidates
+        assert undated_file in candidates
+        
+        report = await logger.generate_pattern_report("daily")
+        assert report.event_counts == {"goal_submission": 1, "hypothesis_generation": 1}
+    
+    @pytest.mark.asyncio
+    async def test_audit_trail_reuses_parsed_entries(self, logger, config, monkeypatch):
+        """Test that repeated audit queries parse each log file only once."""
+        context = {"domain": "test"}
+        await logger.log_research_goal("Goal 1", context)
+        await logger.log_research_goal("Goal 2", context)
+        # Changes after logging don't reach the written entries
+        context["domain"] = "changed"
+        
+        parsed = []
+        real_loads = orjson.loads
+        monkeypatch.setattr(orjson, "loads", lambda data: (parsed.append(1), real_loads(data))[1])
+        start = datetime.now(timezone.utc) - timedelta(minutes=1)
+        end = datetime.now(timezone.utc) + timedelta(minutes=1)
+        
+        first = await logger.get_audit_trail(start, end)
+        second = await logger.get_audit_trail(start, end)
+        assert [e.id for e in first] == [e.id for e in second]
+        assert len(first) == 2
+        assert len(parsed) == 2
+        assert all(e.metadata == {"domain": "test"} for e in first)
+    
     def test_is_safety_check_needed(self):
         """Test logic for determining if safety check is needed."""
         # Standard level should need checks
@@ -100,6 +100,17 @@ class TestSafetyMetricsCollector:
         avg_score = collector.get_average_safety_score()
         assert avg_score == pytest.approx(0.625, rel=1e-3)
     
+    def test_average_safety_score_restarts_after_reset(self, collector):
+        """Test that the running score total is cleared by reset_metrics."""
+        collector.record_safety_check("test", SafetyCheck(SafetyLevel.UNSAFE, 0.1, "Before"))
+        collector.reset_metrics()
+        assert collector.get_average_safety_score() == 1.0
+        
+        scores = [0.3, 0.7, 0.95]
+        for score in scores:
+            collector.record_safety_check("test", SafetyCheck(SafetyLevel.SAFE, score, "After"))
+        assert collector.get_average_safety_score() == sum(scores) / len(scores)
+    
     def test_get_metrics_summary(self, collector):
         """Test getting a metrics summary."""
         # Record some checks and alerts
@@ -240,7 +251,22 @@ class TestSafetyMetricsCollector:
         
         # Should include checks from minutes 30-60 (4 checks)
         assert metrics["total_checks_in_range"] == 4
-    
+
+    def test_get_metrics_by_time_range_after_clock_change(self, collector):
+        """Test time range queries when the clock moved backwards between records."""
+        base_time = datetime.now(timezone.utc)
+
+        with patch('src.core.safety.datetime') as mock_datetime:
+            for minutes in (0, 40, 10, 50, 20):
+                mock_datetime.now.return_value = base_time + timedelta(minutes=minutes)
+                collector.record_safety_check("test", SafetyCheck(SafetyLevel.SAFE, 0.9, "Check"))
+
+        metrics = collector.get_metrics_by_time_range(
+            base_time + timedelta(minutes=5), base_time + timedelta(minutes=45)
+        )
+
+        assert metrics["total_checks_in_range"] == 3
+
     def test_alert_thresholds(self, collector):
         """Test automatic alerts based on thresholds."""
         # Configure alert thresholds
@@ -4,6 +4,7 @@ from unittest.mock import Mock, AsyncMock, patch
 import asyncio
 from datetime import datetime, timedelta
 from typing import Dict, List
+import itertools
 import uuid
 
 from src.core.models import Task, TaskState, TaskType, Hypothesis, utcnow
@@ -13,6 +14,14 @@ from src.llm.base import LLMProvider
 from src.agents.supervisor import SupervisorAgent
 
 
+_id_counter = itertools.count(1)
+
+
+def _test_id() -> uuid.UUID:
+    """Return a deterministic, unique UUID for test objects."""
+    return uuid.UUID(int=next(_id_counter))
+
+
 class TestSupervisorAgentInitialization:
     """Test SupervisorAgent initialization and configuration."""
     
@@ -138,7 +147,7 @@ class TestTaskDistribution:
         
         # Mock the enqueue method to return the task
         supervisor.task_queue.enqueue.return_value = Task(
-            id=uuid.uuid4(),
+            id=_test_id(),
             task_type=TaskType.GENERATE_HYPOTHESIS,
             priority=3,
             payload=task_params['parameters'],
@@ -191,7 +200,7 @@ class TestTaskDistribution:
         
         # Mock task creation
         mock_task = Task(
-            id=uuid.uuid4(),
+            id=_test_id(),
             task_type=TaskType.GENERATE_HYPOTHESIS,
             priority=2,
             payload={},
@@ -220,7 +229,7 @@ class TestTaskDistribution:
         
         # Mock the enqueue to return a task
         expected_task = Task(
-            id=uuid.uuid4(),
+            id=_test_id(),
             task_type=TaskType.REFLECT_ON_HYPOTHESIS,
             priority=2,
             payload=task_params['parameters'],
@@ -288,7 +297,7 @@ class TestResourceAllocation:
     @pytest.mark.asyncio
     async def test_reclaim_resources_on_completion(self, supervisor_with_resources):
         """Test resources are reclaimed when task completes."""
-        task_id = str(uuid.uuid4())
+        task_id = str(_test_id())
         allocated_resources = {
             'compute_budget': 50.0,
             'memory_mb': 256
@@ -369,14 +378,16 @@ class TestProgressMonitoring:
         }
         
         # Mock context memory data
-        supervisor.context_memory.get.side_effect = lambda key: {
+        supervisor.context_memory.batch_get.return_value = {
             'hypotheses': [{'id': f'hyp-{i}', 'state': 'reviewed'} for i in range(50)],
             'reviews': [{'id': f'rev-{i}'} for i in range(40)],
             'tournament_results': {'progress': 0.6}
-        }.get(key, {})
+        }
         
         metrics = await supervisor.calculate_system_metrics()
         
+        supervisor.context_memory.batch_get.assert_awaited_once()
+        
         assert metrics['hypothesis_count'] == 50
         assert metrics['review_count'] == 40
         assert metrics['tournament_progress'] == 0.6
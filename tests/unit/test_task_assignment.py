@@ -53,7 +53,7 @@ class TestTaskAssignment:
         assert assignment.task.id == task.id
         
         # Worker-1 should be marked as active with task
-        status = await queue.get_worker_status("worker-1")
+        status = queue.get_worker_status("worker-1")
         assert status["state"] == "active"
         assert status["assigned_task"] == str(task.id)
     
@@ -82,6 +82,23 @@ class TestTaskAssignment:
         # Task should still be pending
         assert queue.get_task_state(task.id) == TaskState.PENDING
     
+    async def test_capability_matching_skips_unhandled_task_types(self, queue):
+        """Test a worker is matched past tasks it cannot handle."""
+        await queue.register_worker("worker-1", {
+            "agent_types": ["Reflection", "Unknown"]
+        })
+        await queue.enable_capability_matching()
+        
+        generate = Task(task_type=TaskType.GENERATE_HYPOTHESIS, priority=3, payload={})
+        reflect = Task(task_type=TaskType.REFLECT_ON_HYPOTHESIS, priority=1, payload={})
+        await queue.enqueue(generate)
+        await queue.enqueue(reflect)
+        
+        assignment = await queue.dequeue("worker-1")
+        assert assignment.task.id == reflect.id
+        assert await queue.dequeue("worker-1") is None
+        assert queue.get_task_state(generate.id) == TaskState.PENDING
+    
     async def test_task_acknowledgment_required(self, queue):
         """Test task requires acknowledgment within timeout."""
         # Register worker
@@ -266,7 +283,7 @@ class TestTaskAssignment:
         assert queue.get_task_state(task.id) == TaskState.COMPLETED
         
         # Worker should be idle again
-        status = await queue.get_worker_status("worker-1")
+        status = queue.get_worker_status("worker-1")
         assert status["state"] == "idle"
         assert status["assigned_task"] is None
     
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from enum import Enum
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pytest
 from pydantic import ValidationError
@@ -185,6 +185,36 @@ class TestTaskModel:
         assert task2.priority == task.priority
         assert task2.state == task.state
     
+    def test_task_ids_are_unique_v4_uuids(self):
+        """Test generated task IDs are distinct random (version 4) UUIDs."""
+        tasks = [
+            Task(task_type=TaskType.GENERATE_HYPOTHESIS, priority=1, payload={})
+            for _ in range(1000)
+        ]
+        
+        assert len({task.id for task in tasks}) == 1000
+        assert all(task.id.version == 4 for task in tasks)
+    
+    def test_task_id_str(self):
+        """Test the cached string form of the task ID."""
+        task = Task(
+            task_type=TaskType.GENERATE_HYPOTHESIS,
+            priority=1,
+            payload={"goal": "Test"}
+        )
+        
+        assert task.id_str == str(task.id)
+        assert task.id_str is task.id_str
+        assert "id_str" not in task.model_dump()
+        
+        # A replaced ID is never served from the old cache
+        copy = task.model_copy(update={"id": uuid4()})
+        assert copy.id_str == str(copy.id)
+        assert task.id_str == str(task.id)
+        
+        task.id = uuid4()
+        assert task.id_str == str(task.id)
+    
     def test_task_json_serialization(self):
         """Test task JSON serialization."""
         task = Task(
@@ -1,7 +1,7 @@
 """Tests for TaskQueue class."""
 
 import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 import pytest
@@ -233,6 +233,236 @@ class TestTaskQueueBasicOperations:
         assignment = await queue.dequeue("worker-1")
         assert assignment.task.id == sample_task.id
 
+    async def test_enqueue_many(self, queue):
+        """Test enqueueing several tasks in one call."""
+        tasks = [
+            Task(task_type=TaskType.GENERATE_HYPOTHESIS, priority=priority, payload={})
+            for priority in (1, 2, 3, 2)
+        ]
+
+        task_ids = await queue.enqueue_many(tasks)
+
+        assert task_ids == [str(task.id) for task in tasks]
+        assert queue.size() == 4
+        assert queue.size_by_priority("medium") == 2
+        assert all(queue.get_task_state(task_id) == TaskState.PENDING for task_id in task_ids)
+
+    async def test_enqueue_many_respects_quotas(self):
+        """Test that enqueue_many applies the same quota rules as enqueue."""
+        queue = TaskQueue(QueueConfig(
+            max_queue_size=10,
+            priority_quotas={"high": 2, "medium": 4, "low": 4}
+        ))
+        tasks = [
+            Task(task_type=TaskType.GENERATE_HYPOTHESIS, priority=1, payload={"n": i})
+            for i in range(5)
+        ]
+
+        with pytest.raises(RuntimeError, match="low priority"):
+            await queue.enqueue_many(tasks)
+
+        # Tasks ahead of the rejected one remain queued
+        assert queue.size() == 4
+
+    async def test_enqueue_many_rejects_unknown_priority_up_front(self, queue):
+        """Test that an unknown priority anywhere in the batch enqueues nothing."""
+        tasks = [
+            Task(task_type=TaskType.GENERATE_HYPOTHESIS, priority=priority, payload={})
+            for priority in (1, 2, 4)
+        ]
+
+        with pytest.raises(ValueError, match="Invalid priority: 4"):
+            await queue.enqueue_many(tasks)
+
+        assert queue.size() == 0
+        assert all(queue.get_task_state(str(task.id)) is None for task in tasks)
+
+    async def test_dequeue_batch_matches_dequeue_order(self, queue):
+        """Test batch dequeue returns tasks in priority order up to the limit."""
+        tasks = [
+            Task(task_type=TaskType.GENERATE_HYPOTHESIS, priority=priority, payload={})
+            for priority in (1, 3, 2, 3)
+        ]
+        await queue.enqueue_many(tasks)
+
+        assignments = await queue.dequeue_batch("worker-1", max_items=3)
+
+        assert [a.task.id for a in assignments] == [tasks[1].id, tasks[3].id, tasks[2].id]
+        assert all(a.task.assigned_to == "worker-1" for a in assignments)
+        assert queue.size() == 1
+
+    async def test_boosted_task_overtakes_higher_priority(self):
+        """Test a starved low priority task is served ahead of fresh high priority work."""
+        now = [datetime.now(timezone.utc)]
+        queue = TaskQueue(QueueConfig(time_source=lambda: now[0]))
+        low = await queue.enqueue(
+            Task(task_type=TaskType.GENERATE_HYPOTHESIS, priority=1, payload={})
+        )
+        now[0] += timedelta(minutes=25)
+        high = await queue.enqueue(
+            Task(task_type=TaskType.GENERATE_HYPOTHESIS, priority=3, payload={})
+        )
+
+        assignments = await queue.dequeue_batch("worker-1", max_items=2)
+
+        assert [a.task.id_str for a in assignments] == [low, high]
+
+    async def test_selection_keeps_order_with_deep_bands(self):
+        """Test boosted selection over long bands matches priority then FIFO order."""
+        now = [datetime.now(timezone.utc)]
+        queue = TaskQueue(QueueConfig(time_source=lambda: now[0]))
+        starved = await queue.enqueue(
+            Task(task_type=TaskType.GENERATE_HYPOTHESIS, priority=1, payload={})
+        )
+        now[0] += timedelta(minutes=25)
+        fresh_low = await queue.enqueue_many([
+            Task(task_type=TaskType.GENERATE_HYPOTHESIS, priority=1, payload={})
+            for _ in range(50)
+        ])
+        high = await queue.enqueue_many([
+            Task(task_type=TaskType.GENERATE_HYPOTHESIS, priority=3, payload={})
+            for _ in range(50)
+        ])
+
+        assignments = await queue.dequeue_batch("worker-1", max_items=3)
+
+        assert [a.task.id_str for a in assignments] == [starved, high[0], high[1]]
+        assert queue._queues[1][0] == fresh_low[0]
+
+    async def test_aging_only_visits_due_tasks(self):
+        """Test boost aging skips tasks whose next interval has not elapsed."""
+        now = [datetime.now(timezone.utc)]
+        queue = TaskQueue(QueueConfig(time_source=lambda: now[0]))
+        await queue.enqueue_many([
+            Task(task_type=TaskType.GENERATE_HYPOTHESIS, priority=2, payload={})
+            for _ in range(3)
+        ])
+        aging_heap = list(queue._aging_heap)
+
+        assert queue._apply_priority_boosts() is False
+        assert queue._aging_heap == aging_heap
+
+        now[0] += timedelta(seconds=queue.config.priority_boost_interval)
+        assert queue._apply_priority_boosts() is True
+        assert len(queue._aging_heap) == 3
+        assert all(due > now[0] for due, _ in queue._aging_heap)
+
+    async def test_dequeue_batch_honors_max_concurrent(self, queue):
+        """Test that a worker's max_concurrent capability caps the batch."""
+        await queue.register_worker("worker-1", {"agent_types": ["Generation"], "max_concurrent": 2})
+        await queue.enqueue_many([
+            Task(task_type=TaskType.GENERATE_HYPOTHESIS, priority=2, payload={})
+            for _ in range(5)
+        ])
+
+        assignments = await queue.dequeue_batch("worker-1", max_items=4)
+
+        assert len(assignments) == 2
+
+    async def test_complete_tasks_batch(self, queue):
+        """Test completing several assignments at once."""
+        await queue.register_worker("worker-1", {"agent_types": ["Generation"]})
+        await queue.enqueue_many([
+            Task(task_type=TaskType.GENERATE_HYPOTHESIS, priority=2, payload={})
+            for _ in range(3)
+        ])
+        assignments = await queue.dequeue_batch("worker-1", max_items=3)
+
+        # Worker stays active while assignments are outstanding
+        await queue.complete_task("worker-1", str(assignments[0].task.id), {})
+        status = queue.get_worker_status("worker-1")
+        assert status["state"] == "active"
+
+        completed = await queue.complete_tasks("worker-1", [
+            (str(a.task.id), {"done": True}) for a in assignments[1:]
+        ] + [("unknown-task", {})])
+
+        assert completed == [True, True, False]
+        assert all(queue.get_task_state(a.task.id) == TaskState.COMPLETED for a in assignments)
+        status = queue.get_worker_status("worker-1")
+        assert status["state"] == "idle"
+
+    async def test_dead_worker_requeues_whole_batch(self, queue):
+        """Test that failing a worker requeues every task from its batch."""
+        await queue.register_worker("worker-1", {"agent_types": ["Generation"]})
+        await queue.enqueue_many([
+            Task(task_type=TaskType.GENERATE_HYPOTHESIS, priority=2, payload={})
+            for _ in range(4)
+        ])
+        assignments = await queue.dequeue_batch("worker-1", max_items=4)
+
+        # Worker stays active while other assignments are outstanding
+        await queue.fail_task("worker-1", str(assignments[0].task.id), {"retryable": False})
+        assert queue.get_worker_status("worker-1")["state"] == "active"
+
+        queue._worker_info["worker-1"].last_heartbeat -= timedelta(
+            seconds=queue.config.heartbeat_timeout + 1
+        )
+        await queue.process_dead_workers()
+
+        assert queue.get_task_state(assignments[0].task.id) == TaskState.FAILED
+        assert all(
+            queue.get_task_state(a.task.id) == TaskState.PENDING for a in assignments[1:]
+        )
+        assert queue.size() == 3
+        assert not queue._active_assignments
+        assert queue.get_worker_status("worker-1")["state"] == "failed"
+
+    async def test_dead_worker_keeps_completed_batch_tasks(self, queue):
+        """Test that failing a worker doesn't requeue a task it already completed."""
+        await queue.register_worker("worker-1", {"agent_types": ["Generation"]})
+        await queue.enqueue_many([
+            Task(task_type=TaskType.GENERATE_HYPOTHESIS, priority=2, payload={})
+            for _ in range(2)
+        ])
+        first, last = await queue.dequeue_batch("worker-1", max_items=2)
+
+        await queue.complete_task("worker-1", last.task.id_str, {})
+        assert queue.get_worker_status("worker-1")["assigned_task"] == first.task.id_str
+
+        async with queue._lock:
+            queue._fail_worker("worker-1")
+
+        assert queue.get_task_state(last.task.id) == TaskState.COMPLETED
+        assert queue.get_task_state(first.task.id) == TaskState.PENDING
+        assert queue.size() == 1
+
+    async def test_hot_path_does_not_take_lock(self, queue, sample_task):
+        """Test enqueue, dequeue and complete run without acquiring the queue lock."""
+        async with queue._lock:
+            await asyncio.wait_for(queue.enqueue(sample_task), timeout=1)
+            assignment = await asyncio.wait_for(queue.dequeue("worker-1"), timeout=1)
+            completed = await asyncio.wait_for(
+                queue.complete_task("worker-1", str(assignment.task.id), {}),
+                timeout=1
+            )
+
+        assert completed is True
+
+    async def test_purge_empties_queue_and_keeps_workers(self, queue, sample_task):
+        """Test purge drops all tasks and idles registered workers."""
+        await queue.register_worker("worker-1", {"agent_types": ["Generation"]})
+        await queue.enqueue(sample_task)
+        await queue.enqueue(Task(
+            task_type=TaskType.GENERATE_HYPOTHESIS,
+            priority=3,
+            payload={"goal": "second task"}
+        ))
+        await queue.dequeue("worker-1")
+
+        await queue.purge()
+
+        assert queue.size() == 0
+        assert queue.get_task_state(sample_task.id) is None
+        assert queue.is_worker_registered("worker-1")
+        status = queue.get_worker_status("worker-1")
+        assert status["state"] == "idle"
+        assert status["assigned_task"] is None
+
+        # Queue is usable again after a purge
+        await queue.enqueue(sample_task)
+        assert queue.size() == 1
+
 
 class TestTaskQueueWorkerManagement:
     """Tests for TaskQueue worker management functionality."""
@@ -305,7 +535,7 @@ class TestTaskQueueWorkerManagement:
         await queue.register_worker(worker_id, capabilities)
         
         # Get status
-        status = await queue.get_worker_status(worker_id)
+        status = queue.get_worker_status(worker_id)
         assert status is not None
         assert status["id"] == worker_id
         assert status["state"] == "idle"
@@ -315,7 +545,7 @@ class TestTaskQueueWorkerManagement:
     
     async def test_get_nonexistent_worker_status(self, queue):
         """Test getting status of nonexistent worker."""
-        status = await queue.get_worker_status("nonexistent-worker")
+        status = queue.get_worker_status("nonexistent-worker")
         assert status == {"error": "Worker not found"}
     
     async def test_list_workers_by_state(self, queue):
@@ -373,7 +603,7 @@ class TestTaskQueueWorkerManagement:
         await queue.enqueue(task)
         
         # Worker should be idle before assignment
-        status_before = await queue.get_worker_status(worker_id)
+        status_before = queue.get_worker_status(worker_id)
         assert status_before["state"] == "idle"
         
         # Dequeue task (assigns to worker)
@@ -381,6 +611,6 @@ class TestTaskQueueWorkerManagement:
         assert assignment is not None
         
         # Worker should now be active
-        status_after = await queue.get_worker_status(worker_id)
+        status_after = queue.get_worker_status(worker_id)
         assert status_after["state"] == "active"
         assert status_after["assigned_task"] == str(task.id)
\ No newline at end of file
@@ -233,7 +233,7 @@ class TestTaskQueueStateManagement:
         await queue.import_state(state)
         
         # Verify statistics
-        stats = await queue.get_queue_statistics()
+        stats = queue.get_queue_statistics()
         assert stats["task_states"]["pending"] == 1
         assert stats["task_states"]["completed"] == 1
         assert stats["task_states"]["failed"] == 1
@@ -283,8 +283,8 @@ class TestTaskQueueStateManagement:
         await queue2.import_state(exported_state)
         
         # Compare statistics
-        stats1 = await queue1.get_queue_statistics()
-        stats2 = await queue2.get_queue_statistics()
+        stats1 = queue1.get_queue_statistics()
+        stats2 = queue2.get_queue_statistics()
         
         assert stats1["task_states"]["completed"] == stats2["task_states"]["completed"]
         assert stats1["task_states"]["failed"] == stats2["task_states"]["failed"]
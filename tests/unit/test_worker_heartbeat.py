@@ -36,7 +36,7 @@ class TestWorkerHeartbeat:
         await task_queue.register_worker(worker_id, {"agent_types": ["Generation"]})
         
         # Get initial heartbeat time
-        initial_status = await task_queue.get_worker_status(worker_id)
+        initial_status = task_queue.get_worker_status(worker_id)
         initial_heartbeat = initial_status["last_heartbeat"]
         
         # Wait a moment
@@ -47,7 +47,7 @@ class TestWorkerHeartbeat:
         assert success is True
         
         # Check heartbeat was updated
-        updated_status = await task_queue.get_worker_status(worker_id)
+        updated_status = task_queue.get_worker_status(worker_id)
         assert updated_status["last_heartbeat"] > initial_heartbeat
     
     async def test_heartbeat_fails_for_unregistered_worker(self, task_queue):
@@ -135,7 +135,7 @@ class TestWorkerHeartbeat:
         await task_queue.process_dead_workers()
         
         # Verify worker is marked as failed
-        status = await task_queue.get_worker_status(worker_id)
+        status = task_queue.get_worker_status(worker_id)
         assert status["state"] == "failed"
         
         # Verify task is back in queue
@@ -155,22 +155,73 @@ class TestWorkerHeartbeat:
         # Let it run for a bit
         await asyncio.sleep(0.1)
         
-        # Manually set worker's heartbeat to be old
+        # Manually set worker's heartbeat to be old and re-arm its timer, as
+        # the heartbeat paths do
         async with task_queue._lock:
             old_time = datetime.now(timezone.utc) - timedelta(seconds=90)
             task_queue._worker_info[worker_id].last_heartbeat = old_time
+            task_queue._arm_heartbeat_timer(worker_id)
         
-        # Wait for next monitoring cycle
-        await asyncio.sleep(task_queue.config.heartbeat_check_interval + 0.1)
+        # The timer is already past its deadline
+        await asyncio.sleep(0.1)
         
         # Check worker was marked as failed
-        status = await task_queue.get_worker_status(worker_id)
+        status = task_queue.get_worker_status(worker_id)
         assert status["state"] == "failed"
         
         # Stop monitoring
         task_queue.stop_monitoring()
         await monitor_task
     
+    async def test_imported_state_rearms_heartbeat_timers(self, task_queue):
+        """Test that importing stale heartbeats fails workers without a sweep."""
+        worker_id = "worker1"
+        await task_queue.register_worker(worker_id, {"agent_types": ["Generation"]})
+        state = await task_queue.export_state()
+        state["workers"][worker_id]["last_heartbeat"] = (
+            datetime.now(timezone.utc) - timedelta(seconds=90)
+        ).isoformat()
+        
+        with patch.object(task_queue, "process_dead_workers") as sweep:
+            monitor_task = asyncio.create_task(task_queue.monitor_heartbeats())
+            await asyncio.sleep(0.1)
+            await task_queue.import_state(state)
+            await asyncio.sleep(0.1)
+            
+            assert task_queue.get_worker_status(worker_id)["state"] == "failed"
+            sweep.assert_not_called()
+        
+        task_queue.stop_monitoring()
+        await asyncio.wait_for(monitor_task, timeout=1)
+    
+    async def test_heartbeat_timer_detects_timeout(self):
+        """Test that timeouts fire at the deadline, not on the next sweep."""
+        queue = TaskQueue(config=QueueConfig(
+            heartbeat_timeout=0.2,
+            heartbeat_check_interval=60
+        ))
+        worker_id = "worker1"
+        await queue.register_worker(worker_id, {"agent_types": ["Generation"]})
+        
+        monitor_task = asyncio.create_task(queue.monitor_heartbeats())
+        await asyncio.sleep(0.1)
+        await queue.heartbeat(worker_id)
+        assert worker_id in queue._hb_timers
+        
+        await asyncio.sleep(0.15)
+        assert queue._worker_info[worker_id].state == "idle"
+        
+        await asyncio.sleep(0.15)
+        assert queue._worker_info[worker_id].state == "failed"
+        
+        queue.stop_monitoring()
+        assert not queue._hb_timers
+        monitor_task.cancel()
+        try:
+            await monitor_task
+        except asyncio.CancelledError:
+            pass
+    
     async def test_worker_recovery_after_heartbeat(self, task_queue):
         """Test that a failed worker can recover by sending heartbeats."""
         # Register and mark worker as failed
@@ -185,7 +236,7 @@ class TestWorkerHeartbeat:
         assert success is True
         
         # Check worker is back to idle
-        status = await task_queue.get_worker_status(worker_id)
+        status = task_queue.get_worker_status(worker_id)
         assert status["state"] == "idle"
     
     async def test_heartbeat_metrics(self, task_queue):
@@ -245,7 +296,7 @@ class TestWorkerHeartbeat:
         
         # All should have recent heartbeats
         for worker_id in worker_ids:
-            status = await task_queue.get_worker_status(worker_id)
+            status = task_queue.get_worker_status(worker_id)
             if isinstance(status["last_heartbeat"], str):
                 last_heartbeat = datetime.fromisoformat(status["last_heartbeat"])
             else: